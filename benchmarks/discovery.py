@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of suites discovery on synthetic tree of modules.
+
+Usage:
+
+    python benchmarks/discovery.py [--modules 10000] [--depth 4] [--import] [--workers 4]
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+from optparse import OptionParser
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+SUITE_MODULE = """from noseapp import Suite
+
+suite = Suite(__name__)
+"""
+
+
+def make_tree(root, modules, depth, modules_per_package=10):
+    """
+    Create packages with suite modules.
+    Packages are nested by chains with length of depth.
+    """
+    count = 0
+    chain = 0
+
+    while count < modules:
+        path = root
+
+        for level in range(depth):
+            path = os.path.join(path, 'pkg_{}_{}'.format(chain, level))
+            os.mkdir(path)
+            open(os.path.join(path, '__init__.py'), 'w').close()
+
+            for i in range(modules_per_package):
+                with open(os.path.join(path, 'suite_{}.py'.format(i)), 'w') as fp:
+                    fp.write(SUITE_MODULE)
+
+            count += modules_per_package
+
+        chain += 1
+
+    return count
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('--modules', dest='modules', type=int, default=10000)
+    parser.add_option('--depth', dest='depth', type=int, default=4)
+    parser.add_option('--import', dest='import_modules', action='store_true', default=False)
+    parser.add_option('--workers', dest='workers', type=int, default=None)
+    options, _ = parser.parse_args()
+
+    from noseapp.core import loader
+
+    root = tempfile.mkdtemp()
+
+    try:
+        count = make_tree(root, options.modules, options.depth)
+        sys.path.append(root)
+
+        start = time.time()
+        modules = loader.find_modules(root)
+        print('find_modules: {} modules, {:.3f}s'.format(len(modules), time.time() - start))
+
+        assert len(modules) == count
+
+        if options.import_modules:
+            start = time.time()
+            suites = loader.load_suites_from_modules(modules, workers=options.workers)
+            print('load_suites_from_modules: {} suites, {:.3f}s'.format(len(suites), time.time() - start))
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
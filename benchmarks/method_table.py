@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of method tables of test case classes on application
+with synthetic suites. Scans of dir which were made before method
+tables are measured as baseline.
+
+Usage:
+
+    python benchmarks/method_table.py [--cases 20000] [--suites 200] [--methods 3]
+"""
+
+import os
+import sys
+import time
+from optparse import OptionParser
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_suites(suites, cases, methods):
+    from noseapp import Suite
+
+    result = []
+
+    for suite_index in range(suites):
+        suite = Suite('bench_{}'.format(suite_index))
+
+        for case_index in range(cases // suites):
+            attributes = dict(
+                ('test_{}'.format(i), lambda self: None) for i in range(methods)
+            )
+            suite.register(type('Case{}'.format(case_index), (suite.TestCase, ), attributes))
+
+        result.append(suite)
+
+    return result
+
+
+def scan_test_names(cls):
+    from noseapp.core import loader
+
+    return [
+        name for name in dir(cls)
+        if name.startswith(loader.TEST_NAME_PREFIX) or name == loader.DEFAULT_TEST_NAME
+    ]
+
+
+def measure(name, func, repeat):
+    start = time.time()
+
+    for _ in range(repeat):
+        result = func()
+
+    # Application captures sys.stdout
+    sys.__stdout__.write('{}: {:.3f}s\n'.format(name, (time.time() - start) / repeat))
+
+    return result
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option('--cases', dest='cases', type=int, default=20000)
+    parser.add_option('--suites', dest='suites', type=int, default=200)
+    parser.add_option('--methods', dest='methods', type=int, default=3)
+    parser.add_option('--repeat', dest='repeat', type=int, default=3)
+    options, _ = parser.parse_args()
+
+    from noseapp import NoseApp
+    from noseapp.core import loader
+
+    suites = measure(
+        'register {} cases'.format(options.cases),
+        lambda: make_suites(options.suites, options.cases, options.methods),
+        1,
+    )
+    cases = [case for suite in suites for case in suite.test_cases]
+
+    measure(
+        'test names, dir scan',
+        lambda: [scan_test_names(case) for case in cases],
+        options.repeat,
+    )
+    measure(
+        'test names, method table',
+        lambda: [loader.load_test_names_from_test_case(case) for case in cases],
+        options.repeat,
+    )
+    measure(
+        'get_map, dir scan',
+        lambda: [
+            dict((case.__name__, [getattr(case, n) for n in scan_test_names(case)]) for case in suite.test_cases)
+            for suite in suites
+        ],
+        options.repeat,
+    )
+    measure(
+        'get_map, method table',
+        lambda: [suite.get_map() for suite in suites],
+        options.repeat,
+    )
+
+    # Options of benchmark must not be parsed by application
+    sys.argv = sys.argv[:1]
+
+    app = NoseApp('bench', exit=False)
+    app.register_suites(suites)
+
+    measure('build suites', lambda: app._NoseApp__test_program.data.build_suite(), 1)
+
+
+if __name__ == '__main__':
+    main()
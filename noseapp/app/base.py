@@ -387,17 +387,35 @@ class NoseApp(object):
         return func
 
     @staticmethod
-    def shared_extension(name=None, cls=None, args=None, kwargs=None):
+    def shared_extension(name=None, cls=None, args=None, kwargs=None,
+                         scope=None, teardown=None, pool_size=None, warm=False):
         """
         Shared extension to Suite and TestCase instances.
         Use require param on noseapp.Suite class for connect.
 
+        Instance is created for each consumer at first access by default.
+        Instance of extension with scope is created at first access
+        and shared by consumers of scope: session, process, suite or case.
+        Teardown hook takes instance at end of scope.
+
+        Pooled extension keeps up to pool_size instances in each process.
+        Test checks out instance for duration of test, other tests wait
+        while all instances are checked out.
+
+        Instances of warm extension are created on background threads
+        right after registration, ext method waits for instance which is not ready.
+        Extension of session or process scope and pooled extension can be warm.
+        Instances of process scope are warmed up by each process which runs tests.
+
         Example::
 
             import random
 
             app = NoseApp('my_app')
             app.shared_extension(name='random_int', cls=random.randint, args=(0, 100))
+            app.shared_extension(
+                name='db', cls=DBPool, scope='process', teardown=lambda pool: pool.close(),
+            )
 
         :param name: extension name
         :type name: str
@@ -411,6 +429,17 @@ class NoseApp(object):
         :param kwargs: cls init kwargs
         :type kwargs: dict
 
+        :param scope: see noseapp.core.constants.ExtensionScope
+        :type scope: str
+
+        :param teardown: callable object. Takes instance at end of scope.
+
+        :param pool_size: max number of instances in pool
+        :type pool_size: int
+
+        :param warm: create instances on background threads
+        :type warm: bool
+
         :raises: ValueError, AttributeError
         """
         if cls is None:
@@ -425,13 +454,18 @@ class NoseApp(object):
 
         logger.debug('Shared extension "%s"', name)
 
-        return extensions.set(name, cls, to_transport=True, args=args, kwargs=kwargs)
+        return extensions.set(
+            name, cls, to_transport=True, args=args, kwargs=kwargs,
+            scope=scope, teardown=teardown, pool_size=pool_size, warm=warm,
+        )
 
     @staticmethod
-    def shared_data(name, data):
+    def shared_data(name, data, frozen=False):
         """
         Shared data to Suite and TestCase instances.
-        Data will be copied during installation.
+        Data will be copied for each instance.
+        Frozen data is not copied, instances get read-only view of data.
+        Use copy_on_write or thaw method of view for change data.
 
         Example::
 
@@ -442,15 +476,18 @@ class NoseApp(object):
             }
             app = NoseApp('my_app')
             add.shared_data('data', data)
+            add.shared_data('catalogue', load_catalogue(), frozen=True)
 
         :param name: extension name
         :type name: str
 
         :param data: any object
+        :param frozen: share read-only view of data
+        :type frozen: bool
         """
         logger.debug('Shared data "%s"', name)
 
-        return extensions.set(name, data, to_transport=False)
+        return extensions.set(name, data, to_transport=False, frozen=frozen)
 
     def register_suite(self, suite):
         """
@@ -475,6 +512,10 @@ class NoseApp(object):
         """
         Auto load suites. Path can be package or simple dir.
 
+        If --discovery-cache option is used then names of suites
+        will be saved for each module. Modules without suite
+        from -t option will not be imported at next run.
+
         :param path: path to suites dir
         :type path: str
 
@@ -488,10 +529,31 @@ class NoseApp(object):
         if path not in sys.path:
             sys.path.append(path)
 
+        cache = None
+        workers = None
+        suite_filter = None
+
+        # Options are not available for sub application before creation of master
+        if self.__options is not None and self.__options.get('discovery_cache'):
+            cache = loader.DiscoveryCache(self.__options.discovery_cache)
+
+            if not self.__options.ls:
+                suite_filter = loader.get_suite_filter(self.__name, self.__options.run_test)
+
+        if self.__options is not None:
+            workers = self.__options.get('discovery_workers')
+
         if recursive:
-            suites = loader.load_suites_from_path(path)
+            suites = loader.load_suites_from_path(
+                path, cache=cache, suite_filter=suite_filter, workers=workers,
+            )
         else:
-            suites = loader.load_suites_from_dir(path)
+            suites = loader.load_suites_from_dir(
+                path, cache=cache, suite_filter=suite_filter, workers=workers,
+            )
+
+        if cache is not None:
+            cache.save()
 
         self.register_suites(suites)
 
@@ -512,7 +574,7 @@ class NoseApp(object):
 
         output.tree(self.suites, show_docs=show_docs, doc_lines=doc_lines, exit=False)
 
-    def run(self):
+    def run(self, run_strategy=None):
         """
         To perform run suites.
         If was success after run and not exit param is False then return True.
@@ -521,6 +583,7 @@ class NoseApp(object):
 
             noseapp-manage run project.app:create_app
 
+        :param run_strategy: run strategy instead of --run-strategy option
         :rtype: bool
         :raises: RuntimeError
         """
@@ -539,7 +602,7 @@ class NoseApp(object):
                 app_callback(self, 'tearDownApp')
 
         with teardown_app():
-            success = self.__test_program.run()
+            success = self.__test_program.run(run_strategy=run_strategy)
 
         return success
 
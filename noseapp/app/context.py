@@ -4,6 +4,8 @@
 Work with context of application
 """
 
+from warnings import warn
+
 from noseapp.plugins.base import AppPlugin
 
 
@@ -97,9 +99,8 @@ def merge_context(
     for sub_app in master_app.sub_apps:
         # suites
         if merge_suites:
-            master_app.context.suites.extend(
-                sub_app.suites,
-            )
+            for suite in sub_app.suites:
+                master_app.context.add_suite(suite)
 
         # setup callbacks
         if merge_setup:
@@ -131,6 +132,8 @@ class AppContext(object):
     def __init__(self):
         # Suites instances
         self.__suites = []
+        # Suite name -> suite instance
+        self.__suite_index = {}
         # Plugins instances
         self.__plugins = []
 
@@ -147,6 +150,16 @@ class AppContext(object):
         """
         return self.__suites
 
+    @property
+    def suite_index(self):
+        """
+        Index of suites by full name.
+        If suite name is duplicated then first suite will be here.
+
+        :rtype: dict
+        """
+        return self.__suite_index
+
     @property
     def plugins(self):
         """
@@ -176,8 +189,27 @@ class AppContext(object):
         :param suite: suite instance
         :type suite: noseapp.suite.base.Suite
         """
+        if suite.name in self.__suite_index:
+            warn(
+                'Duplicate suite name "{}"! Please rename your suite!'.format(
+                    suite.name,
+                ),
+            )
+        else:
+            self.__suite_index[suite.name] = suite
+
         self.__suites.append(suite)
 
+    def get_suite(self, name):
+        """
+        Get suite by full name
+
+        :param name: suite name
+
+        :rtype: noseapp.suite.base.Suite or None
+        """
+        return self.__suite_index.get(name)
+
     def add_setup(self, func):
         """
         Add setup callback to setup callback storage
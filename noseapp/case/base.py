@@ -2,8 +2,10 @@
 
 from unittest import TestCase as _TestCase
 
+from six import with_metaclass
 from nose.case import Test as NoseTestWrapper
 
+from noseapp.core import loader
 from noseapp.case.context import TestCaseContext
 from noseapp.datastructures import ModifyDict as MountData
 
@@ -69,7 +71,29 @@ def get_case_master_id(case):
     return case._ToNoseAppTestCase__master_id
 
 
-class ToNoseAppTestCase(object):
+class TestCaseMeta(type):
+    """
+    Method table of test case class is dropped
+    when public attribute is added or deleted.
+    See noseapp.core.loader.MethodTable
+    """
+
+    def __setattr__(cls, name, value):
+        changed = not name.startswith('_') and not hasattr(cls, name)
+
+        super(TestCaseMeta, cls).__setattr__(name, value)
+
+        if changed:
+            loader.invalidate_method_table(cls)
+
+    def __delattr__(cls, name):
+        super(TestCaseMeta, cls).__delattr__(name)
+
+        if not name.startswith('_') and not hasattr(cls, name):
+            loader.invalidate_method_table(cls)
+
+
+class ToNoseAppTestCase(with_metaclass(TestCaseMeta, object)):
     """
     This is mixin for noseapp supporting.
     Class must be first in inheritance chain!
@@ -92,9 +116,6 @@ class ToNoseAppTestCase(object):
 
         self.__master_id = id(self)
 
-        if hasattr(self, 'REQUIRE'):
-            self.__mount_data__.context.update_by_require(self.REQUIRE)
-
     @classmethod
     def mount_to_suite(cls, suite):
         """
@@ -113,12 +134,19 @@ class ToNoseAppTestCase(object):
                 ),
             )
 
+        context = TestCaseContext(suite, case_name=cls.__name__)
+
+        # Instances are created when suite is running,
+        # extensions must be got while they are installed
+        if hasattr(cls, 'REQUIRE'):
+            context.update_by_require(cls.REQUIRE)
+
         setattr(
             cls,
             '__mount_data__',
             MountData(
                 of_suite=suite.name,
-                context=TestCaseContext(suite),
+                context=context,
             ),
         )
 
@@ -151,7 +179,7 @@ class ToNoseAppTestCase(object):
 
         :raises: noseapp.core.extensions.ExtensionNotRequired
         """
-        return self.__mount_data__.context.ext(name)
+        return self.__mount_data__.context.ext(name, case=self)
 
     def __str__(self):
         return '{} ({}:{})'.format(
@@ -8,11 +8,14 @@ class TestCaseContext(object):
     Context of test case instance
     """
 
-    def __init__(self, suite):
+    def __init__(self, suite, case_name=None):
         """
         :param suite: suite instance
         :type suite: noseapp.suite.base.Suite
+        :param case_name: name of test case class
         """
+        self.__suite_name = suite.name
+        self.__case_name = case_name
         self.__extensions = dict(
             (k, v) for k, v in suite.context.extensions.items()
         )
@@ -37,17 +40,21 @@ class TestCaseContext(object):
         self.__require.extend(require)
 
         for ext_name in require:
-            self.__extensions[ext_name] = extensions.get(ext_name)
+            self.__extensions[ext_name] = extensions.get(
+                ext_name, suite_name=self.__suite_name, case_name=self.__case_name,
+            )
 
-    def ext(self, name):
+    def ext(self, name, case=None):
         """
         Get extension by name
 
         :param name: extension name
+        :param case: test case instance which gets extension.
+        Instance of pooled extension is checked out for duration of test.
 
         :raises: core.extensions.ExtensionNotRequired
         """
         if name in self.__require:
-            return self.__extensions[name]
+            return extensions.resolve(self.__extensions[name], case=case)
 
         raise extensions.ExtensionNotRequired(name)
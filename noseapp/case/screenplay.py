@@ -12,7 +12,9 @@ from functools import wraps
 from six import with_metaclass
 
 from noseapp.utils import pyv
+from noseapp.core import loader
 from noseapp.case.base import TestCase
+from noseapp.case.base import TestCaseMeta
 
 
 logger = logging.getLogger(__name__)
@@ -95,6 +97,9 @@ def step(num, doc=''):
         setattr(f, WEIGHT_ATTRIBUTE_NAME, num)
         setattr(f, SCREENPLAY_ATTRIBUTE_NAME, '')
 
+        if pyv.is_async(f):
+            pyv.mark_async(f)
+
         @wraps(f)
         def wrapped(*args, **kwargs):
             return f(*args, **kwargs)
@@ -205,6 +210,21 @@ def run_step(case, method, flow=None):
     """
     Run step
 
+    :param case: TestCase instance
+    :param method: step method
+    :param flow: from FLOWS property
+    """
+    try:
+        return call_step(case, method, flow=flow)
+    except BaseException as e:
+        raise_step_error(case, method, e, flow=flow)
+
+
+def call_step(case, method, flow=None):
+    """
+    Call step method.
+    Returns awaitable object for async step.
+
     :param case: TestCase instance
     :param method: step method
     :param flow: from FLOWS property
@@ -219,46 +239,58 @@ def run_step(case, method, flow=None):
 
     logger.info(step_info)
 
-    try:
-        if flow is not None:
-            method(case, flow)
-        else:
-            method(case)
-    except BaseException as e:
-        if not case.ERROR_MESSAGE_TEMPLATE:
-            raise
-
-        orig_tb = traceback.format_exc()
-        history = u'\n'.join(case.__history)
-        exc_cls_name = e.__class__.__name__
-
-        if case.RENDER_ERROR_MESSAGE and pyv.IS_PYTHON_2:  # feature for python 2 only
-            msg = case.render_error_message(
-                history=unicode_string(history),
-                case=unicode_string(case_name),
-                method=unicode_string(method_name),
-                step=unicode_string(weight),
-                step_doc=unicode_string(doc),
-                flow=unicode_string(flow),
-                raised=unicode_string(exc_cls_name),
-                traceback=unicode_string(format_traceback(orig_tb)),
-                message=unicode_string(get_exception_message(e)),
-            )
-        else:
-            msg = '\n' + unicode_string(
-                format_traceback(
-                    orig_tb,
-                    step_info='<{case}.{method}(num={step}, doc={doc}, flow={flow})>'.format(
-                        case=unicode_string(case_name),
-                        method=unicode_string(method_name),
-                        step=unicode_string(weight),
-                        doc=unicode_string(doc),
-                        flow=unicode_string(flow),
-                    ),
+    if flow is not None:
+        return method(case, flow)
+
+    return method(case)
+
+
+def raise_step_error(case, method, e, flow=None):
+    """
+    Re raise exception of step with step info.
+    Must be called in except block.
+
+    :param case: TestCase instance
+    :param method: step method
+    :param e: exception instance
+    :param flow: from FLOWS property
+    """
+    case_name, method_name, weight, doc = get_step_info(case, method)
+
+    if not case.ERROR_MESSAGE_TEMPLATE:
+        raise
+
+    orig_tb = traceback.format_exc()
+    history = u'\n'.join(case.__history)
+    exc_cls_name = e.__class__.__name__
+
+    if case.RENDER_ERROR_MESSAGE and pyv.IS_PYTHON_2:  # feature for python 2 only
+        msg = case.render_error_message(
+            history=unicode_string(history),
+            case=unicode_string(case_name),
+            method=unicode_string(method_name),
+            step=unicode_string(weight),
+            step_doc=unicode_string(doc),
+            flow=unicode_string(flow),
+            raised=unicode_string(exc_cls_name),
+            traceback=unicode_string(format_traceback(orig_tb)),
+            message=unicode_string(get_exception_message(e)),
+        )
+    else:
+        msg = '\n' + unicode_string(
+            format_traceback(
+                orig_tb,
+                step_info='<{case}.{method}(num={step}, doc={doc}, flow={flow})>'.format(
+                    case=unicode_string(case_name),
+                    method=unicode_string(method_name),
+                    step=unicode_string(weight),
+                    doc=unicode_string(doc),
+                    flow=unicode_string(flow),
                 ),
-            )
+            ),
+        )
 
-        re_raise_exc(e, msg)
+    re_raise_exc(e, msg)
 
 
 def make_run_test(steps):
@@ -300,7 +332,101 @@ def make_run_test(steps):
     return run_test
 
 
-class ScreenPlayCaseMeta(type):
+def run_steps_async(case, steps):
+    """
+    Generator of futures for running steps like coroutine.
+    Async steps are awaited, other steps are called.
+
+    :param case: TestCase instance
+    :param steps: steps list
+    """
+    case.begin()
+
+    history_line = u'{}. {}'
+
+    if case.FLOWS and hasattr(case.FLOWS, '__iter__'):
+        flows = case.FLOWS
+    else:
+        flows = (None, )
+
+    case.__history = []
+
+    for flow in flows:
+        for step_method in steps:
+            _, _, step, doc = get_step_info(case, step_method)
+            case.__history.append(history_line.format(step, doc))
+
+            try:
+                awaitable = call_step(case, step_method, flow=flow)
+
+                if not pyv.is_async(step_method):
+                    continue
+
+                # Same as "yield from" for python 2 syntax.
+                # Generator based coroutines have not __await__.
+                if hasattr(awaitable, '__await__'):
+                    iterator = awaitable.__await__()
+                else:
+                    iterator = iter(awaitable)
+                value, error = None, None
+
+                while True:
+                    try:
+                        if error is None:
+                            future = iterator.send(value)
+                        else:
+                            future = iterator.throw(error)
+                    except StopIteration:
+                        break
+
+                    try:
+                        value, error = (yield future), None
+                    except GeneratorExit:
+                        iterator.close()
+                        raise
+                    except BaseException as e:
+                        value, error = None, e
+            except GeneratorExit:
+                raise
+            except BaseException as e:
+                raise_step_error(case, step_method, e, flow=flow)
+
+        if flow is not None:
+            case.__history = []
+
+    case.finalize()
+
+
+def make_async_run_test(steps):
+    """
+    Create runTest method for steps with async steps.
+    Method returns awaitable object if event loop is running
+    else steps will be run on new event loop.
+
+    :param steps: steps list
+    """
+
+    def run_test(self):
+        import asyncio
+
+        run_test.__doc__ = self.__doc__
+
+        awaitable = pyv.AwaitableGenerator(run_steps_async(self, steps))
+
+        if pyv.get_running_loop() is not None:
+            return awaitable
+
+        loop = asyncio.new_event_loop()
+
+        try:
+            loop.run_until_complete(awaitable)
+        finally:
+            loop.close()
+
+    return pyv.mark_async(run_test)
+
+
+class ScreenPlayCaseMeta(TestCaseMeta):
     """
     Build step methods and create runTest
     """
@@ -311,10 +437,8 @@ class ScreenPlayCaseMeta(type):
         cls = type.__new__(mcs, name, bases, dct)
 
         attributes = (
-            a for a in dir(cls)
-            if not a.startswith('_')
-            and
-            EXCLUDE_METHOD_PATTERN.search(a) is None
+            a for a in loader.get_method_table(cls).names
+            if EXCLUDE_METHOD_PATTERN.search(a) is None
         )
 
         for atr in attributes:
@@ -326,7 +450,10 @@ class ScreenPlayCaseMeta(type):
             steps.sort(
                 key=lambda m: getattr(m, WEIGHT_ATTRIBUTE_NAME),
             )
-            cls.runTest = make_run_test(steps)
+            if any(pyv.is_async(s) for s in steps):
+                cls.runTest = make_async_run_test(steps)
+            else:
+                cls.runTest = make_run_test(steps)
 
         return cls
 
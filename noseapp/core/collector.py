@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 
 import re
+import heapq
 import logging
 from random import Random
+from fnmatch import fnmatchcase
 
 from noseapp.core import loader
 from noseapp.tools import output
+from noseapp.core.timing import TimingDatabase
+from noseapp.core.timing import make_case_name
+from noseapp.core.suite.base import make_address
+from noseapp.core.suite.base import parse_address
 
 
 logger = logging.getLogger(__name__)
@@ -15,10 +21,17 @@ CASE_COLLECT_STRATEGY = 'case'
 BASIC_COLLECT_STRATEGY = 'basic'
 SUITE_COLLECT_STRATEGY = 'suite'
 METHOD_COLLECT_STRATEGY = 'method'
+SELECT_COLLECT_STRATEGY = 'select'
 
 COLLECTOR_COMMAND_PATTERN = re.compile(r'^.*\.|^.*:')
 COLLECT_CASE_COMMAND_PATTERN = re.compile(r'^.*\:')
 COLLECT_METHOD_COMMAND_PATTERN = re.compile(r'^.*\:.*\..*')
+GLOB_PATTERN = re.compile(r'[*?\[]')
+
+# Command can contain several targets: suite,suite:Case,suite:Case.method
+TARGETS_SEPARATOR = ','
+# Target is regular expression for address of test method: re:^suite:.*Payment
+REGEX_TARGET_PREFIX = 're:'
 
 
 def get_command(program_data):
@@ -43,6 +56,11 @@ def get_strategy(command):
     :param command: command to collect
     :type command: str or None
     """
+    if command and (TARGETS_SEPARATOR in command
+                    or command.startswith(REGEX_TARGET_PREFIX)
+                    or GLOB_PATTERN.search(command) is not None):
+        return SELECT_COLLECT_STRATEGY
+
     if command and COLLECTOR_COMMAND_PATTERN.search(command) is not None:
 
         if COLLECT_METHOD_COMMAND_PATTERN.search(command) is not None:
@@ -56,6 +74,202 @@ def get_strategy(command):
     return BASIC_COLLECT_STRATEGY
 
 
+def get_shard(options):
+    """
+    Get shard of test methods to collect from options
+
+    :return: (shard index, shard count) or None
+    :raises: ValueError
+    """
+    if options.shard_count <= 0:
+        return None
+
+    if not 0 <= options.shard_index < options.shard_count:
+        raise ValueError(
+            'Shard index must be in range 0..{}'.format(options.shard_count - 1),
+        )
+
+    return options.shard_index, options.shard_count
+
+
+def partition(weights, count):
+    """
+    Partition items to shards with close sums of weights.
+    Heaviest item is given to lightest shard. Ties are
+    broken by key of item and index of shard,
+    so result is the same on each host.
+
+    :param weights: list of (key, weight)
+    :param count: number of shards
+
+    :return: list of key lists
+    """
+    shards = [[] for _ in range(count)]
+    loads = [(0, index) for index in range(count)]
+
+    for key, weight in sorted(weights, key=lambda kw: (-kw[1], kw[0])):
+        load, index = heapq.heappop(loads)
+        shards[index].append(key)
+        heapq.heappush(loads, (load + weight, index))
+
+    return shards
+
+
+def get_shard_methods(suites, shard_index, shard_count, timing=None):
+    """
+    Get test methods of shard.
+    Methods are weighted by durations of previous runs,
+    method without history weighs average duration.
+    Each method weighs one if there is no history at all.
+
+    :param suites: suites of application
+    :type timing: noseapp.core.timing.TimingDatabase
+
+    :return: suite name -> test case name -> list of method names
+    :rtype: dict
+    """
+    keys = []
+
+    for suite in suites:
+        for case_name, case_map in suite.get_map().items():
+            for method_name in case_map['tests']:
+                keys.append((suite.name, case_name, method_name))
+
+    durations = timing.cases if timing is not None else {}
+    weights = [durations.get(make_case_name(*key)) for key in keys]
+    known = [w for w in weights if w is not None]
+
+    if known:
+        average = float(sum(known)) / len(known)
+        weights = [average if w is None else w for w in weights]
+    else:
+        weights = [1] * len(keys)
+
+    methods = {}
+
+    for suite_name, case_name, method_name in partition(list(zip(keys, weights)), shard_count)[shard_index]:
+        methods.setdefault(suite_name, {}).setdefault(case_name, []).append(method_name)
+
+    return methods
+
+
+def match_names(pattern, names):
+    """
+    Get names which are matched with glob pattern.
+    Name without pattern is looked up in names.
+
+    :param pattern: glob pattern or name
+    :param names: dict or set of names
+
+    :rtype: list
+    """
+    if GLOB_PATTERN.search(pattern) is None:
+        return [pattern] if pattern in names else []
+
+    return [name for name in names if fnmatchcase(name, pattern)]
+
+
+def get_selected_methods(context, command):
+    """
+    Get test methods which are selected by targets of command.
+    Target is address of suite, test case or test method,
+    glob pattern of address (myapp.checkout*:*Payment*)
+    or regular expression for address of test method (re:Payment.*refund).
+
+    :param context: application context
+    :type context: noseapp.app.context.AppContext
+    :param command: comma-separated targets
+
+    :return: suite name -> test case name -> list of method names.
+    Suite or test case is selected entirely if value is None.
+    :rtype: dict
+    :raises: noseapp.core.loader.LoaderError
+    """
+    suites = context.suite_index
+    selected = {}
+
+    def select(suite_name, case_name=None, method_names=None):
+        if suite_name in selected and selected[suite_name] is None:
+            return
+
+        if case_name is None:
+            selected[suite_name] = None
+            return
+
+        cases = selected.setdefault(suite_name, {})
+
+        if case_name in cases and cases[case_name] is None:
+            return
+
+        if method_names is None:
+            cases[case_name] = None
+        else:
+            cases.setdefault(case_name, []).extend(method_names)
+
+    for target in command.split(TARGETS_SEPARATOR):
+        target = target.strip()
+
+        if not target:
+            continue
+
+        # Target which does not match any test is error as for one target
+        matched = False
+
+        if target.startswith(REGEX_TARGET_PREFIX):
+            regex = re.compile(target[len(REGEX_TARGET_PREFIX):])
+
+            for suite in context.suites:
+                suite_name = suite.name
+
+                if suites[suite_name] is not suite:
+                    continue
+
+                for case_name, case_map in suite.get_map().items():
+                    for method_name in case_map['tests']:
+                        if regex.search(make_address(suite_name, case_name, method_name)):
+                            select(suite_name, case_name, [method_name])
+                            matched = True
+
+            if not matched:
+                raise loader.LoaderError('Target "{}" does not match any test'.format(target))
+
+            continue
+
+        suite_pattern, case_pattern, method_pattern = parse_address(target)
+        suite_names = match_names(suite_pattern, suites)
+
+        if not suite_names and GLOB_PATTERN.search(suite_pattern) is None:
+            raise loader.LoaderError('Suite "{}" is not found'.format(suite_pattern))
+
+        for suite_name in suite_names:
+            if case_pattern is None:
+                select(suite_name)
+                matched = True
+                continue
+
+            cases = suites[suite_name].context.test_case_index
+
+            for case_name in match_names(case_pattern, cases):
+                if method_pattern is None:
+                    select(suite_name, case_name)
+                    matched = True
+                    continue
+
+                method_names = match_names(
+                    method_pattern,
+                    set(loader.load_test_names_from_test_case(cases[case_name])),
+                )
+
+                if method_names:
+                    select(suite_name, case_name, method_names)
+                    matched = True
+
+        if not matched:
+            raise loader.LoaderError('Target "{}" does not match any test'.format(target))
+
+    return selected
+
+
 class CollectSuite(object):
     """
     Collect suite to run.
@@ -72,6 +286,10 @@ class CollectSuite(object):
         self.__command = get_command(self.__program_data)
         self.__strategy = get_strategy(self.__command)
 
+        # Shards are partitioned from all suites only
+        if self.__strategy != BASIC_COLLECT_STRATEGY and get_shard(program_data.config.options) is not None:
+            raise ValueError('Shards can not be used with command to collect "{}"'.format(self.__command))
+
     @property
     def command(self):
         """
@@ -107,6 +325,27 @@ class CollectSuite(object):
 
             kwargs.update(shuffle=random.shuffle)
 
+        shard = get_shard(self.__program_data.config.options)
+
+        if shard is not None:
+            shard_index, shard_count = shard
+            methods = get_shard_methods(
+                self.__program_data.suites,
+                shard_index,
+                shard_count,
+                timing=TimingDatabase(self.__program_data.config.options.durations_file),
+            )
+
+            return [
+                suite(
+                    self.__program_data,
+                    methods=methods[suite.name],
+                    **kwargs
+                )
+                for suite in self.__program_data.suites
+                if suite.name in methods
+            ]
+
         return [
             suite(
                 self.__program_data,
@@ -115,13 +354,28 @@ class CollectSuite(object):
             for suite in self.__program_data.suites
         ]
 
+    def collect_by_select_strategy(self):
+        """
+        Collect suites, test cases and methods
+        which are selected by several targets
+        """
+        selected = get_selected_methods(self.__program_data.context, self.__command)
+
+        return [
+            suite(self.__program_data, methods=selected[suite.name])
+            if selected[suite.name] is not None
+            else suite(self.__program_data)
+            for suite in self.__program_data.suites
+            if suite.name in selected
+        ]
+
     def collect_by_suite_strategy(self):
         """
         Collect suite from command
         """
         suite = loader.load_suite_by_name(
             self.__command,
-            self.__program_data.suites,
+            self.__program_data.context,
         )
 
         return [suite(self.__program_data)]
@@ -133,7 +387,7 @@ class CollectSuite(object):
         suite_name, case_name = self.__command.split(':')
         suite = loader.load_suite_by_name(
             suite_name,
-            self.__program_data.suites,
+            self.__program_data.context,
         )
 
         return [
@@ -151,7 +405,7 @@ class CollectSuite(object):
         case_name, method_name = case_info.split('.')
         suite = loader.load_suite_by_name(
             suite_name,
-            self.__program_data.suites,
+            self.__program_data.context,
         )
 
         return [
@@ -172,6 +426,7 @@ class CollectSuite(object):
             BASIC_COLLECT_STRATEGY: self.collect_by_basic_strategy,
             SUITE_COLLECT_STRATEGY: self.collect_by_suite_strategy,
             METHOD_COLLECT_STRATEGY: self.collect_by_method_strategy,
+            SELECT_COLLECT_STRATEGY: self.collect_by_select_strategy,
         }
 
         logger.debug('Strategy for collect suites is "%s"', self.__strategy)
@@ -15,12 +15,59 @@ class RunStrategy(object):
 
     SIMPLE = 'simple'
     GEVENT = 'gevent'
+    ASYNCIO = 'asyncio'
     THREADING = 'threading'
     MULTIPROCESSING = 'multiprocessing'
+    MULTIPROCESSING_POOL = 'multiprocessing-pool'
+    HYBRID = 'hybrid'
+    DISTRIBUTED = 'distributed'
+    DISTRIBUTED_WORKER = 'distributed-worker'
 
     ALL = (
         SIMPLE,
         GEVENT,
+        ASYNCIO,
         THREADING,
         MULTIPROCESSING,
+        MULTIPROCESSING_POOL,
+        HYBRID,
+        DISTRIBUTED,
+        DISTRIBUTED_WORKER,
+    )
+
+
+class WorkerMode(object):
+    """
+    How tests are run in process of hybrid strategy
+    """
+
+    THREADS = 'threads'
+    ASYNCIO = 'asyncio'
+
+    ALL = (
+        THREADS,
+        ASYNCIO,
+    )
+
+
+class ExtensionScope(object):
+    """
+    Scope of shared extension instance
+    """
+
+    # One instance for program run.
+    # Processes which are forked after creation inherit it.
+    SESSION = 'session'
+    # One instance for each process
+    PROCESS = 'process'
+    # One instance for each suite
+    SUITE = 'suite'
+    # One instance for each test case class
+    CASE = 'case'
+
+    ALL = (
+        SESSION,
+        PROCESS,
+        SUITE,
+        CASE,
     )
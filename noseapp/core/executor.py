@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+"""
+Executor with fixed number of threads and bounded queue of tasks.
+It's shared by runner and suites of threading strategy.
+"""
+
+import sys
+import logging
+import threading
+
+from noseapp.utils import pyv
+
+if pyv.IS_PYTHON_2:
+    import Queue as queue
+else:
+    import queue
+
+
+logger = logging.getLogger(__name__)
+
+
+# Time for checking state by waiting thread
+WAIT_INTERVAL = 0.1
+
+
+class Task(object):
+    """
+    Function to call in thread of executor
+    """
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+        self.exc_info = None
+        self.__done = threading.Event()
+
+        self.__claimed = False
+        self.__lock = threading.Lock()
+
+    def done(self):
+        return self.__done.is_set()
+
+    def claim(self):
+        """
+        Take task to run. Returns False if it was taken already.
+        Task in queue can be taken by thread which waits for it.
+        """
+        with self.__lock:
+            if self.__claimed:
+                return False
+
+            self.__claimed = True
+
+        return True
+
+    def run(self):
+        try:
+            self.func(*self.args, **self.kwargs)
+        except Exception:
+            self.exc_info = sys.exc_info()
+            logger.error('Task %r was failed', self.func, exc_info=self.exc_info)
+        finally:
+            # Release references to suite or test
+            self.func = self.args = self.kwargs = None
+            self.__done.set()
+
+
+class BoundedExecutor(object):
+    """
+    Run tasks on fixed number of threads.
+    Submit is blocked if queue of tasks is full.
+
+    Thread of executor which waits for its tasks
+    runs those of them which are still in queue instead
+    of sleeping, so nested suites can not lock all threads.
+    Tasks of other suites are not run by waiting thread,
+    so teardown of suite is not delayed by them.
+
+    Usage:
+
+        >>> executor = BoundedExecutor(8, queue_size=16)
+        >>> tasks = [executor.submit(suite, result) for suite in suites]
+        >>> executor.wait(tasks)
+        >>> executor.shutdown()
+    """
+
+    def __init__(self, max_workers, queue_size=None):
+        """
+        :param max_workers: number of threads
+        :type max_workers: int
+        :param queue_size: max number of tasks in queue. twice max_workers by default.
+        :type queue_size: int
+        """
+        self.__max_workers = max(max_workers, 1)
+        self.__queue = queue.Queue(queue_size or self.__max_workers * 2)
+
+        # Notify waiting threads that any task was finished or put to queue
+        self.__changed = threading.Condition()
+        self.__local = threading.local()
+
+        self.__threads = []
+
+        for _ in range(self.__max_workers):
+            thread = threading.Thread(target=self.__work)
+            thread.daemon = True
+            thread.start()
+            self.__threads.append(thread)
+
+    @property
+    def max_workers(self):
+        return self.__max_workers
+
+    @property
+    def queue_size(self):
+        return self.__queue.maxsize
+
+    def in_worker(self):
+        """
+        Is current thread worker of executor?
+        """
+        return getattr(self.__local, 'executor', None) is self
+
+    def notify(self):
+        with self.__changed:
+            self.__changed.notify_all()
+
+    def run_task(self, task):
+        """
+        Run task if it was not taken by other thread.
+        Return False if task was taken.
+        """
+        if not task.claim():
+            return False
+
+        task.run()
+        self.notify()
+
+        return True
+
+    def __work(self):
+        self.__local.executor = self
+
+        while True:
+            task = self.__queue.get()
+
+            if task is None:
+                break
+
+            self.run_task(task)
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Put task to queue. Wait for free place if queue is full.
+        Task will be run in current thread if queue is
+        full and current thread is worker of executor.
+
+        :rtype: Task
+        """
+        task = Task(func, args, kwargs)
+
+        if self.in_worker():
+            try:
+                self.__queue.put_nowait(task)
+            except queue.Full:
+                self.run_task(task)
+                return task
+        else:
+            self.__queue.put(task)
+
+        self.notify()
+
+        return task
+
+    def wait(self, tasks, count=None):
+        """
+        Wait for tasks. Worker of executor runs given
+        tasks which were not started yet while waiting.
+
+        :param tasks: list of Task instances
+        :param count: number of tasks which must be done. all by default.
+        """
+        tasks = list(tasks)
+        count = len(tasks) if count is None else count
+        helper = self.in_worker()
+
+        while sum(1 for t in tasks if t.done()) < count:
+            # Task stays in queue and will be skipped by thread which gets it
+            if helper and any(self.run_task(t) for t in tasks if not t.done()):
+                continue
+
+            with self.__changed:
+                if sum(1 for t in tasks if t.done()) < count:
+                    self.__changed.wait(WAIT_INTERVAL)
+
+    def shutdown(self):
+        """
+        Stop threads after tasks from queue
+        """
+        for _ in self.__threads:
+            self.__queue.put(None)
+
+        for thread in self.__threads:
+            thread.join()
+
+        self.__threads = []
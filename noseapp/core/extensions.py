@@ -4,17 +4,475 @@
 Tmp storage for extensions
 """
 
+import os
+import time
+import logging
+import threading
 from copy import deepcopy
 from contextlib import contextmanager
 
+from noseapp.datastructures import freeze
+from noseapp.core.constants import ExtensionScope
 from noseapp.datastructures import ModifyDict as Transport
 
 
+logger = logging.getLogger(__name__)
+
+
 _EXTENSIONS = {}
 
+# Scoped extensions which can have instances to release
+_SCOPED_EXTENSIONS = []
+
+# Number of threads which create instances of warmable extensions
+WARM_UP_WORKERS = 4
+# Registration is not blocked until this number of tasks is waiting
+WARM_UP_QUEUE_SIZE = 256
+# Will be created by first warm-up of process
+_WARM_UP_EXECUTOR = None
+# Threads of executor are not inherited by fork
+_WARM_UP_PID = None
+# Tasks of warm-up which can be running
+_WARM_UP_TASKS = []
+# Extensions of process scope which are warmed up by each process which runs tests
+_PROCESS_WARM_UP = []
+
 WAS_INSTALLATION = False
 
 
+class Frozen(Transport):
+    """
+    Frozen view of shared data.
+    View is given to consumers without copy.
+    """
+    pass
+
+
+class ScopedExtension(object):
+    """
+    Extension which instances are cached by scope.
+    Instance is created at first access from scope
+    and will be released with teardown hook at end of scope.
+    """
+
+    def __init__(self, name, cls, args, kwargs, scope, teardown=None):
+        """
+        :param scope: see noseapp.core.constants.ExtensionScope
+        :param teardown: callable object. Takes instance at end of scope.
+        """
+        if scope not in ExtensionScope.ALL:
+            raise ValueError('Unknown scope of extension "{}": {}'.format(name, scope))
+
+        self.name = name
+        self.cls = cls
+        self.args = args
+        self.kwargs = kwargs
+        self.scope = scope
+        self.teardown = teardown
+
+        self.__lock = threading.Lock()
+        # Scope key -> (pid of creator, instance)
+        self.__instances = {}
+        # Scope key -> (pid of creator, event which is set when instance is created)
+        self.__creating = {}
+
+    def key(self, suite_name=None, case_name=None):
+        """
+        Get key of scope for consumer.
+        Extension of case scope which is required by suite has suite scope.
+        """
+        from noseapp.core.suite.base import make_address
+
+        if self.scope in (ExtensionScope.SESSION, ExtensionScope.PROCESS):
+            return (self.scope, )
+
+        if self.scope == ExtensionScope.CASE and case_name:
+            return make_address(suite_name, case_name)
+
+        return make_address(suite_name)
+
+    def get(self, key, case=None):
+        """
+        Get instance of scope. Instance is created at first call.
+        Instances of different scopes are created concurrently,
+        consumers of one scope wait for its instance.
+
+        :param case: test case instance which gets instance
+        """
+        pid = os.getpid()
+
+        if key == (ExtensionScope.PROCESS, ):
+            key = (ExtensionScope.PROCESS, pid)
+
+        while True:
+            with self.__lock:
+                if key in self.__instances:
+                    return self.__instances[key][1]
+
+                creator, created = self.__creating.get(key, (None, None))
+
+                # Thread of parent process which was creating instance does not exist after fork
+                if creator != pid:
+                    created = threading.Event()
+                    self.__creating[key] = (pid, created)
+                    break
+
+            # Instance will be created by other thread or creation is failed
+            created.wait()
+
+        try:
+            logger.debug('Create instance of extension "%s" for scope "%s"', self.name, key)
+            instance = self.cls(*self.args, **self.kwargs)
+
+            with self.__lock:
+                if not self.__instances:
+                    _SCOPED_EXTENSIONS.append(self)
+
+                self.__instances[key] = (pid, instance)
+        finally:
+            with self.__lock:
+                del self.__creating[key]
+
+            created.set()
+
+        return instance
+
+    def warm_up(self):
+        """
+        Create instance of session or process scope
+        """
+        self.get((self.scope, ))
+
+    def release(self, keys):
+        """
+        Release instances of scopes which were created by current process.
+        Instances which were inherited from parent process are forgotten only.
+
+        :param keys: callable object. Takes key and returns True if scope is ended.
+        """
+        pid = os.getpid()
+
+        with self.__lock:
+            released = [
+                (key, item) for key, item in self.__instances.items() if keys(key)
+            ]
+
+            for key, _ in released:
+                del self.__instances[key]
+
+            if released and not self.__instances and self in _SCOPED_EXTENSIONS:
+                _SCOPED_EXTENSIONS.remove(self)
+
+        errors = []
+
+        for key, (creator, instance) in released:
+            if creator != pid or self.teardown is None:
+                continue
+
+            logger.debug('Release instance of extension "%s" for scope "%s"', self.name, key)
+
+            try:
+                self.teardown(instance)
+            except Exception as e:
+                errors.append(e)
+
+        if errors:
+            raise errors[0]
+
+
+class PooledExtension(object):
+    """
+    Extension with bounded pool of instances.
+    Instance is checked out by test for duration of test
+    or by suite for duration of suite. Consumer waits
+    if all instances are checked out.
+    Pool of each process has own instances.
+    """
+
+    def __init__(self, name, cls, args, kwargs, size, teardown=None):
+        """
+        :param size: max number of instances
+        :param teardown: callable object. Takes instance at end of process.
+        """
+        if size < 1:
+            raise ValueError('Size of pool "{}" must be greater than 0'.format(name))
+
+        self.name = name
+        self.cls = cls
+        self.args = args
+        self.kwargs = kwargs
+        self.size = size
+        self.teardown = teardown
+
+        self.__reset()
+
+    def __reset(self):
+        self.__pid = os.getpid()
+        self.__condition = threading.Condition()
+
+        # Number of created instances
+        self.__created = 0
+        # Instances which are not checked out
+        self.__idle = []
+        # Holder -> instance. Holder is id of test case or address of suite.
+        self.__holders = {}
+
+        # Metrics
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self.peak = 0
+        self.__started = None
+        self.__changed = None
+        # Sum of number of checked out instances multiplied by time
+        self.__busy_time = 0.0
+
+    def __check_process(self):
+        # Instances which were inherited from parent process are forgotten
+        if self.__pid != os.getpid():
+            self.__reset()
+
+    def __set_busy(self, delta):
+        now = time.time()
+
+        if self.__started is None:
+            self.__started = self.__changed = now
+
+        self.__busy_time += len(self.__holders) * (now - self.__changed)
+        self.__changed = now
+
+        return len(self.__holders) + delta
+
+    def key(self, suite_name=None, case_name=None):
+        """
+        Key of suite which checks out instance without test case
+        """
+        from noseapp.core.suite.base import make_address
+
+        return make_address(suite_name)
+
+    def get(self, key, case=None):
+        """
+        Check out instance. The same instance is returned to holder
+        until it will be checked in. Instance of test case is checked
+        in by cleanup of test, instance of suite at end of suite.
+
+        :param key: address of suite
+        :param case: test case instance which gets instance
+        """
+        self.__check_process()
+
+        holder = key if case is None else id(case)
+        start = time.time()
+
+        with self.__condition:
+            if holder in self.__holders:
+                return self.__holders[holder]
+
+            waited = False
+
+            while not self.__idle and self.__created >= self.size:
+                waited = True
+                self.__condition.wait()
+
+            wait = time.time() - start
+
+            self.checkouts += 1
+            self.waits += int(waited)
+            self.wait_time += wait
+            self.max_wait = max(self.max_wait, wait)
+
+            if self.__idle:
+                instance = self.__idle.pop()
+            else:
+                instance = None
+
+                if self not in _SCOPED_EXTENSIONS:
+                    _SCOPED_EXTENSIONS.append(self)
+
+                self.__created += 1
+
+        if instance is None:
+            try:
+                logger.debug('Create instance of pooled extension "%s"', self.name)
+                instance = self.cls(*self.args, **self.kwargs)
+            except BaseException:
+                with self.__condition:
+                    self.__created -= 1
+                    self.__condition.notify()
+                raise
+
+        with self.__condition:
+            busy = self.__set_busy(1)
+            self.peak = max(self.peak, busy)
+            self.__holders[holder] = instance
+
+        if case is not None:
+            case.addCleanup(self.checkin, holder)
+
+        return instance
+
+    def warm_up(self):
+        """
+        Create one instance in pool if pool is not full
+        """
+        self.__check_process()
+
+        with self.__condition:
+            if self.__created >= self.size:
+                return
+
+            if self not in _SCOPED_EXTENSIONS:
+                _SCOPED_EXTENSIONS.append(self)
+
+            self.__created += 1
+
+        try:
+            logger.debug('Warm up instance of pooled extension "%s"', self.name)
+            instance = self.cls(*self.args, **self.kwargs)
+        except BaseException:
+            with self.__condition:
+                self.__created -= 1
+                self.__condition.notify()
+            raise
+
+        with self.__condition:
+            self.__idle.append(instance)
+            self.__condition.notify()
+
+    def checkin(self, holder):
+        """
+        Return instance of holder to pool
+        """
+        with self.__condition:
+            if holder not in self.__holders:
+                return
+
+            self.__set_busy(-1)
+            self.__idle.append(self.__holders.pop(holder))
+            self.__condition.notify()
+
+    def release(self, keys):
+        """
+        Check in instances of suites which are ended.
+        Instances are released at end of process.
+
+        :param keys: callable object. Takes key and returns True if scope is ended.
+        """
+        self.__check_process()
+
+        for holder in [h for h in list(self.__holders) if keys(h)]:
+            self.checkin(holder)
+
+        if not keys((ExtensionScope.PROCESS, os.getpid())):
+            return
+
+        with self.__condition:
+            released = self.__idle + list(self.__holders.values())
+            self.__reset()
+
+        if self in _SCOPED_EXTENSIONS:
+            _SCOPED_EXTENSIONS.remove(self)
+
+        errors = []
+
+        for instance in released:
+            if self.teardown is None:
+                break
+
+            try:
+                self.teardown(instance)
+            except Exception as e:
+                errors.append(e)
+
+        if errors:
+            raise errors[0]
+
+    def utilisation(self):
+        """
+        Time-weighted share of checked out instances from size of pool
+        """
+        with self.__condition:
+            if self.__started is None:
+                return 0.0
+
+            self.__set_busy(0)
+            elapsed = self.__changed - self.__started
+
+            return self.__busy_time / (elapsed * self.size) if elapsed else 0.0
+
+    def report(self, stream):
+        """
+        Write metrics to stream
+        """
+        stream.writeln(
+            'Pool "{}" (size {}): checkouts={}, waits={}, mean wait={:.3f}s, '
+            'max wait={:.3f}s, peak={}, utilisation={:.0f}%'.format(
+                self.name,
+                self.size,
+                self.checkouts,
+                self.waits,
+                self.wait_time / self.checkouts if self.checkouts else 0.0,
+                self.max_wait,
+                self.peak,
+                100.0 * self.utilisation(),
+            ),
+        )
+
+
+class ExtensionRef(object):
+    """
+    Reference to instance of scoped or pooled extension.
+    Consumers keep reference instead of instance.
+    """
+
+    def __init__(self, extension, key):
+        self.extension = extension
+        self.key = key
+
+    def get(self, case=None):
+        return self.extension.get(self.key, case=case)
+
+
+class LazyExtension(object):
+    """
+    Instance of extension for one consumer.
+    Instance is created at first access and memoized.
+    """
+
+    def __init__(self, factory, args, kwargs):
+        self.__factory = factory
+        self.__args = args
+        self.__kwargs = kwargs
+
+        self.__lock = threading.Lock()
+        self.__created = False
+        self.__instance = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_LazyExtension__lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    @property
+    def created(self):
+        return self.__created
+
+    def get(self, case=None):
+        if not self.__created:
+            with self.__lock:
+                if not self.__created:
+                    self.__instance = self.__factory(*self.__args, **self.__kwargs)
+                    self.__created = True
+
+        return self.__instance
+
+
 class ExtensionNotFound(LookupError):
     pass
 
@@ -37,31 +495,154 @@ def installation():
     if WAS_INSTALLATION:
         raise InstallationError('Extensions is already installed')
 
+    del _PROCESS_WARM_UP[:]
+
     yield
 
     clear()
     WAS_INSTALLATION = True
 
 
-def get(name):
+def get(name, suite_name=None, case_name=None):
     """
-    Get extension by name
+    Get extension by name.
+    Instance is not created here, reference or lazy instance
+    is returned. See resolve function.
 
     :param name: extension name
     :type name: basestring
+    :param suite_name: name of suite which is consumer
+    :param case_name: name of test case class which is consumer
     """
     try:
         ext = _EXTENSIONS[name]
 
+        if ext.__class__ in (ScopedExtension, PooledExtension):
+            return ExtensionRef(ext, ext.key(suite_name, case_name))
+
         if ext.__class__ is Transport:
-            return ext.cls(*ext.args, **ext.kwargs)
+            return LazyExtension(ext.cls, ext.args, ext.kwargs)
+
+        if ext.__class__ is Frozen:
+            return ext.data
 
-        return deepcopy(ext)
+        return LazyExtension(deepcopy, (ext, ), {})
     except KeyError:
         raise ExtensionNotFound(name)
 
 
-def set(name, ext, to_transport=False, args=None, kwargs=None):
+def resolve(ext, case=None):
+    """
+    Get instance of extension which was got by get function
+
+    :param case: test case instance which gets instance
+    """
+    if ext.__class__ in (ExtensionRef, LazyExtension):
+        return ext.get(case=case)
+
+    return ext
+
+
+def release_scope(address):
+    """
+    Release instances of extensions which are scoped by suite or test case
+
+    :param address: address of suite or test case
+    """
+    errors = []
+
+    for ext in list(_SCOPED_EXTENSIONS):
+        try:
+            ext.release(lambda key: key == address)
+        except Exception as e:
+            errors.append(e)
+
+    if errors:
+        raise errors[0]
+
+
+def report_pools(stream):
+    """
+    Write metrics of pooled extensions which were used by current process
+    """
+    pools = [ext for ext in _SCOPED_EXTENSIONS if ext.__class__ is PooledExtension]
+
+    if pools:
+        stream.writeln()
+
+    for pool in pools:
+        pool.report(stream)
+
+
+def warm_up(ext):
+    """
+    Start creation of instances of scoped or pooled
+    extension on background threads
+
+    :type ext: ScopedExtension or PooledExtension
+    """
+    from noseapp.core.executor import BoundedExecutor
+
+    global _WARM_UP_PID
+    global _WARM_UP_TASKS
+    global _WARM_UP_EXECUTOR
+
+    if _WARM_UP_PID != os.getpid():
+        _WARM_UP_PID = os.getpid()
+        _WARM_UP_TASKS = []
+        _WARM_UP_EXECUTOR = BoundedExecutor(WARM_UP_WORKERS, queue_size=WARM_UP_QUEUE_SIZE)
+
+    count = ext.size if ext.__class__ is PooledExtension else 1
+
+    for _ in range(count):
+        _WARM_UP_TASKS.append(_WARM_UP_EXECUTOR.submit(ext.warm_up))
+
+
+def wait_warm_up():
+    """
+    Wait for running warm-up. Locks of extensions
+    must not be held by other threads while process is forked.
+    """
+    # Tasks of parent process are not run by forked process
+    if _WARM_UP_PID != os.getpid():
+        return
+
+    tasks = list(_WARM_UP_TASKS)
+
+    if tasks:
+        _WARM_UP_EXECUTOR.wait(tasks)
+
+        for task in tasks:
+            _WARM_UP_TASKS.remove(task)
+
+
+def warm_up_process_scope():
+    """
+    Start creation of instances of process scope.
+    It's called by each process which runs tests:
+    by worker after fork or by master if tests are run there.
+    """
+    for ext in _PROCESS_WARM_UP:
+        warm_up(ext)
+
+
+def release_process_scope():
+    """
+    Release instances of session and process scopes
+    which were created by current process.
+    Errors of teardown hooks are logged.
+    """
+    wait_warm_up()
+    for ext in list(_SCOPED_EXTENSIONS):
+        try:
+            # Keys of suite and test case scopes are addresses
+            ext.release(lambda key: isinstance(key, tuple))
+        except Exception:
+            logger.exception('Release of extension "%s" was failed', ext.name)
+
+
+def set(name, ext, to_transport=False, args=None, kwargs=None, frozen=False,
+        scope=None, teardown=None, pool_size=None, warm=False):
     """
     Register extension in tmp storage
 
@@ -70,14 +651,45 @@ def set(name, ext, to_transport=False, args=None, kwargs=None):
     :param ext: any objects
     :param to_transport: if True, create instance object with calling get function
     :type in_context: bool
+    :param frozen: if True, get function returns frozen view of object instead of copy
+    :type frozen: bool
+    :param scope: instance will be cached by scope, see noseapp.core.constants.ExtensionScope
+    :param teardown: callable object. Takes instance of scope at end of scope.
+    :param pool_size: instances will be checked out from pool of this size
+    :param warm: instances of session scope or instances of pool will be created
+     on background threads at registration, instances of process scope
+     will be created so by each process which runs tests
     """
-    if to_transport:
+    if pool_size is not None and scope is not None:
+        raise ValueError('Extension "{}" can not have scope and pool'.format(name))
+
+    if warm and pool_size is None and scope not in (ExtensionScope.SESSION, ExtensionScope.PROCESS):
+        raise ValueError(
+            'Extension "{}" can be warmed up with session or process scope or with pool'.format(name),
+        )
+
+    if to_transport and pool_size is not None:
+        _EXTENSIONS[name] = PooledExtension(
+            name, ext, args or tuple(), kwargs or dict(), pool_size, teardown=teardown,
+        )
+    elif to_transport and scope is not None:
+        _EXTENSIONS[name] = ScopedExtension(
+            name, ext, args or tuple(), kwargs or dict(), scope, teardown=teardown,
+        )
+    elif frozen:
+        _EXTENSIONS[name] = Frozen(data=freeze(ext))
+    elif to_transport:
         _EXTENSIONS[name] = Transport(
             cls=ext, args=args or tuple(), kwargs=kwargs or dict(),
         )
     else:
         _EXTENSIONS[name] = ext
 
+    if warm and scope == ExtensionScope.PROCESS:
+        _PROCESS_WARM_UP.append(_EXTENSIONS[name])
+    elif warm:
+        warm_up(_EXTENSIONS[name])
+
     return ext
 
 
@@ -4,6 +4,7 @@ import logging
 
 from noseapp.utils import pyv
 from noseapp.core.constants import RunStrategy
+from noseapp.core.constants import WorkerMode
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,11 @@ class ClassFactory(object):
                 'Incorrect run strategy: "{}"'.format(options.run_strategy),
             )
 
+        if options.worker_mode not in WorkerMode.ALL:
+            raise ValueError(
+                'Incorrect worker mode: "{}"'.format(options.worker_mode),
+            )
+
         self.__options = options
 
         self.__current_suite_class = None
@@ -32,6 +38,21 @@ class ClassFactory(object):
     def options(self):
         return self.__options
 
+    def set_run_strategy(self, run_strategy):
+        """
+        Replace run strategy from options.
+        Classes will be created for new run strategy.
+        """
+        if run_strategy not in RunStrategy.ALL:
+            raise ValueError(
+                'Incorrect run strategy: "{}"'.format(run_strategy),
+            )
+
+        self.__options.run_strategy = run_strategy
+
+        self.__current_suite_class = None
+        self.__current_runner_class = None
+
     @property
     def suite_class(self):
         if not self.__current_suite_class:
@@ -64,7 +85,24 @@ class ClassFactory(object):
                 from noseapp.core.suite.performers.gevent import GeventSuitePerformer
                 performer_class = GeventSuitePerformer
 
-            elif self.__options.run_strategy in (RunStrategy.MULTIPROCESSING, RunStrategy.THREADING)\
+            elif self.__options.run_strategy == RunStrategy.ASYNCIO \
+                    or (self.__options.run_strategy == RunStrategy.HYBRID
+                        and self.__options.worker_mode == WorkerMode.ASYNCIO):
+                if pyv.IS_PYTHON_2:
+                    raise pyv.UnSupportedError('asyncio lib unsupported with python 2')
+
+                from noseapp.core.suite.performers.asyncio import AsyncioSuitePerformer
+                performer_class = AsyncioSuitePerformer
+
+            elif self.__options.run_strategy == RunStrategy.HYBRID:
+                from noseapp.core.suite.performers.threading import ThreadSuitePerformer
+                performer_class = ThreadSuitePerformer
+
+            elif self.__options.run_strategy in (RunStrategy.MULTIPROCESSING,
+                                                 RunStrategy.MULTIPROCESSING_POOL,
+                                                 RunStrategy.THREADING,
+                                                 RunStrategy.DISTRIBUTED,
+                                                 RunStrategy.DISTRIBUTED_WORKER)\
                     and self.__options.async_tests:
                 from noseapp.core.suite.performers.threading import ThreadSuitePerformer
                 performer_class = ThreadSuitePerformer
@@ -102,10 +140,33 @@ class ClassFactory(object):
                 from noseapp.core.runner.performers.multiprocessing import MPRunPerformer
                 performer_class = MPRunPerformer
 
+            elif self.__options.run_strategy == RunStrategy.MULTIPROCESSING_POOL:
+                from noseapp.core.runner.performers.multiprocessing import MPPoolRunPerformer
+                performer_class = MPPoolRunPerformer
+
+            elif self.__options.run_strategy == RunStrategy.HYBRID:
+                from noseapp.core.runner.performers.hybrid import HybridRunPerformer
+                performer_class = HybridRunPerformer
+
+            elif self.__options.run_strategy == RunStrategy.DISTRIBUTED:
+                from noseapp.core.runner.performers.distributed import DistributedRunPerformer
+                performer_class = DistributedRunPerformer
+
+            elif self.__options.run_strategy == RunStrategy.DISTRIBUTED_WORKER:
+                from noseapp.core.runner.performers.distributed import DistributedWorkerPerformer
+                performer_class = DistributedWorkerPerformer
+
             elif self.__options.run_strategy == RunStrategy.GEVENT:
                 from noseapp.core.runner.performers.gevent import GeventRunPerformer
                 performer_class = GeventRunPerformer
 
+            elif self.__options.run_strategy == RunStrategy.ASYNCIO:
+                if pyv.IS_PYTHON_2:
+                    raise pyv.UnSupportedError('asyncio lib unsupported with python 2')
+
+                from noseapp.core.runner.performers.asyncio import AsyncioRunPerformer
+                performer_class = AsyncioRunPerformer
+
             elif self.__options.run_strategy == RunStrategy.THREADING:
                 from noseapp.core.runner.performers.threading import ThreadingRunPerformer
                 performer_class = ThreadingRunPerformer
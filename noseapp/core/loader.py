@@ -6,10 +6,13 @@ Auto load suites for register in noseapp.base.NoseApp
 
 import os
 import sys
+import json
 import time
 import logging
 from random import randint
+from fnmatch import fnmatchcase
 from importlib import import_module
+from multiprocessing.pool import ThreadPool
 
 
 logger = logging.getLogger(__name__)
@@ -17,6 +20,12 @@ logger = logging.getLogger(__name__)
 
 TEST_NAME_PREFIX = 'test'
 DEFAULT_TEST_NAME = 'runTest'
+# Attribute of test case class for cached method table
+METHOD_TABLE_ATTRIBUTE_NAME = '__method_table__'
+INIT_FILE_NAME = '__init__.py'
+
+# os.scandir is available since python 3.5
+_scandir = getattr(os, 'scandir', None)
 
 
 class LoaderError(BaseException):
@@ -36,10 +45,125 @@ def is_package(path):
     Maybe is path python package?
     """
     return os.path.isfile(
-        os.path.join(path, '__init__.py'),
+        os.path.join(path, INIT_FILE_NAME),
     )
 
 
+class DiscoveryCache(object):
+    """
+    Cache of suites discovery.
+    Names of suites are saved for each module file.
+    Record is actual while mtime and size of file are not changed.
+
+    Usage:
+
+        >>> cache = DiscoveryCache('/path/to/cache.json')
+        >>> cache.get('/path/to/suites/module.py')
+        >>> ['module']
+    """
+
+    def __init__(self, path):
+        """
+        :param path: path to json file
+        :type path: str
+        """
+        self.__path = path
+        self.__records = {}
+
+        if os.path.isfile(path):
+            try:
+                with open(path) as fp:
+                    self.__records = json.load(fp)
+            except (IOError, ValueError) as e:
+                logger.warning('Discovery cache "%s" can not be loaded: %s', path, e)
+
+    @property
+    def path(self):
+        return self.__path
+
+    @staticmethod
+    def get_stamp(file_path):
+        """
+        Get mtime and size of file
+        """
+        stat = os.stat(file_path)
+        return [stat.st_mtime, stat.st_size]
+
+    def get(self, file_path):
+        """
+        Get names of suites from module file.
+        Return None if record is not found or is not actual.
+
+        :param file_path: absolute path to module file
+
+        :rtype: list or None
+        """
+        record = self.__records.get(file_path)
+
+        if record and record['stamp'] == self.get_stamp(file_path):
+            return record['suites']
+
+        return None
+
+    def set(self, file_path, suite_names):
+        """
+        Save names of suites from module file
+
+        :param file_path: absolute path to module file
+        :param suite_names: names of suites before mounting to application
+        """
+        self.__records[file_path] = {
+            'stamp': self.get_stamp(file_path),
+            'suites': list(suite_names),
+        }
+
+    def save(self):
+        """
+        Save cache to file
+        """
+        tmp_path = '{}.tmp'.format(self.__path)
+
+        with open(tmp_path, 'w') as fp:
+            json.dump(self.__records, fp)
+
+        os.rename(tmp_path, self.__path)
+
+
+def get_suite_filter(app_name, command):
+    """
+    Get suite filter for discovery by command to collect.
+    Return None if all suites are required.
+
+    :param app_name: name of application which loads suites
+    :param command: command to collect. see noseapp.core.collector.
+
+    :rtype: callable or None
+    """
+    from noseapp.core import collector
+
+    strategy = collector.get_strategy(command)
+
+    if strategy == collector.BASIC_COLLECT_STRATEGY:
+        return None
+
+    if strategy == collector.SELECT_COLLECT_STRATEGY:
+        targets = [t.strip() for t in command.split(collector.TARGETS_SEPARATOR) if t.strip()]
+
+        if any(t.startswith(collector.REGEX_TARGET_PREFIX) for t in targets):
+            return None
+
+        suite_patterns = [t.split(':')[0] for t in targets]
+
+        return lambda name: any(
+            fnmatchcase('{}.{}'.format(app_name, name), pattern)
+            for pattern in suite_patterns
+        )
+
+    suite_name = command.split(':')[0]
+
+    return lambda name: '{}.{}'.format(app_name, name) == suite_name
+
+
 def save_loaded_module(module, module_name):
     """
     Substitute module name in sys.modules with
@@ -55,61 +179,247 @@ def save_loaded_module(module, module_name):
     sys.modules[system_name] = module
 
 
-def load_suites_from_dir(path, import_base=None):
+def scan_dir(path):
     """
-    Load suites from dir
+    Get names of python files and sub dirs by one scan of dir
 
+    :param path: path to dir
+    :type path: str
+
+    :return: (files, dirs)
+    :rtype: tuple
+    """
+    files = []
+    dirs = []
+
+    if _scandir is not None:
+        for entry in _scandir(path):
+            if entry.is_dir():
+                dirs.append(entry.name)
+            elif entry.name.endswith('.py'):
+                files.append(entry.name)
+    else:
+        for name in os.listdir(path):
+            if os.path.isdir(os.path.join(path, name)):
+                dirs.append(name)
+            elif name.endswith('.py'):
+                files.append(name)
+
+    files.sort()
+    dirs.sort()
+
+    return files, dirs
+
+
+def find_modules(path, import_base=None, recursive=True):
+    """
+    Find python modules for loading suites by single pass through tree.
+    Dir of sub packages is not scanned if it's not python package.
+
+    :param path: path to dir
     :type path: str
     :param import_base: base import path
     :type import_base: str
+    :param recursive: find modules in sub packages
+    :type recursive: bool
+
+    :return: list of (module name, file path)
+    :rtype: list
     """
-    from noseapp.suite.base import Suite
+    modules = []
+    stack = [(path, import_base)]
 
-    logger.debug('Try to load suites from dir: "%s"', path)
+    while stack:
+        dir_path, base = stack.pop()
+        files, dirs = scan_dir(dir_path)
 
-    suites = []
+        if base and INIT_FILE_NAME not in files:
+            continue
 
-    if import_base and not is_package(path):
-        return suites
+        for py_file in files:
+            if py_file.startswith('_'):
+                continue
 
-    py_files = filter(
-        lambda f: f.endswith('.py') and not f.startswith('_'),
-        os.listdir(path),
-    )
-    modules = (m.replace('.py', '') for m in py_files)
+            module_name = py_file[:-len('.py')]
 
-    for module_name in modules:
-        if import_base:
-            module_name = '{}.{}'.format(import_base, module_name)
+            if base:
+                module_name = '{}.{}'.format(base, module_name)
 
-        logger.debug('Import python module: "%s"', module_name)
+            modules.append(
+                (module_name, os.path.abspath(os.path.join(dir_path, py_file))),
+            )
 
-        # Can be conflict with global name
-        # We're obliged to talk about this
-        if module_name in sys.modules:
-            raise LoaderError(
-                'Module "{}" already exit in program context. {}.'.format(
-                    module_name, sys.modules[module_name],
-                ),
+        if recursive:
+            stack.extend(
+                (os.path.join(dir_path, d), '{}.{}'.format(base, d) if base else d)
+                for d in reversed(dirs)
             )
 
-        module = import_module(module_name)
+    return modules
+
+
+def check_module_name(module_name):
+    """
+    Module can not be loaded if name already exist in sys.modules
+    """
+    # Can be conflict with global name
+    # We're obliged to talk about this
+    if module_name in sys.modules:
+        raise LoaderError(
+            'Module "{}" already exit in program context. {}.'.format(
+                module_name, sys.modules[module_name],
+            ),
+        )
+
+
+def import_checked_module(module_name):
+    """
+    Check module name and import module.
+    LoaderError is returned instead of raising because
+    thread pool does not pass exceptions which are not Exception.
+    """
+    try:
+        check_module_name(module_name)
+    except LoaderError as e:
+        return e
+
+    return import_module(module_name)
+
+
+def import_modules(module_names, workers=None):
+    """
+    Import modules. If workers more than one then
+    modules will be imported on thread pool.
+    Each name is checked just before import of module, so module
+    which was imported by other module is not loaded twice.
+
+    :param module_names: list of module names
+    :type module_names: list
+    :param workers: size of thread pool
+    :type workers: int
+
+    :return: list of modules in order of names
+    :rtype: list
+    """
+    if not workers or workers < 2 or len(module_names) < 2:
+        modules = []
+
+        for module_name in module_names:
+            logger.debug('Import python module: "%s"', module_name)
+            check_module_name(module_name)
+            modules.append(import_module(module_name))
+
+        return modules
+
+    logger.debug('Import %d python modules on %d threads', len(module_names), workers)
+
+    pool = ThreadPool(min(workers, len(module_names)))
+
+    try:
+        modules = pool.map(import_checked_module, module_names, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+    for module in modules:
+        if isinstance(module, LoaderError):
+            raise module
+
+    return modules
+
+
+def load_suites_from_modules(modules, cache=None, suite_filter=None, workers=None):
+    """
+    Import modules and load suites from them
+
+    :param modules: list of (module name, file path)
+    :type modules: list
+
+    :param cache: cache of discovery
+    :type cache: DiscoveryCache
+    :param suite_filter: callable object. Takes suite name and returns bool.
+     If all suites of module from cache are not accepted then module
+     will not be imported.
+    :param workers: number of threads for import of modules
+    :type workers: int
+    """
+    from noseapp.suite.base import Suite
+
+    start_time = time.time()
+
+    if cache is not None and suite_filter is not None:
+        required_modules = []
+
+        for module_name, file_path in modules:
+            suite_names = cache.get(file_path)
+
+            if suite_names is not None and not any(map(suite_filter, suite_names)):
+                logger.debug('Skip python module by discovery cache: "%s"', file_path)
+                continue
+
+            required_modules.append((module_name, file_path))
+
+        modules = required_modules
+
+    suites = []
+
+    if workers and workers > 1:
+        imported_modules = import_modules([name for name, _ in modules], workers=workers)
+    else:
+        imported_modules = None
+
+    for i, (module_name, file_path) in enumerate(modules):
+        if imported_modules is None:
+            module = import_modules([module_name])[0]
+        else:
+            module = imported_modules[i]
+
         save_loaded_module(module, module_name)
 
-        module_suites = (
+        module_suites = [
             getattr(module, atr)
             for atr in dir(module)
             if isinstance(
                 getattr(module, atr, None), Suite,
             )
-        )
+        ]
+
+        if cache is not None:
+            cache.set(file_path, [s.name for s in module_suites])
 
         suites.extend(module_suites)
 
+    logger.info(
+        'Loaded %d suites from %d modules in %.3fs', len(suites), len(modules), time.time() - start_time,
+    )
+
     return suites
 
 
-def load_suites_from_path(path, import_base=None):
+def load_suites_from_dir(path, import_base=None, cache=None, suite_filter=None, workers=None):
+    """
+    Load suites from dir
+
+    :type path: str
+    :param import_base: base import path
+    :type import_base: str
+
+    :param cache: cache of discovery
+    :type cache: DiscoveryCache
+    :param suite_filter: see load_suites_from_modules
+    :param workers: see load_suites_from_modules
+    """
+    logger.debug('Try to load suites from dir: "%s"', path)
+
+    return load_suites_from_modules(
+        find_modules(path, import_base=import_base, recursive=False),
+        cache=cache,
+        suite_filter=suite_filter,
+        workers=workers,
+    )
+
+
+def load_suites_from_path(path, import_base=None, cache=None, suite_filter=None, workers=None):
     """
     Recursive load suites from path
 
@@ -117,37 +427,88 @@ def load_suites_from_path(path, import_base=None):
     :type path: str
     :param import_base: base import path
     :type import_base: str
+
+    :param cache: cache of discovery
+    :type cache: DiscoveryCache
+    :param suite_filter: see load_suites_from_modules
+    :param workers: see load_suites_from_modules
     """
     logger.debug('Load suites from path: "%s"', path)
 
     check_path_is_exist(path)
 
-    suites = []
-    copy_import_base = import_base
-
-    suites.extend(
-        load_suites_from_dir(path, import_base=import_base),
+    return load_suites_from_modules(
+        find_modules(path, import_base=import_base),
+        cache=cache,
+        suite_filter=suite_filter,
+        workers=workers,
     )
 
-    for root, dirs, files in os.walk(path):
-        for d in dirs:
-            dir_abs_path = os.path.join(root, d)
 
-            if import_base is None:
-                _import_base = d
-            else:
-                _import_base = '{}.{}'.format(import_base, d)
+class MethodTable(object):
+    """
+    Public attribute names of test case class from one scan of dir.
+    Table is cached by class of noseapp.case.base.TestCaseMeta
+    and invalidated when public attribute is added or deleted.
+    """
 
-            suites.extend(
-                load_suites_from_path(
-                    dir_abs_path,
-                    import_base=_import_base,
-                ),
-            )
+    def __init__(self, cls):
+        self.names = [name for name in dir(cls) if not name.startswith('_')]
+        # (prefix, default name) -> test names
+        self.__test_names = {}
 
-            import_base = copy_import_base
+    def test_names(self, test_name_prefix=TEST_NAME_PREFIX, default_test_name=DEFAULT_TEST_NAME):
+        """
+        Names of test methods in order of dir
+        """
+        key = (test_name_prefix, default_test_name)
 
-    return suites
+        if key not in self.__test_names:
+            self.__test_names[key] = [
+                name for name in self.names
+                if name.startswith(test_name_prefix) or name == default_test_name
+            ]
+
+        return self.__test_names[key]
+
+
+def get_method_table(cls):
+    """
+    Get method table of test case class.
+    Table is built once for class with metaclass noseapp.case.base.TestCaseMeta,
+    table of other classes is built at each call.
+
+    :param cls: test case class
+
+    :rtype: MethodTable
+    """
+    from noseapp.case.base import TestCaseMeta
+
+    if not isinstance(cls, TestCaseMeta):
+        return MethodTable(cls)
+
+    table = cls.__dict__.get(METHOD_TABLE_ATTRIBUTE_NAME)
+
+    if table is None:
+        table = MethodTable(cls)
+        type.__setattr__(cls, METHOD_TABLE_ATTRIBUTE_NAME, table)
+
+    return table
+
+
+def invalidate_method_table(cls):
+    """
+    Drop method tables of class and its subclasses
+    """
+    classes = [cls]
+
+    while classes:
+        cls = classes.pop()
+
+        if METHOD_TABLE_ATTRIBUTE_NAME in cls.__dict__:
+            type.__delattr__(cls, METHOD_TABLE_ATTRIBUTE_NAME)
+
+        classes.extend(type.__subclasses__(cls))
 
 
 def load_test_names_from_test_case(
@@ -163,14 +524,19 @@ def load_test_names_from_test_case(
 
     :rtype: list
     """
-    cls_dir = dir(cls)
-
-    def is_test_name(name):
-        return name.startswith(test_name_prefix) \
-            or \
-            name == default_test_name
-
-    return filter(is_test_name, cls_dir)
+    if test_name_prefix.startswith('_') or default_test_name.startswith('_'):
+        # Private names are not kept by method table
+        return [
+            name for name in dir(cls)
+            if name.startswith(test_name_prefix) or name == default_test_name
+        ]
+
+    return list(
+        get_method_table(cls).test_names(
+            test_name_prefix=test_name_prefix,
+            default_test_name=default_test_name,
+        ),
+    )
 
 
 def load_tests_from_test_case(
@@ -184,7 +550,7 @@ def load_tests_from_test_case(
     logger.debug('Load test from test case: "%s"', test_case_class.__name__)
 
     if method_name:
-        if method_name not in dir(test_case_class):
+        if not hasattr(test_case_class, method_name):
             raise LoaderError(
                 'Method "{}" of "{}" class is not found'.format(
                     method_name, test_case_class.__name__,
@@ -202,37 +568,89 @@ def load_tests_from_test_case(
     )
 
 
+def load_lazy_tests_from_test_case(
+        test_case_class,
+        method_name=None,
+        method_names=None,
+        test_name_prefix=TEST_NAME_PREFIX,
+        default_test_name=DEFAULT_TEST_NAME):
+    """
+    Same as load_tests_from_test_case but instances
+    of test_case_class will be created at iteration
+
+    :param method_names: names of test methods to load, all by default
+
+    :rtype: noseapp.core.suite.base.LazyTests
+    """
+    from noseapp.core.suite.base import LazyTests
+
+    logger.debug('Load lazy tests from test case: "%s"', test_case_class.__name__)
+
+    if method_name:
+        if not hasattr(test_case_class, method_name):
+            raise LoaderError(
+                'Method "{}" of "{}" class is not found'.format(
+                    method_name, test_case_class.__name__,
+                ),
+            )
+        return LazyTests(test_case_class, [method_name])
+
+    test_names = load_test_names_from_test_case(
+        test_case_class,
+        test_name_prefix=test_name_prefix,
+        default_test_name=default_test_name,
+    )
+
+    if method_names is not None:
+        method_names = set(method_names)
+        test_names = [name for name in test_names if name in method_names]
+
+    return LazyTests(
+        test_case_class,
+        test_names,
+    )
+
+
 def load_suite_by_name(name, suites):
     """
-    Find suite in list by name
+    Find suite by name in index of application context.
+    List of suites is searched by iteration.
 
     :param name: suite name
-    :param suites: suites list
+    :param suites: application context or suites list
+    :type suites: noseapp.app.context.AppContext or list
     """
-    logger.debug('Load suite "%s" from list', name)
+    from noseapp.app.context import AppContext
 
-    for suite in suites:
-        if suite.name == name:
-            return suite
+    if isinstance(suites, AppContext):
+        logger.debug('Load suite "%s" from index', name)
+        suite = suites.get_suite(name)
     else:
+        logger.debug('Load suite "%s" from list', name)
+        suite = next((s for s in suites if s.name == name), None)
+
+    if suite is None:
         raise LoaderError(
             'Suite "{}" is not found'.format(name),
         )
 
+    return suite
+
 
 def load_case_from_suite(class_name, suite):
     """
-    Find test case class by class name in suite or suite mediator
+    Find test case class by class name in index of suite context
 
     :param class_name: class name
-    :param suite: suite or suite mediator instance
+    :param suite: suite instance
     """
     logger.debug('Load test case "%s" from suite "%s"', class_name, suite.name)
 
-    for case in suite.test_cases:
-        if case.__name__ == class_name:
-            return case
-    else:
+    case = suite.context.get_test_case(class_name)
+
+    if case is None:
         raise LoaderError(
             'Test case "{}" is not found'.format(class_name),
         )
+
+    return case
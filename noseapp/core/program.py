@@ -82,6 +82,12 @@ class ProgramData(object):
     def result_proxy_factory(self):
         return self.__result_proxy_factory
 
+    def set_run_strategy(self, run_strategy):
+        """
+        Run with given strategy instead of --run-strategy option
+        """
+        self.__class_factory.set_run_strategy(run_strategy)
+
     def build_suite(self):
         """
         Collect and build suites
@@ -116,10 +122,15 @@ class TestProgram(BaseTestProgram):
     def runTests(self):
         pass
 
-    def run(self):
+    def run(self, run_strategy=None):
         """
         Perform test program
+
+        :param run_strategy: run strategy instead of --run-strategy option
         """
+        if run_strategy is not None:
+            self.data.set_run_strategy(run_strategy)
+
         self.testRunner = self.data.runner_class(
             stream=self.config.stream,
             verbosity=self.config.verbosity,
@@ -6,13 +6,144 @@ from contextlib import contextmanager
 from nose.core import TextTestRunner as _TextTestRunner
 from nose.result import TextTestResult as _TextTestResult
 
+from noseapp.core import extensions
+from noseapp.core.timing import TimingDatabase
+
+
+class RemoteError(Exception):
+    """
+    Error of test which was performed in another process.
+    Traceback was formatted there.
+    """
+
+    def __init__(self, message, traceback=''):
+        super(RemoteError, self).__init__(message)
+
+        self.traceback = traceback
+
+    @staticmethod
+    def get_message(exc):
+        """
+        Get message of exception instance or skip reason
+        """
+        try:
+            return str(exc)
+        except Exception:
+            return '<unprintable {} object>'.format(type(exc).__name__)
+
+
+class TestRecord(object):
+    """
+    Compact record of finished test.
+    It's stored by result instead of test instance
+    and keeps only data for printing of errors.
+    """
+
+    __slots__ = ('description', 'short_description')
+
+    def __init__(self, test):
+        self.description = str(test)
+        self.short_description = test.shortDescription()
+
+    def __str__(self):
+        return self.description
+
+    def __repr__(self):
+        return '<TestRecord: {}>'.format(self.description)
+
+    def shortDescription(self):
+        return self.short_description
+
 
 class TextTestResult(_TextTestResult):
-    pass
+
+    def __init__(self, *args, **kwargs):
+        # Storage for durations of test cases
+        self.timing = kwargs.pop('timing', None)
+        # Replace finished tests in storages with TestRecord
+        self.release_tests = kwargs.pop('release_tests', False)
+
+        _TextTestResult.__init__(self, *args, **kwargs)
+
+        # Id of test -> time of start
+        self.__started = {}
+        # Id of storage -> count of items which were released
+        self.__released = {}
+
+    def startTest(self, test):
+        self.__started[id(test)] = time.time()
+        _TextTestResult.startTest(self, test)
+
+    def stopTest(self, test):
+        _TextTestResult.stopTest(self, test)
+        started = self.__started.pop(id(test), None)
+
+        if self.timing is not None and started is not None:
+            self.timing.add_case(test, time.time() - started)
+
+        if self.release_tests:
+            self.release(test)
+
+    def get_storages(self):
+        """
+        Get lists of results which can store test instances
+        """
+        storages = [
+            self.errors,
+            self.failures,
+            self.expectedFailures,
+            self.unexpectedSuccesses,
+        ]
+        storages.extend(storage for storage, _, _ in self.errorClasses.values())
+
+        return dict((id(s), s) for s in storages).values()
+
+    def release(self, test):
+        """
+        Replace test instance in storages with TestRecord.
+        Items before first test which is still running
+        were released already and will not be checked.
+        """
+        record = None
+
+        for storage in self.get_storages():
+            start = self.__released.get(id(storage), 0)
+
+            for index in range(start, len(storage)):
+                item = storage[index]
+                stored = item[0] if isinstance(item, tuple) else item
+
+                if stored is not test:
+                    continue
+
+                if record is None:
+                    record = TestRecord(test)
+
+                storage[index] = (record,) + item[1:] if isinstance(item, tuple) else record
+
+            while start < len(storage):
+                item = storage[start]
+                stored = item[0] if isinstance(item, tuple) else item
+
+                if id(stored) in self.__started:
+                    break
+
+                start += 1
+
+            self.__released[id(storage)] = start
+
+    def _exc_info_to_string(self, err, test=None):
+        if isinstance(err[1], RemoteError):
+            return err[1].traceback
+
+        return _TextTestResult._exc_info_to_string(self, err, test)
 
 
 class RunPerformer(object):
 
+    # Tests are run by current process, not by child processes
+    in_process = True
+
     def __init__(self, runner):
         self.runner = runner
 
@@ -24,18 +155,36 @@ class RunPerformer(object):
         for suite in suites:
             suite(result)
 
+    def longest_first(self, suites):
+        """
+        Sort suites by durations from previous runs
+        """
+        return self.runner.timing.longest_first(suites)
+
 
 class BaseTestRunner(_TextTestRunner):
 
     result_class = TextTestResult
     performer_class = RunPerformer
 
+    def __init__(self, *args, **kwargs):
+        super(BaseTestRunner, self).__init__(*args, **kwargs)
+
+        # Durations of previous runs. Shards are partitioned by durations,
+        # so file must not be changed by hosts of sharded run.
+        self.timing = TimingDatabase(
+            getattr(self.config.options, 'durations_file', None),
+            read_only=getattr(self.config.options, 'shard_count', 0) > 0,
+        )
+
     def _makeResult(self):
         return self.result_class(
             self.stream,
             self.descriptions,
             self.verbosity,
             self.config,
+            timing=self.timing,
+            release_tests=getattr(self.config.options, 'release_tests', False),
         )
 
     def _makePerformer(self):
@@ -61,11 +210,22 @@ class BaseTestRunner(_TextTestRunner):
             finally:
                 suites.tearDown()
 
+        if performer.in_process:
+            extensions.warm_up_process_scope()
+
         start = time.time()
-        with setup_teardown(suites):
-            performer(suites, result)
+        try:
+            with setup_teardown(suites):
+                performer(suites, result)
+        finally:
+            if getattr(self.config.options, 'pool_metrics', False):
+                extensions.report_pools(self.stream)
+
+            extensions.release_process_scope()
         stop = time.time()
 
+        self.timing.save()
+
         result.printErrors()
         result.printSummary(start, stop)
 
@@ -75,6 +235,8 @@ class BaseTestRunner(_TextTestRunner):
 
 
 __all__ = (
+    TestRecord,
+    RemoteError,
     RunPerformer,
     TextTestResult,
     BaseTestRunner,
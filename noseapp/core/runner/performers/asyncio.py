@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+import asyncio
+
+from noseapp.core.runner.base import RunPerformer
+from noseapp.core.suite.performers.asyncio import Limiter
+from noseapp.core.suite.performers.asyncio import run_suite
+from noseapp.core.suite.performers.asyncio import DEFAULT_ASYNC_TESTS
+
+
+class AsyncioRunPerformer(RunPerformer):
+    """
+    Run suites on one asyncio event loop
+    """
+
+    def __call__(self, suites, result):
+        options = self.runner.config.options
+        suites = self.longest_first(suites)
+        size = options.async_suites if options.async_suites > 0 else len(suites)
+        tests_size = options.async_tests if options.async_tests > 0 else DEFAULT_ASYNC_TESTS
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(
+                self.perform(suites, result, loop, size, tests_size),
+            )
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    @staticmethod
+    def perform(suites, result, loop, size, tests_size):
+        """
+        Run suites with limit of concurrent suites.
+        Tests of each suite are limited by tests_size.
+
+        :return: future which will be done after all suites
+        """
+        future = loop.create_future()
+        limiter = Limiter(loop, max(size, 1))
+        # Number of not finished suites
+        pending = [len(suites)]
+
+        def on_done(f):
+            limiter.release()
+            pending[0] -= 1
+
+            if future.done():
+                return
+
+            if f.exception() is not None:
+                future.set_exception(f.exception())
+            elif not pending[0]:
+                future.set_result(None)
+
+        def start(suite):
+            if result.shouldStop:
+                f = loop.create_future()
+                f.set_result(None)
+            else:
+                f = run_suite(suite, result, loop, limiter=Limiter(loop, tests_size))
+
+            f.add_done_callback(on_done)
+
+        for suite in suites:
+            limiter.acquire(lambda suite=suite: start(suite))
+
+        if not suites:
+            future.set_result(None)
+
+        return future
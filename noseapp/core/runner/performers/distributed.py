@@ -0,0 +1,614 @@
+# -*- coding: utf-8 -*-
+
+"""
+Run suites by workers on other hosts.
+
+Coordinator gives work items to workers by address of suite,
+workers pull items over TCP or unix socket and stream result records back.
+Worker builds suites of application itself, so suites are not pickled.
+"""
+
+from __future__ import absolute_import
+
+import os
+import json
+import time
+import errno
+import socket
+import struct
+import logging
+import threading
+
+from noseapp.core import extensions
+from noseapp.utils.common import TimeoutException
+from noseapp.core.runner.base import RunPerformer
+from noseapp.core.suite.base import AddressIndex
+from noseapp.core.suite.base import get_address
+from noseapp.core.runner.performers.multiprocessing import MPResult
+from noseapp.core.runner.performers.multiprocessing import START_TEST
+from noseapp.core.runner.performers.multiprocessing import STOP_TEST
+from noseapp.core.runner.performers.multiprocessing import worker
+from noseapp.core.runner.performers.multiprocessing import run_process
+from noseapp.core.runner.performers.multiprocessing import ResultChannel
+from noseapp.core.runner.performers.multiprocessing import WorkScheduler
+from noseapp.core.runner.performers.multiprocessing import get_fork_process_class
+from noseapp.core.runner.performers.multiprocessing import wait_handles
+from noseapp.core.runner.performers.multiprocessing import DEFAULT_ITEM_ATTEMPTS
+from noseapp.core.runner.performers.multiprocessing import get_record_address
+
+
+logger = logging.getLogger(__name__)
+
+
+# Default address of coordinator, port is chosen by system
+DEFAULT_COORDINATOR = '127.0.0.1:0'
+
+# Frame kinds of protocol
+CONTROL = b'C'  # request of worker or work item, json
+RECORD = b'R'  # result record of worker, json
+
+# Frame header: kind, length of payload
+FRAME_HEADER = struct.Struct('!cI')
+
+
+def parse_endpoint(value):
+    """
+    Parse address of coordinator.
+    It's host:port, [ipv6]:port or unix:/path/to/socket.
+    Family of host is resolved by getaddrinfo.
+
+    :return: (socket family, socket address)
+    :rtype: tuple
+    :raises: ValueError
+    """
+    if value.startswith('unix:'):
+        return socket.AF_UNIX, value[len('unix:'):]
+
+    host, _, port = value.rpartition(':')
+
+    if host.startswith('[') and host.endswith(']'):
+        host = host[1:-1]
+    elif ':' in host:
+        raise ValueError(
+            'IPv6 address of coordinator must be in brackets: [{}]:{}'.format(host, port),
+        )
+
+    try:
+        port = int(port)
+    except ValueError:
+        raise ValueError('Port of coordinator "{}" is not a number'.format(value))
+
+    family, _, _, _, address = socket.getaddrinfo(host or '127.0.0.1', port, 0, socket.SOCK_STREAM)[0]
+
+    return family, address
+
+
+def format_endpoint(family, address):
+    """
+    Format socket address to address of coordinator
+    """
+    if family == socket.AF_UNIX:
+        return 'unix:{}'.format(address)
+
+    if family == socket.AF_INET6:
+        return '[{}]:{}'.format(*address[:2])
+
+    return '{}:{}'.format(*address[:2])
+
+
+def pack_remote_record(outcome, address, exc_class_path='', message='', traceback='', duration=None):
+    """
+    Pack result record of remote worker.
+    Test is addressed by name, see noseapp.core.suite.base.get_address
+
+    :param duration: duration of test which was measured by worker, for stop record
+    :rtype: bytes
+    """
+    return json.dumps(
+        [outcome, address, exc_class_path, message, traceback, duration],
+    ).encode('utf-8')
+
+
+def unpack_remote_record(data):
+    """
+    Unpack result record of remote worker
+
+    :rtype: list
+    """
+    return json.loads(data.decode('utf-8'))
+
+
+class FrameConnection(object):
+    """
+    Connection of worker and coordinator over socket.
+    It has interface of multiprocessing connection for worker function.
+    """
+
+    def __init__(self, sock):
+        self.sock = sock
+
+        self.__buffer = b''
+        self.__lock = threading.Lock()
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def close(self):
+        self.sock.close()
+
+    def write(self, kind, payload):
+        with self.__lock:
+            self.sock.sendall(FRAME_HEADER.pack(kind, len(payload)) + payload)
+
+    def read(self):
+        """
+        Read available data from socket.
+        Returns list of received frames (kind, payload).
+
+        :raises: EOFError
+        """
+        data = self.sock.recv(65536)
+
+        if not data:
+            raise EOFError('Connection was closed')
+
+        self.__buffer += data
+        frames = []
+
+        while len(self.__buffer) >= FRAME_HEADER.size:
+            kind, length = FRAME_HEADER.unpack_from(self.__buffer)
+            end = FRAME_HEADER.size + length
+
+            if len(self.__buffer) < end:
+                break
+
+            frames.append((kind, self.__buffer[FRAME_HEADER.size:end]))
+            self.__buffer = self.__buffer[end:]
+
+        return frames
+
+    def send(self, obj):
+        self.write(CONTROL, json.dumps(obj).encode('utf-8'))
+
+    def send_bytes(self, data):
+        self.write(RECORD, data)
+
+    def recv(self):
+        """
+        Wait for control frame
+        """
+        while True:
+            for kind, payload in self.read():
+                if kind == CONTROL:
+                    return json.loads(payload.decode('utf-8'))
+
+
+class RemoteResultChannel(ResultChannel):
+    """
+    Result of remote worker.
+    Records are sent to coordinator with address of test.
+    Record of stop has duration of test, because coordinator
+    applies records of work item after it.
+    """
+
+    def __init__(self, result, connection):
+        super(RemoteResultChannel, self).__init__(result, connection)
+
+        # Id of test -> time of start
+        self.started = {}
+
+    def send(self, outcome, test, *args):
+        self.connection.send_bytes(
+            pack_remote_record(outcome, get_address(test), *args),
+        )
+
+    def startTest(self, test):
+        self.started[id(test)] = time.time()
+        self.send(START_TEST, test)
+
+    def stopTest(self, test):
+        started = self.started.pop(id(test), None)
+        duration = time.time() - started if started is not None else None
+
+        self.send(STOP_TEST, test, '', '', '', duration)
+
+
+def connect(endpoint):
+    """
+    Connect to coordinator
+
+    :param endpoint: address of coordinator
+    """
+    family, address = parse_endpoint(endpoint)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.connect(address)
+
+    return FrameConnection(sock)
+
+
+def remote_worker(index, endpoint, result):
+    """
+    Pull work items from coordinator while
+    they are and send result records to it.
+
+    :type index: noseapp.core.suite.base.AddressIndex
+    :param endpoint: address of coordinator
+    :param result: test result of current process
+    """
+    connection = connect(endpoint)
+
+    try:
+        worker(index, connection, RemoteResultChannel(result, connection))
+    finally:
+        connection.close()
+
+
+class WorkerState(object):
+    """
+    State of connected worker
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+        # Work item which is performing by worker
+        self.item = None
+        # Records of item. Will be applied after item.
+        self.records = []
+        # Worker is waiting for item which can be lost by other worker
+        self.waiting = False
+        # Worker got None and will be disconnected
+        self.finished = False
+
+
+class Coordinator(object):
+    """
+    Give work items to remote workers and apply their results.
+
+    Records of work item are applied to result when worker
+    requests next item, so durations of tests are taken from
+    records of worker. If worker is disconnected while
+    item is performing, records are dropped and item
+    will be given to another worker.
+    """
+
+    def __init__(self,
+                 result,
+                 endpoint=DEFAULT_COORDINATOR,
+                 split_suites=False,
+                 timing=None,
+                 timeout=None,
+                 item_attempts=DEFAULT_ITEM_ATTEMPTS):
+        """
+        :param result: test result
+        :param endpoint: address for listening, host:port or unix:/path
+        :param split_suites: give cases of suite as work items
+        :param timing: durations of previous runs to sort cases
+        :param timeout: max number of seconds without events from workers
+        :param item_attempts: number of workers which can lose one item
+        """
+        self.endpoint = endpoint
+        self.split_suites = split_suites
+        self.timing = timing
+        self.timeout = timeout
+        self.item_attempts = item_attempts
+
+        self.mp_result = MPResult(result)
+
+        # Suites storage
+        self.suites = []
+        # Suites by address. Local workers will get it by fork.
+        self.index = AddressIndex()
+        # Will be created before run
+        self.scheduler = None
+        # Listening socket
+        self.sock = None
+
+        # Connection -> WorkerState
+        self.workers = {}
+        # Processes of local workers
+        self.processes = []
+        # Address of case or suite -> number of lost attempts
+        self.lost = {}
+        # Address of test -> address of result record
+        self.record_addresses = {}
+
+    def add_suite(self, suite):
+        """
+        Add suite to run
+        """
+        self.mp_result.match(suite)
+        self.index.add(suite)
+        self.suites.append(suite)
+
+    def add_suites(self, suites):
+        """
+        Add suites to run. For usability only.
+        """
+        for suite in suites:
+            self.add_suite(suite)
+
+    def listen(self):
+        """
+        Start listening. Returns address for workers.
+        """
+        family, address = parse_endpoint(self.endpoint)
+
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+
+        if family != socket.AF_UNIX:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+        self.sock.bind(address)
+        self.sock.listen(128)
+
+        self.endpoint = format_endpoint(family, self.sock.getsockname())
+
+        logger.info('Coordinator is listening on %s', self.endpoint)
+
+        return self.endpoint
+
+    def start_local_workers(self, number):
+        """
+        Start workers in child processes on current host
+        """
+        extensions.wait_warm_up()
+
+        for _ in range(number):
+            process = get_fork_process_class()(
+                target=run_process,
+                args=(remote_worker, self.index, self.endpoint, self.mp_result.result),
+            )
+            process.start()
+            self.processes.append(process)
+
+    def in_flight(self):
+        return sum(1 for w in self.workers.values() if w.item is not None)
+
+    def get_record_address(self, address):
+        """
+        Get address of record in current process by address of test
+        """
+        if address not in self.record_addresses:
+            self.record_addresses[address] = get_record_address(self.index.find(address))
+
+        return self.record_addresses[address]
+
+    def apply_records(self, state):
+        for data in state.records:
+            outcome, address, exc_class_path, message, traceback, duration = unpack_remote_record(data)
+
+            test = self.mp_result.apply_outcome(
+                outcome,
+                self.get_record_address(address),
+                exc_class_path,
+                message,
+                traceback,
+            )
+
+            # Result measured time of applying of records only
+            if outcome == STOP_TEST and duration is not None and self.timing is not None:
+                self.timing.add_case(test, duration)
+
+        state.records = []
+
+    def give_item(self, state):
+        """
+        Send next work item to worker.
+        Worker will wait if there are items of other workers.
+        """
+        if self.mp_result.shouldStop:
+            item = None
+        else:
+            item = self.scheduler.next_item(state.connection)
+
+        if item is None and not self.mp_result.shouldStop and self.in_flight():
+            state.waiting = True
+            return
+
+        state.item = item[0] if item is not None else None
+        state.waiting = False
+        state.finished = item is None
+
+        state.connection.send(item)
+
+    def handle_request(self, state):
+        """
+        Worker finished its item and requests next one
+        """
+        self.apply_records(state)
+
+        if state.item is not None:
+            self.record_addresses.clear()
+            state.item = None
+
+        self.give_item(state)
+
+    def report_lost(self, item):
+        """
+        Report error of item which was lost by all attempts
+        """
+        suite_address, case_address = item
+        test = self.index.find(case_address or suite_address)
+        message = 'Work item "{}" was lost by {} workers'.format(
+            case_address or suite_address, self.item_attempts,
+        )
+
+        self.mp_result.apply_error(get_record_address(test), message)
+
+    def disconnect(self, state):
+        """
+        Remove worker. Its item will be given to another worker.
+        """
+        del self.workers[state.connection]
+        state.connection.close()
+
+        if state.item is None:
+            self.apply_records(state)
+            return
+
+        address = state.item[1] or state.item[0]
+        self.lost[address] = self.lost.get(address, 0) + 1
+
+        logger.warning(
+            'Worker was disconnected while performing "%s", attempt %d',
+            address, self.lost[address],
+        )
+
+        if self.lost[address] < self.item_attempts:
+            self.scheduler.requeue(state.connection, state.item)
+        else:
+            self.report_lost(state.item)
+
+        state.item = None
+
+        for waiting in [w for w in self.workers.values() if w.waiting]:
+            self.give_item(waiting)
+
+    def accept(self):
+        sock, _ = self.sock.accept()
+        connection = FrameConnection(sock)
+
+        self.workers[connection] = WorkerState(connection)
+
+    def receive(self, connection):
+        state = self.workers[connection]
+
+        try:
+            frames = connection.read()
+        except (EOFError, IOError, socket.error):
+            self.disconnect(state)
+            return
+
+        for kind, payload in frames:
+            if kind == RECORD:
+                state.records.append(payload)
+            else:
+                self.handle_request(state)
+
+    def is_done(self):
+        if self.mp_result.shouldStop:
+            return not self.in_flight()
+
+        return not len(self.scheduler) and not self.in_flight()
+
+    def wait(self, until):
+        """
+        Handle events of workers while until returns False
+        """
+        while not until():
+            handles = list(self.workers) + [self.sock]
+            ready = wait_handles(handles, timeout=self.timeout)
+
+            if not ready:
+                raise TimeoutException(
+                    'There were no events from workers for "{}" sec.'.format(self.timeout),
+                )
+
+            for handle in ready:
+                if handle is self.sock:
+                    self.accept()
+                elif handle in self.workers:
+                    self.receive(handle)
+
+    def run(self):
+        """
+        Run suites
+        """
+        self.scheduler = WorkScheduler(
+            self.suites,
+            split_suites=self.split_suites,
+            timing=self.timing,
+        )
+
+        self.wait(self.is_done)
+
+        for state in list(self.workers.values()):
+            if state.waiting:
+                self.give_item(state)
+
+        # Records of last teardown will be received
+        self.wait(lambda: not [w for w in self.workers.values() if w.finished])
+
+        for process in self.processes:
+            process.join()
+
+    def close(self):
+        """
+        Close connections and stop local workers
+        """
+        for connection in list(self.workers):
+            connection.close()
+
+        self.workers.clear()
+
+        if self.sock is not None:
+            family = self.sock.family
+            address = self.sock.getsockname()
+            self.sock.close()
+
+            if family == socket.AF_UNIX:
+                try:
+                    os.unlink(address)
+                except OSError as e:
+                    if e.errno != errno.ENOENT:
+                        raise
+
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        self.mp_result.clear()
+
+
+class DistributedRunPerformer(RunPerformer):
+    """
+    Run suites by workers which are connected to coordinator
+    """
+
+    in_process = False
+
+    def __call__(self, suites, result):
+        options = self.runner.config.options
+
+        # XXX: See MPRunPerformer
+        self.runner.config.plugins.prepareTestResult(result)
+
+        coordinator = Coordinator(
+            result,
+            endpoint=options.coordinator or DEFAULT_COORDINATOR,
+            split_suites=options.split_suites,
+            timing=self.runner.timing,
+            timeout=options.multiprocessing_timeout,
+        )
+        coordinator.add_suites(self.longest_first(suites))
+
+        try:
+            endpoint = coordinator.listen()
+            self.runner.stream.writeln('Coordinator is listening on {}'.format(endpoint))
+
+            coordinator.start_local_workers(options.local_workers)
+            coordinator.run()
+        finally:
+            coordinator.close()
+
+
+class DistributedWorkerPerformer(RunPerformer):
+    """
+    Perform work items of coordinator
+    """
+
+    def __call__(self, suites, result):
+        options = self.runner.config.options
+
+        if not options.coordinator:
+            raise ValueError('Address of coordinator is required for worker')
+
+        started = time.time()
+        remote_worker(AddressIndex(suites), options.coordinator, result)
+
+        logger.info('Worker was finished in %.2f sec.', time.time() - started)
+
+        # Tests are counted by coordinator only
+        self.runner.stream.writeln('Results were sent to coordinator {}'.format(options.coordinator))
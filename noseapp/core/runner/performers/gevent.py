@@ -22,7 +22,7 @@ class GeventRunPerformer(RunPerformer):
 
         pool = Pool(size)
 
-        for suite in suites:
+        for suite in self.longest_first(suites):
             pool.spawn(suite, result)
 
         pool.join()
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+import time
+from collections import OrderedDict
+
+from noseapp.utils import pyv
+from noseapp.core.constants import WorkerMode
+from noseapp.core.executor import BoundedExecutor
+from noseapp.core.runner.base import RunPerformer
+from noseapp.core.runner.performers.multiprocessing import WorkerPool
+from noseapp.core.runner.performers.multiprocessing import setup_suite
+from noseapp.core.runner.performers.multiprocessing import teardown_suite
+from noseapp.core.runner.performers.multiprocessing import terminate_processes
+
+if pyv.IS_PYTHON_2:
+    import Queue as queue
+else:
+    import queue
+
+
+def get_worker_concurrency(options):
+    """
+    Get number of concurrent tests in worker process
+    """
+    if options.worker_concurrency > 0:
+        return options.worker_concurrency
+
+    return max(options.async_tests, 1)
+
+
+class WorkItems(object):
+    """
+    Work items of worker process which are running concurrently.
+    Suite context is torn down when master process released
+    suite and all items of suite were finished.
+    """
+
+    def __init__(self, index, connection, channel, concurrency):
+        """
+        :param index: index of suites. Will be inherited by fork.
+        :type index: noseapp.core.suite.base.AddressIndex
+        :param connection: duplex connection to master process
+        :type channel: noseapp.core.runner.performers.multiprocessing.ResultChannel
+        :param concurrency: max number of running items
+        """
+        self.index = index
+        self.channel = channel
+        self.connection = connection
+        self.concurrency = concurrency
+
+        # Suite address -> setup was successful
+        self.opened = OrderedDict()
+        # Suite address -> number of running items
+        self.running = {}
+        # Addresses of suites which were released by master process
+        self.released = set()
+        # Master process has not items for worker
+        self.finished = False
+        # Items which were finished after last request
+        self.completed = []
+
+        # Number of running items and time of its change
+        self.__in_flight = 0
+        self.__changed = self.__started = time.time()
+        # Sum of number of running items multiplied by time
+        self.__area = 0.0
+
+    @property
+    def in_flight(self):
+        return self.__in_flight
+
+    def set_in_flight(self, value):
+        now = time.time()
+
+        self.__area += self.__in_flight * (now - self.__changed)
+        self.__changed = now
+        self.__in_flight = value
+
+    def mean_depth(self):
+        """
+        Time-weighted mean of number of running items
+        """
+        self.set_in_flight(self.__in_flight)
+        elapsed = self.__changed - self.__started
+
+        return self.__area / elapsed if elapsed else 0.0
+
+    def request(self):
+        """
+        Get next item from master process.
+        Returns tuple of work item and test to run or None.
+        """
+        if self.finished or self.in_flight >= self.concurrency:
+            return None
+
+        self.connection.send((self.in_flight, self.mean_depth(), self.completed))
+        self.completed = []
+
+        received = self.connection.recv()
+
+        if received is None:
+            self.finished = True
+            return None
+
+        item, to_release = received
+        suite_address, case_address = item
+
+        self.released.update(to_release)
+        self.release_idle()
+
+        if case_address is None:
+            test = self.index.find(suite_address)
+        else:
+            if suite_address not in self.opened:
+                self.opened[suite_address] = setup_suite(self.index.find(suite_address), self.channel)
+
+            if not self.opened[suite_address]:
+                self.completed.append(item)
+                return self.request()
+
+            test = self.index.find(case_address)
+
+        self.running[suite_address] = self.running.get(suite_address, 0) + 1
+        self.set_in_flight(self.in_flight + 1)
+
+        return item, test
+
+    def done(self, item):
+        self.running[item[0]] -= 1
+        self.completed.append(item)
+        self.set_in_flight(self.in_flight - 1)
+        self.release_idle()
+
+    def release_idle(self):
+        for address in list(self.released):
+            if not self.running.get(address):
+                self.released.discard(address)
+
+                if address in self.opened:
+                    del self.opened[address]
+                    teardown_suite(self.index.find(address), self.channel)
+
+    def release_all(self):
+        self.released.update(self.opened)
+        self.release_idle()
+
+
+def worker(index, connection, concurrency, channel):
+    """
+    Task of long-lived process.
+    Items are run concurrently on threads of executor,
+    tests of suites are run on the same executor.
+
+    :param concurrency: max number of running items.
+    Other arguments are the same as for
+    noseapp.core.runner.performers.multiprocessing.worker
+    """
+    items = WorkItems(index, connection, channel, concurrency)
+    executor = BoundedExecutor(concurrency)
+    done = queue.Queue()
+
+    def run(item, test):
+        try:
+            test.run(channel, executor=executor)
+        finally:
+            done.put(item)
+
+    try:
+        while True:
+            item = items.request()
+
+            if item is not None:
+                executor.submit(run, *item)
+                continue
+
+            if not items.in_flight:
+                break
+
+            items.done(done.get())
+    finally:
+        executor.shutdown()
+        items.release_all()
+
+
+def async_worker(index, connection, concurrency, channel):
+    """
+    Task of long-lived process.
+    Items are run concurrently on asyncio event loop,
+    number of running tests is limited by concurrency.
+
+    :param concurrency: max number of running items.
+    Other arguments are the same as for
+    noseapp.core.runner.performers.multiprocessing.worker
+    """
+    import asyncio
+
+    from noseapp.core.suite.performers.asyncio import Limiter
+    from noseapp.core.suite.performers.asyncio import run_suite
+
+    items = WorkItems(index, connection, channel, concurrency)
+    loop = asyncio.new_event_loop()
+    limiter = Limiter(loop, concurrency)
+    errors = []
+
+    asyncio.set_event_loop(loop)
+
+    def on_done(item, future):
+        items.done(item)
+
+        if future.exception() is not None:
+            errors.append(future.exception())
+
+        fill()
+
+    def fill():
+        try:
+            while True:
+                item = items.request()
+
+                if item is None:
+                    break
+
+                item, test = item
+                future = run_suite(test, channel, loop, limiter=limiter)
+                future.add_done_callback(lambda f, i=item: on_done(i, f))
+        except BaseException as e:
+            # Exception of callback must not be lost by event loop
+            errors.append(e)
+
+        if errors or not items.in_flight:
+            loop.stop()
+
+    try:
+        loop.call_soon(fill)
+        loop.run_forever()
+
+        if errors:
+            raise errors[0]
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+        items.release_all()
+
+
+class HybridRunPerformer(RunPerformer):
+    """
+    Run suites with pool of processes.
+    Each process runs tests concurrently by threads or asyncio.
+    """
+
+    in_process = False
+
+    def __call__(self, suites, result):
+        options = self.runner.config.options
+        concurrency = get_worker_concurrency(options)
+
+        if options.worker_mode == WorkerMode.ASYNCIO:
+            target = async_worker
+        else:
+            target = worker
+
+        # XXX: See MPRunPerformer
+        self.runner.config.plugins.prepareTestResult(result)
+
+        pool = WorkerPool(
+            result,
+            processes=options.async_suites,
+            split_suites=options.split_suites,
+            timing=self.runner.timing,
+            target=target,
+            target_args=(concurrency, ),
+            release_timeout=options.multiprocessing_timeout,
+            warm_template=options.warm_template,
+        )
+        pool.add_suites(self.longest_first(suites))
+
+        with terminate_processes(pool):
+            pool.run()
+
+        if options.worker_metrics:
+            pool.metrics.report(self.runner.stream, concurrency)
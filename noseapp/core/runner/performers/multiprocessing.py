@@ -2,20 +2,81 @@
 
 from __future__ import absolute_import
 
+import os
+import sys
+import time
+import errno
+import signal
+import struct
+import select
+import itertools
+import threading
+import traceback
+from inspect import isclass
+from collections import deque
+from collections import OrderedDict
 from contextlib import contextmanager
 from multiprocessing import cpu_count
+from multiprocessing import Process as _Process
 
-from noseapp.utils.common import waiting_for
+from nose.case import Test as NoseTestWrapper
+
+from noseapp.utils import pyv
+from noseapp.core import extensions
 from noseapp.core.suite.base import BaseSuite
 from noseapp.case.base import get_case_master_id
 from noseapp.utils.common import TimeoutException
+from noseapp.core.runner.base import RemoteError
 from noseapp.core.runner.base import RunPerformer
+from noseapp.core.suite.base import AddressIndex
+from noseapp.core.suite.base import get_address
+from noseapp.core.suite.base import get_test_position
 from noseapp.core.suite.base import get_suite_master_id
 
 
 DEFAULT_RELEASE_TIMEOUT = 180  # default timeout for release processes list
 DEFAULT_MAX_PROCESSES = cpu_count()  # default max processes num to run in a moment
 
+# Number of workers which can lose one work item
+# before the item will be reported as error
+DEFAULT_ITEM_ATTEMPTS = 3
+
+
+try:
+    from multiprocessing.connection import wait as _wait_handles
+except ImportError:  # python 2
+    _wait_handles = None
+
+
+# Outcome codes of result record
+START_TEST = 1
+STOP_TEST = 2
+SUCCESS = 3
+ERROR = 4
+FAILURE = 5
+SKIP = 6
+EXPECTED_FAILURE = 7
+UNEXPECTED_SUCCESS = 8
+
+OUTCOME_TO_METHOD = {
+    START_TEST: 'startTest',
+    STOP_TEST: 'stopTest',
+    SUCCESS: 'addSuccess',
+    ERROR: 'addError',
+    FAILURE: 'addFailure',
+    SKIP: 'addSkip',
+    EXPECTED_FAILURE: 'addExpectedFailure',
+    UNEXPECTED_SUCCESS: 'addUnexpectedSuccess',
+}
+
+ERROR_OUTCOMES = (ERROR, FAILURE, EXPECTED_FAILURE)
+
+# Header of result record:
+# outcome code, master id, position of lazy test,
+# length of exception class path, length of message, length of traceback.
+# Blob of utf-8 text is following after header.
+RECORD_HEADER = struct.Struct('!BQIHII')
+
 
 @contextmanager
 def terminate_processes(runner):
@@ -23,78 +84,821 @@ def terminate_processes(runner):
     Do something with runner and
     terminate processes after this
 
-    :type runner: MPSuiteRunner
+    :type runner: MasterProcess or WorkerPool
     """
     try:
         yield
     finally:
         runner.terminate()
         runner.join()
+        runner.stop_template()
+        runner.mp_result.clear()
+
+
+class SentinelProcess(_Process):
+    """
+    Process with sentinel attribute for python 2.
+    Sentinel is file descriptor which will be ready
+    for reading when process will be finished.
+    """
+
+    if pyv.IS_PYTHON_2:
+
+        _sentinel = None
+
+        @property
+        def sentinel(self):
+            return self._sentinel
+
+        def start(self):
+            import fcntl
+
+            read_fd, write_fd = os.pipe()
+            # Write end must not be leaked to programs executed from tests
+            fcntl.fcntl(write_fd, fcntl.F_SETFD, fcntl.FD_CLOEXEC)
+
+            try:
+                super(SentinelProcess, self).start()
+            finally:
+                # Child process holds write end until exit
+                os.close(write_fd)
+
+            self._sentinel = read_fd
+
+        def join(self, timeout=None):
+            super(SentinelProcess, self).join(timeout=timeout)
+
+            if self._sentinel is not None and self.exitcode is not None:
+                os.close(self._sentinel)
+                self._sentinel = None
+
+
+def wait_handles(handles, timeout=None):
+    """
+    Wait for readiness of process sentinels or connections.
+    Return list of ready handles.
+
+    :param handles: sentinels or connection objects
+    :param timeout: number of seconds or None for infinity waiting
+
+    :rtype: list
+    """
+    if not handles:
+        return []
+
+    if _wait_handles is not None:
+        return _wait_handles(handles, timeout)
+
+    while True:
+        try:
+            ready, _, _ = select.select(handles, [], [], timeout)
+            return ready
+        except select.error as e:
+            if e.args[0] != errno.EINTR:
+                raise
+
+
+def get_fork_process_class():
+    """
+    Class of process which is started by fork
+    regardless of default start method
+    """
+    try:
+        from multiprocessing import get_context
+    except ImportError:  # python 2
+        return SentinelProcess
+
+    return get_context('fork').Process
+
+
+def make_connection(fd, readable, writable):
+    """
+    Create connection object from file descriptor
+    """
+    if pyv.IS_PYTHON_2:
+        from _multiprocessing import Connection
+    else:
+        from multiprocessing.connection import Connection
+
+    return Connection(fd, readable=readable, writable=writable)
+
+
+class TemplateProcess(object):
+    """
+    Process which was forked by warm template.
+    It has interface of SentinelProcess for process stack.
+    """
+
+    counter = itertools.count(1)
+
+    def __init__(self, template, target, args):
+        self.template = template
+        self.target = target
+        self.args = args
+
+        self.pid = None
+        self.name = 'TemplateProcess-{}'.format(next(self.counter))
+        # Will be -1 after join if process was finished without exit code
+        self.exitcode = None
+
+        self._sentinel = None
+
+    @property
+    def sentinel(self):
+        return self._sentinel
+
+    def start(self):
+        self.pid, self._sentinel = self.template.fork(self.target, self.args)
+
+    def is_alive(self):
+        if self._sentinel is None:
+            return False
+
+        return not wait_handles([self._sentinel], timeout=0)
+
+    def terminate(self):
+        if not self.is_alive():
+            return
+
+        try:
+            os.kill(self.pid, signal.SIGTERM)
+        except OSError as e:
+            if e.errno != errno.ESRCH:
+                raise
+
+    def join(self, timeout=None):
+        if self._sentinel is None:
+            return
+
+        if wait_handles([self._sentinel], timeout=timeout):
+            # Forked process writes exit code before exit.
+            # Nothing is written if it was killed or called os._exit.
+            status = os.read(self._sentinel, 1)
+            os.close(self._sentinel)
+
+            self._sentinel = None
+            self.exitcode = ord(status) if status else -1
+
+
+class WarmTemplate(object):
+    """
+    Process which was forked after loading of application and build of suites.
+    Worker processes are forked from it on demand, so they get imported
+    modules, suites and extensions without import and pickling.
+
+    Arguments of worker are sent to template as ids of inherited objects,
+    connections are sent as file descriptors.
+
+    Usage:
+
+        >>> template = WarmTemplate([suites, result])
+        >>> template.start()
+        >>> process = template.process(target=worker, args=(suites, connection, channel))
+        >>> process.start()
+        >>> template.stop()
+    """
+
+    def __init__(self, objects):
+        """
+        :param objects: objects which can be arguments of worker processes
+        """
+        # Id of object in master process -> object.
+        # Ids are the same in template because it's forked.
+        self.objects = dict((id(o), o) for o in objects)
+
+        # Template process
+        self.server = None
+        # Connection for requests to template process
+        self.connection = None
+
+    def start(self):
+        from multiprocessing import Pipe
+
+        self.connection, template_end = Pipe()
+
+        self.server = get_fork_process_class()(
+            target=self.serve,
+            args=(template_end, ),
+        )
+        self.server.daemon = True
+        self.server.start()
+        # Template process holds its end until exit
+        template_end.close()
+
+    def stop(self):
+        if self.server is None:
+            return
+
+        try:
+            self.connection.send(None)
+        except (EOFError, IOError):
+            self.server.terminate()
+
+        self.server.join()
+        self.connection.close()
+
+        self.server = None
+        self.connection = None
+
+    def process(self, target, args):
+        """
+        Create process which will be forked by template.
+        Interface is the same as for process class.
+        """
+        return TemplateProcess(self, target, args)
+
+    def pack(self, obj, handles):
+        """
+        Pack argument of worker for template.
+        File descriptors are appended to handles.
+        """
+        if id(obj) in self.objects:
+            return 'object', id(obj)
+
+        if isinstance(obj, ResultChannel):
+            handles.append(obj.connection.fileno())
+            return 'channel', self.pack(obj.result, handles)
+
+        if hasattr(obj, 'recv_bytes'):
+            handles.append(obj.fileno())
+            return 'connection', obj.readable, obj.writable
+
+        return 'value', obj
+
+    def unpack(self, packed, handles):
+        """
+        Unpack argument of worker in forked process
+        """
+        kind = packed[0]
+
+        if kind == 'object':
+            return self.objects[packed[1]]
+
+        if kind == 'channel':
+            fd = handles.pop(0)
+            return ResultChannel(self.unpack(packed[1], handles), make_connection(fd, False, True))
+
+        if kind == 'connection':
+            return make_connection(handles.pop(0), packed[1], packed[2])
+
+        return packed[1]
+
+    def fork(self, target, args):
+        """
+        Fork worker process from template.
+        Returns pid and read end of sentinel pipe.
+        """
+        from multiprocessing.reduction import send_handle
+
+        handles = []
+        request = (
+            self.pack(target, handles),
+            [self.pack(a, handles) for a in args],
+        )
+
+        read_fd, write_fd = os.pipe()
+        handles.append(write_fd)
+
+        try:
+            self.connection.send((request, len(handles)))
+
+            for handle in handles:
+                send_handle(self.connection, handle, self.server.pid)
+
+            pid = self.connection.recv()
+        finally:
+            # Forked process holds write end until exit
+            os.close(write_fd)
+
+        return pid, read_fd
+
+    def serve(self, connection):
+        """
+        Loop of template process
+        """
+        from multiprocessing.reduction import recv_handle
+
+        # Forked processes will be reaped by system
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+        while True:
+            try:
+                message = connection.recv()
+            except (EOFError, IOError):
+                break
+
+            if message is None:
+                break
+
+            request, count = message
+            handles = [recv_handle(connection) for _ in range(count)]
+
+            pid = os.fork()
+
+            if pid == 0:
+                connection.close()
+                self.run_forked(request, handles)
+
+            for handle in handles:
+                os.close(handle)
+
+            connection.send(pid)
+
+    def run_forked(self, request, handles):
+        """
+        Run worker in forked process
+        """
+        import fcntl
+
+        exit_code = 0
+        sentinel = handles[-1]
+
+        try:
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+            # Write end of sentinel must not be leaked to programs executed from tests
+            fcntl.fcntl(sentinel, fcntl.F_SETFD, fcntl.FD_CLOEXEC)
+
+            target, args = request
+            target = self.unpack(target, handles)
+            args = [self.unpack(a, handles) for a in args]
 
+            target(*args)
+        except BaseException:
+            exit_code = 1
+            traceback.print_exc()
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except Exception:
+                    pass
 
-def get_master_id(obj):
+            # Master process can not wait for child of template
+            try:
+                os.write(sentinel, struct.pack('B', exit_code))
+            except OSError:
+                pass
+
+            os._exit(exit_code)
+
+
+def get_record_address(obj):
     """
-    Get id of master process
+    Get address of test or suite in master process.
+    Test of lazy suite has master id of suite and position
+    in the suite because master process has not instance of test.
+
+    :return: (master id, position)
+    :rtype: tuple
     """
     if isinstance(obj, BaseSuite):
-        return get_suite_master_id(obj)
-    return get_case_master_id(obj)
+        return get_suite_master_id(obj), 0
+
+    position = get_test_position(getattr(obj, 'test', obj))
+
+    if position is not None:
+        return position
+
+    return get_case_master_id(obj), 0
+
+
+def get_exc_class_path(cls):
+    """
+    Get path of exception class for search in master process
+    """
+    return '{}:{}'.format(cls.__module__, cls.__name__)
+
+
+def load_exc_class(path):
+    """
+    Find exception class by path in modules of current process.
+    Modules will not be imported. Return RemoteError if class is not found.
+
+    :param path: result of get_exc_class_path
+    """
+    module_name, class_name = path.split(':')
+    cls = getattr(sys.modules.get(module_name), class_name, None)
+
+    if isclass(cls) and issubclass(cls, BaseException):
+        return cls
+
+    return RemoteError
+
+
+def to_bytes(text):
+    """
+    Encode text for record blob
+    """
+    if isinstance(text, pyv.unicode):
+        return text.encode('utf-8', 'replace')
+    return text
+
+
+def from_bytes(data):
+    """
+    Decode text from record blob to native string
+    """
+    if pyv.IS_PYTHON_3:
+        return data.decode('utf-8', 'replace')
+    return data
+
+
+def pack_record(outcome, address, exc_class_path='', message='', traceback=''):
+    """
+    Pack result record to bytes
+
+    :param outcome: outcome code
+    :param address: result of get_record_address
+    :param exc_class_path: result of get_exc_class_path
+    :param message: message of exception or reason of skip
+    :param traceback: formatted traceback
+
+    :rtype: bytes
+    """
+    exc_class_path, message, traceback = map(
+        to_bytes, (exc_class_path, message, traceback),
+    )
 
+    return RECORD_HEADER.pack(
+        outcome, address[0], address[1], len(exc_class_path), len(message), len(traceback),
+    ) + exc_class_path + message + traceback
 
-def target(suite, mp_result):
+
+def unpack_record(data):
+    """
+    Unpack result record from bytes
+
+    :rtype: tuple
+    """
+    outcome, master_id, position, exc_class_len, message_len, traceback_len = RECORD_HEADER.unpack_from(data)
+
+    offset = RECORD_HEADER.size
+    exc_class_path = data[offset:offset + exc_class_len]
+
+    offset += exc_class_len
+    message = data[offset:offset + message_len]
+
+    offset += message_len
+    traceback = data[offset:offset + traceback_len]
+
+    return (
+        outcome,
+        (master_id, position),
+        from_bytes(exc_class_path),
+        from_bytes(message),
+        from_bytes(traceback),
+    )
+
+
+def run_process(target, *args):
+    """
+    Perform target in child process.
+    Instances of process scoped extensions are warmed up
+    before target and released after it.
+    """
+    try:
+        extensions.warm_up_process_scope()
+        target(*args)
+    finally:
+        extensions.release_process_scope()
+
+
+def target(index, address, channel):
     """
     Task to perform
+
+    :type index: noseapp.core.suite.base.AddressIndex
+    :param address: address of suite
     """
-    suite(mp_result)
-    mp_result.save_result()
+    index.find(address)(channel)
 
 
-class MPResult(object):
+def setup_suite(suite, result):
     """
-    Sync result between processes
+    Setup context of suite without running of tests.
+    Return False if setup was failed.
+
+    :type suite: noseapp.core.suite.base.BaseSuite
     """
+    try:
+        suite.setUp()
+    except KeyboardInterrupt:
+        raise
+    except:
+        suite.error_context = 'setup'
+        result.addError(suite, suite._exc_info())
+        suite.release_extensions()
+        return False
 
-    MATCH = {}  # id -> instance
+    return True
 
-    def __init__(self, result):
-        from multiprocessing import Manager
 
-        # Test result instance
+def teardown_suite(suite, result):
+    """
+    Teardown context of suite which was set up by setup_suite
+
+    :type suite: noseapp.core.suite.base.BaseSuite
+    """
+    suite.has_run = True
+
+    try:
+        suite.tearDown()
+    except KeyboardInterrupt:
+        raise
+    except:
+        suite.error_context = 'teardown'
+        result.addError(suite, suite._exc_info())
+
+
+def worker(index, connection, channel):
+    """
+    Task of long-lived process.
+    Request work item from master process and perform
+    it while None will not be received.
+
+    Suite context will be set up with first case of suite
+    and torn down when master process will release it.
+
+    :param index: index of suites. Will be inherited by fork.
+    :type index: noseapp.core.suite.base.AddressIndex
+    :param connection: duplex connection to master process
+    :type channel: ResultChannel
+    """
+    opened = OrderedDict()  # suite address -> setup was successful
+
+    def release(addresses):
+        for address in addresses:
+            if address in opened:
+                del opened[address]
+                teardown_suite(index.find(address), channel)
+
+    try:
+        while True:
+            connection.send(None)
+            item = connection.recv()
+
+            if item is None:
+                break
+
+            (suite_address, case_address), to_release = item
+            release(to_release)
+
+            if case_address is None:
+                index.find(suite_address)(channel)
+                continue
+
+            if suite_address not in opened:
+                opened[suite_address] = setup_suite(index.find(suite_address), channel)
+
+            if opened[suite_address]:
+                index.find(case_address).run(channel)
+    finally:
+        release(list(opened))
+
+
+class WorkScheduler(object):
+    """
+    Give work items to workers.
+
+    Work item is tuple of suite address and case address.
+    Case address is None if suite will be performed entirely.
+    Addresses do not depend on process, see noseapp.core.suite.base.get_address
+
+    Worker gets cases of suite which it has set up already.
+    If there are no those, worker gets cases of not started suite.
+    Else worker steals cases from end of suite with most pending cases.
+    """
+
+    def __init__(self, suites, split_suites=False, timing=None):
+        """
+        :param suites: suites list
+        :param split_suites: give cases of suite as work items
+        :param timing: durations of previous runs to sort cases
+        :type timing: noseapp.core.timing.TimingDatabase
+        """
+        # suite address -> pending case addresses
+        self.pending = OrderedDict()
+        # worker -> addresses of suites were given to worker
+        self.opened = {}
+        # addresses of suites were given to any worker
+        self.started = set()
+
+        for suite in suites:
+            if split_suites:
+                cases = list(suite.tests)
+
+                if timing is not None:
+                    cases = timing.longest_first(cases)
+
+                cases = deque(get_address(c) for c in cases)
+            else:
+                cases = deque([None])
+
+            if cases:
+                self.pending[get_address(suite)] = cases
+
+    def __len__(self):
+        return sum(len(cases) for cases in self.pending.values())
+
+    def find_suite(self, opened):
+        """
+        Find address of suite to give case from it
+        """
+        for address in opened:
+            if address in self.pending:
+                return address
+
+        for address in self.pending:
+            if address not in self.started:
+                return address
+
+        if self.pending:
+            return max(self.pending, key=lambda a: len(self.pending[a]))
+
+        return None
+
+    def next_item(self, worker):
+        """
+        Get work item for worker.
+        Returns tuple of work item and addresses of
+        suites which can be released by worker or None.
+
+        :param worker: any hashable object
+        """
+        opened = self.opened.setdefault(worker, [])
+        address = self.find_suite(opened)
+
+        if address is None:
+            return None
+
+        cases = self.pending[address]
+
+        if address in opened or address not in self.started:
+            case = cases.popleft()
+        else:
+            case = cases.pop()
+
+        if not cases:
+            del self.pending[address]
+
+        if address not in opened:
+            opened.append(address)
+        self.started.add(address)
+
+        to_release = [a for a in opened if a != address and a not in self.pending]
+
+        for a in to_release:
+            opened.remove(a)
+
+        return (address, case), to_release
+
+    def requeue(self, worker, item):
+        """
+        Return work item of worker which was lost.
+        Suites which were given to worker are forgotten.
+
+        :param item: work item from next_item
+        """
+        self.opened.pop(worker, None)
+
+        address, case = item
+        self.pending.setdefault(address, deque()).appendleft(case)
+
+        # Suite is not performed by any worker now
+        if not [o for o in self.opened.values() if address in o]:
+            self.started.discard(address)
+
+
+class ResultChannel(object):
+    """
+    Result of child process.
+    Events of test result will be sent to master process at once.
+    """
+
+    def __init__(self, result, connection):
+        # Copy of test result instance from master process
         self.result = result
+        # Write end of pipe
+        self.connection = connection
+        self.lock = threading.Lock()
 
-        # Result queue
-        self.queue = Manager().Queue()
+        self.__successful = True
 
     def __getattr__(self, item):
         return getattr(self.result, item)
 
-    @staticmethod
-    def pack_result_storage(storage):
+    def send(self, outcome, test, *args):
         """
-        Pack result from storage
+        Send record to master process
+
+        :param outcome: outcome code
+        :param test: test or suite instance
+        :param args: exc class path, message, traceback
         """
-        return [(get_master_id(s[0]), s[1]) for s in storage]
+        record = pack_record(outcome, get_record_address(test), *args)
+
+        # Tests can be run by threads of process
+        with self.lock:
+            self.connection.send_bytes(record)
 
-    def unpack_result_storage(self, storage):
+    def pack_err(self, err, test):
         """
-        Unpack result from storage
+        Convert exc info to record fields
         """
-        unpack_storage = []
+        ec, ev, tb = err
 
-        for master_id, message in storage:
-            unpack_storage.append(
-                (self.MATCH[master_id], message),
-            )
+        return (
+            get_exc_class_path(ec) if isclass(ec) else get_exc_class_path(RemoteError),
+            RemoteError.get_message(ev),
+            self.result._exc_info_to_string(err, test),
+        )
+
+    def startTest(self, test):
+        self.send(START_TEST, test)
+
+    def stopTest(self, test):
+        self.send(STOP_TEST, test)
+
+    def addSuccess(self, test):
+        self.send(SUCCESS, test)
+
+    def addError(self, test, err):
+        self.__successful = False
+        self.send(ERROR, test, *self.pack_err(err, test))
+
+    def addFailure(self, test, err):
+        self.__successful = False
+        self.send(FAILURE, test, *self.pack_err(err, test))
 
-        return unpack_storage
+    def addSkip(self, test, reason):
+        self.send(SKIP, test, '', RemoteError.get_message(reason))
+
+    def addExpectedFailure(self, test, err):
+        self.send(EXPECTED_FAILURE, test, *self.pack_err(err, test))
+
+    def addUnexpectedSuccess(self, test):
+        self.__successful = False
+        self.send(UNEXPECTED_SUCCESS, test)
+
+    def wasSuccessful(self):
+        return self.__successful
+
+
+class ProcessTests(object):
+    """
+    Tests which were started by child process.
+    Tests which were not stopped will be reported
+    as errors if process will be lost.
+    """
+
+    def __init__(self):
+        # Number of tests which were started
+        self.started = 0
+        # Record address -> None, tests which are running
+        self.running = OrderedDict()
+
+    def update(self, outcome, address):
+        """
+        Update by applied record
+        """
+        if outcome == START_TEST:
+            self.started += 1
+            self.running[address] = None
+        elif outcome == STOP_TEST:
+            self.running.pop(address, None)
+
+
+class MPResult(object):
+    """
+    Sync result between processes.
+    Master process receives events from channels of
+    child processes and applies their to test result.
+    """
+
+    def __init__(self, result):
+        # Test result instance
+        self.result = result
+        # Master id -> suite or test instance of current run
+        self.MATCH = {}
+        # Address -> test of lazy suite which was started
+        self.running = {}
+
+    def __getattr__(self, item):
+        return getattr(self.result, item)
 
     def match(self, suite):
         """
-        Match id of master process to instance
+        Match id of master process to instance.
+        Tests of lazy suites are not matched, they will be
+        created by address when records will be received.
         """
         self.MATCH[get_suite_master_id(suite)] = suite
 
         def match(s):
+            if s.lazy_tests is not None:
+                return
+
             for o in s:
                 if isinstance(o, BaseSuite):
                     self.MATCH[get_suite_master_id(o)] = o
@@ -104,36 +908,300 @@ class MPResult(object):
 
         match(suite)
 
-    def save_result(self):
+    def clear(self):
+        """
+        Release instances of current run
+        """
+        self.MATCH.clear()
+        self.running.clear()
+
+    def get_test(self, outcome, address):
+        """
+        Get test or suite instance by address
+        """
+        master_id, position = address
+
+        if not position:
+            return self.MATCH[master_id]
+
+        if outcome == STOP_TEST:
+            test = self.running.pop(address, None)
+        else:
+            test = self.running.get(address)
+
+        if test is None:
+            suite = self.MATCH[master_id]
+            test = NoseTestWrapper(
+                suite.lazy_tests.make(position - 1),
+                config=suite.config,
+                resultProxy=suite.resultProxy,
+            )
+
+            if outcome != STOP_TEST:
+                self.running[address] = test
+
+        return test
+
+    def channel(self):
+        """
+        Create pipe for child process.
+        Returns tuple of read connection for
+        master process and result channel for child process.
+        """
+        from multiprocessing import Pipe
+
+        reader, writer = Pipe(duplex=False)
+
+        return reader, ResultChannel(self.result, writer)
+
+    def apply(self, record):
+        """
+        Apply record from channel to test result.
+        Returns outcome code and address of record.
+        """
+        record = unpack_record(record)
+        self.apply_outcome(*record)
+
+        return record[:2]
+
+    def apply_outcome(self, outcome, address, exc_class_path='', message='', traceback=''):
+        """
+        Apply fields of record to test result.
+        Returns test or suite instance of record.
+
+        :param address: result of get_record_address
+        """
+        test = self.get_test(outcome, address)
+        method = getattr(self.result, OUTCOME_TO_METHOD[outcome])
+
+        if outcome in ERROR_OUTCOMES:
+            method(
+                test,
+                (load_exc_class(exc_class_path), RemoteError(message, traceback), None),
+            )
+        elif outcome == SKIP:
+            method(test, message)
+        else:
+            method(test)
+
+        return test
+
+    def apply_error(self, address, message):
+        """
+        Apply error which was not raised in child process,
+        e.g. process was lost while test was running
+
+        :param address: result of get_record_address
+        """
+        self.apply_outcome(
+            ERROR, address, get_exc_class_path(RemoteError), message, message,
+        )
+
+    def receive(self, reader, tests=None):
         """
-        Save result in queue
+        Apply all received records from read connection.
+        Return False if channel was closed else True.
+
+        :type tests: ProcessTests
         """
-        self.queue.put(
-            (
-                (
-                    self.pack_result_storage(self.result.errors),
-                    self.pack_result_storage(self.result.skipped),
-                    self.pack_result_storage(self.result.failures),
+        try:
+            while reader.poll():
+                outcome, address = self.apply(reader.recv_bytes())
+
+                if tests is not None:
+                    tests.update(outcome, address)
+        except (EOFError, IOError):
+            return False
+
+        return True
+
+
+class ProcessStack(object):
+    """
+    Base class for run processes with result channels
+    """
+
+    def __init__(self, result, release_timeout=DEFAULT_RELEASE_TIMEOUT, warm_template=False):
+        # Timeout for release stack
+        self.release_timeout = release_timeout
+
+        # Run processes stack
+        self.stack = []
+        # Process -> read connection of result channel
+        self.readers = {}
+        # Process -> connection for requests of process
+        self.requests = {}
+        # Process -> tests which were started by process
+        self.tests = {}
+        # Processes were terminated by master process
+        self.terminated = False
+
+        # Class for create process. Suites are inherited
+        # by fork, they can't be pickled for spawn.
+        self.process_class = get_fork_process_class()
+
+        # Fork processes from warm template process
+        self.warm_template = warm_template
+        # Will be created before run
+        self.template = None
+
+        # Result wrapper for sync
+        self.mp_result = MPResult(result)
+
+    def start_template(self, objects):
+        """
+        Start warm template process.
+        Processes will be forked from it instead of current process.
+
+        :param objects: objects which are arguments of processes
+        """
+        extensions.wait_warm_up()
+
+        self.template = WarmTemplate([self.mp_result.result] + list(objects))
+        self.template.start()
+
+        self.process_class = self.template.process
+
+    def stop_template(self):
+        if self.template is not None:
+            self.template.stop()
+            self.template = None
+            self.process_class = get_fork_process_class()
+
+    def start_process(self, target, args):
+        """
+        Start process and push it to stack.
+        Result channel will be last argument of target.
+        """
+        extensions.wait_warm_up()
+
+        reader, channel = self.mp_result.channel()
+        process = self.process_class(
+            target=run_process,
+            args=(target, ) + tuple(args) + (channel, ),
+        )
+        process.start()
+        # Child process holds write end until exit
+        channel.connection.close()
+
+        self.readers[process] = reader
+        self.tests[process] = ProcessTests()
+        self.stack.append(process)
+
+        return process
+
+    def receive(self, process):
+        """
+        Apply received records of process.
+        Return False if channel was closed else True.
+        """
+        return self.mp_result.receive(self.readers[process], self.tests[process])
+
+    def release(self, process):
+        """
+        Receive last events of finished process and remove it from stack
+        """
+        self.receive(process)
+        self.readers.pop(process).close()
+
+        if process in self.requests:
+            self.requests.pop(process).close()
+
+        process.join(self.release_timeout)
+
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+        self.stack.remove(process)
+        tests = self.tests.pop(process)
+
+        if process.exitcode != 0:
+            self.lost(process, tests)
+
+    def lost(self, process, tests):
+        """
+        Report tests which were running by process
+        when it was finished with error or killed.
+
+        :type tests: ProcessTests
+        """
+        for address in tests.running:
+            self.mp_result.apply_error(
+                address,
+                'Process "{}" exited with code {} while test was running'.format(
+                    process.name, process.exitcode,
                 ),
-                self.result.testsRun,
+            )
+            self.mp_result.apply_outcome(STOP_TEST, address)
+
+    def report_lost(self, process, address):
+        """
+        Report error of suite or test case which
+        was not completed by lost process
+
+        :param address: address of suite or test case
+        """
+        self.mp_result.apply_error(
+            get_record_address(self.index.find(address)),
+            'Process "{}" exited with code {} before "{}" was completed'.format(
+                process.name, process.exitcode, address,
             ),
         )
 
-    def make_result(self):
+    def handle_request(self, process, connection):
         """
-        Merge result from queue to result instance
+        Reply to request of process.
+        Return False if connection was closed else True.
+
+        Requests are ignored by base class: connection is closed,
+        process will get EOFError if it sends request.
         """
-        while not self.queue.empty():
-            (errors, skipped, failures), run_tests = self.queue.get()
+        self.requests.pop(process).close()
+        return True
 
-            self.result.errors.extend(self.unpack_result_storage(errors))
-            self.result.skipped.extend(self.unpack_result_storage(skipped))
-            self.result.failures.extend(self.unpack_result_storage(failures))
+    def try_release(self, timeout=0):
+        """
+        Receive events and requests from processes in stack.
+        Finished processes will be removed from stack.
+        Return False if there were no events else True.
+
+        :param timeout: number of seconds for waiting
+        """
+        sentinels = dict((p.sentinel, p) for p in self.stack)
+        readers = dict((r, p) for p, r in self.readers.items())
+        requests = dict((c, p) for p, c in self.requests.items())
+
+        handles = list(sentinels) + list(readers) + list(requests)
+        ready = wait_handles(handles, timeout=timeout)
 
-            self.result.testsRun += run_tests
+        for handle in ready:
+            if handle in readers:
+                process = readers[handle]
+                is_open = process in self.readers and self.receive(process)
+            elif handle in requests:
+                process = requests[handle]
+                is_open = process not in self.readers or self.handle_request(process, handle)
+            else:
+                process = sentinels[handle]
+                is_open = False
 
+            if not is_open and process in self.readers:
+                self.release(process)
 
-class MasterProcess(object):
+        return bool(ready)
+
+    def terminate(self):
+        """
+        Terminate processes from stack
+        """
+        self.terminated = True
+
+        for process in self.stack:
+            process.terminate()
+
+
+class MasterProcess(ProcessStack):
     """
     Run suites with multiprocessing
     """
@@ -141,37 +1209,37 @@ class MasterProcess(object):
     def __init__(self,
                  result,
                  max_processes=DEFAULT_MAX_PROCESSES,
-                 release_timeout=DEFAULT_RELEASE_TIMEOUT):
-        from multiprocessing import Process
+                 release_timeout=DEFAULT_RELEASE_TIMEOUT,
+                 warm_template=False):
+        super(MasterProcess, self).__init__(
+            result, release_timeout=release_timeout, warm_template=warm_template,
+        )
 
-        # Timeout for release stack
-        self.release_timeout = release_timeout
         # Max processes to run
         self.max_processes = max_processes if max_processes > 0 else DEFAULT_MAX_PROCESSES
 
-        # Tasks queue
-        self.queue = []
-        # Run processes stack
-        self.stack = []
-
-        # Class for create process
-        self.process_class = Process
-
-        # Result wrapper for sync
-        self.mp_result = MPResult(result)
+        # Addresses of suites to run
+        self.queue = deque()
+        # Suites by address. Processes will get it by fork.
+        self.index = AddressIndex()
+        # Process -> address of suite
+        self.addresses = {}
 
     def add_suite(self, suite):
         """
         Add suite to run
         """
         self.mp_result.match(suite)
+        self.index.add(suite)
+        self.queue.append(get_address(suite))
 
-        self.queue.append(
-            self.process_class(
-                target=target,
-                args=(suite, self.mp_result),
-            ),
-        )
+    def release(self, process):
+        super(MasterProcess, self).release(process)
+        self.addresses.pop(process, None)
+
+    def lost(self, process, tests):
+        super(MasterProcess, self).lost(process, tests)
+        self.report_lost(process, self.addresses[process])
 
     def add_suites(self, suites):
         """
@@ -180,16 +1248,6 @@ class MasterProcess(object):
         for suite in suites:
             self.add_suite(suite)
 
-    def try_release(self):
-        """
-        Find not alive processes in stack and remove their
-        """
-        for process in self.stack:
-            if not process.is_alive():
-                process.terminate()
-                process.join()
-                self.stack.remove(process)
-
     def is_release(self):
         """
         Will be True if free place in stack else False
@@ -199,45 +1257,275 @@ class MasterProcess(object):
 
     def wait_release(self):
         """
-        To wait free place in stack
+        To wait free place in stack.
+        Master process is sleeping while result events
+        will not be sent or one of processes will not be finished.
         """
-        try:
-            waiting_for(self.is_release, timeout=self.release_timeout, sleep=0.001)
-        except TimeoutException:
-            raise TimeoutException(
-                'Process list have not been release for "{}" sec.'.format(self.release_timeout),
-            )
+        deadline = time.time() + self.release_timeout
 
-    def terminate(self):
-        """
-        Terminate processes from stack
-        """
-        for process in self.stack:
-            process.terminate()
+        while len(self.stack) >= self.max_processes:
+            timeout = deadline - time.time()
+
+            if timeout <= 0:
+                raise TimeoutException(
+                    'Process list have not been release for "{}" sec.'.format(self.release_timeout),
+                )
+
+            self.try_release(timeout=timeout)
 
     def join(self):
         """
         Join processes from stack
         """
-        for process in self.stack:
-            process.join(timeout=self.release_timeout)
+        deadline = time.time() + self.release_timeout
+
+        while self.stack and time.time() < deadline:
+            self.try_release(timeout=deadline - time.time())
 
     def run(self):
         """
         Run suites
         """
+        if self.warm_template:
+            self.start_template([self.index])
+
         while self.queue:
-            process = self.queue.pop()
-            process.start()
-            self.stack.append(process)
+            address = self.queue.popleft()
+            process = self.start_process(target, (self.index, address))
+
+            self.addresses[process] = address
             self.wait_release()
 
         self.join()
-        self.mp_result.make_result()
+
+
+class WorkerMetrics(object):
+    """
+    Queue depth of worker processes.
+    Depth is number of work items which are running in worker.
+    Worker sends its depth and mean depth with each request.
+    """
+
+    def __init__(self):
+        # Name of worker -> [items, peak depth, mean depth]
+        self.workers = OrderedDict()
+
+    def add(self, worker, depth, mean_depth, given):
+        """
+        Save metrics from request of worker
+
+        :param worker: process instance
+        :param depth: number of running items
+        :param mean_depth: time-weighted mean of depth from start of worker
+        :param given: item was given to worker
+        """
+        items, peak, _ = self.workers.get(worker.name, (0, 0, 0.0))
+
+        if given:
+            items += 1
+            depth += 1
+
+        self.workers[worker.name] = [items, max(peak, depth), mean_depth]
+
+    def report(self, stream, concurrency):
+        """
+        Write metrics to stream
+
+        :param concurrency: max depth of worker
+        """
+        stream.writeln('Worker metrics (concurrency {}):'.format(concurrency))
+
+        for name, (items, peak, mean_depth) in self.workers.items():
+            stream.writeln(
+                '{}: items={}, peak depth={}, mean depth={:.2f}, saturation={:.0f}%'.format(
+                    name, items, peak, mean_depth, 100.0 * mean_depth / concurrency,
+                ),
+            )
+
+
+class WorkerPool(ProcessStack):
+    """
+    Run suites with pool of long-lived processes.
+    Work items will be given to processes by address
+    of suite, suite instances are not pickled.
+
+    If worker process is lost, its items which have no started
+    tests are given to another worker, other items are reported
+    as errors. New worker is started while there are pending items.
+    """
+
+    def __init__(self,
+                 result,
+                 processes=DEFAULT_MAX_PROCESSES,
+                 split_suites=False,
+                 timing=None,
+                 target=worker,
+                 target_args=(),
+                 release_timeout=DEFAULT_RELEASE_TIMEOUT,
+                 warm_template=False,
+                 item_attempts=DEFAULT_ITEM_ATTEMPTS):
+        super(WorkerPool, self).__init__(
+            result, release_timeout=release_timeout, warm_template=warm_template,
+        )
+
+        # Durations of previous runs
+        self.timing = timing
+        # Number of worker processes
+        self.processes = processes if processes > 0 else DEFAULT_MAX_PROCESSES
+        # Give cases of suite to different processes
+        self.split_suites = split_suites
+
+        # Task of worker process and its extra arguments
+        self.target = target
+        self.target_args = target_args
+
+        # Suites storage
+        self.suites = []
+        # Suites by address. Workers will get it by fork.
+        self.index = AddressIndex()
+        # Will be created before run
+        self.scheduler = None
+        # Queue depth of workers which report it
+        self.metrics = WorkerMetrics()
+
+        # Number of workers which can lose one work item
+        self.item_attempts = item_attempts
+        # Process -> work item -> number of tests which
+        # were started by process before the item was given
+        self.items = {}
+        # Work item -> number of workers which lost it
+        self.lost_items = {}
+
+    def add_suite(self, suite):
+        """
+        Add suite to run
+        """
+        self.mp_result.match(suite)
+        self.index.add(suite)
+        self.suites.append(suite)
+
+    def add_suites(self, suites):
+        """
+        Add suites to run. For usability only.
+        """
+        for suite in suites:
+            self.add_suite(suite)
+
+    def start_worker(self):
+        """
+        Start worker process with connection for requests
+        """
+        from multiprocessing import Pipe
+
+        master_end, worker_end = Pipe()
+
+        process = self.start_process(
+            self.target, (self.index, worker_end) + tuple(self.target_args),
+        )
+        # Worker process holds its end until exit
+        worker_end.close()
+
+        self.requests[process] = master_end
+        self.items[process] = OrderedDict()
+
+    def handle_request(self, process, connection):
+        """
+        Give next work item to worker.
+
+        Request of worker is None if it finished previous item
+        or tuple of depth, mean depth and finished items
+        if worker is running items concurrently.
+        """
+        try:
+            request = connection.recv()
+        except (EOFError, IOError):
+            return False
+
+        # Records of finished items were sent before request
+        self.receive(process)
+
+        items = self.items[process]
+
+        if request is None:
+            items.clear()
+        else:
+            for item in request[2]:
+                items.pop(tuple(item), None)
+
+        if self.mp_result.shouldStop:
+            item = None
+        else:
+            item = self.scheduler.next_item(process)
+
+        connection.send(item)
+
+        if item is not None:
+            items[item[0]] = self.tests[process].started
+
+        if request is not None:
+            self.metrics.add(process, request[0], request[1], item is not None)
+
+        return True
+
+    def lost(self, process, tests):
+        """
+        Give items of lost worker to another worker
+        or report them and start new worker
+        """
+        super(WorkerPool, self).lost(process, tests)
+
+        for item, started in self.items.pop(process).items():
+            attempts = self.lost_items[item] = self.lost_items.get(item, 0) + 1
+
+            # Results of item would be duplicated
+            # if its tests are run again
+            if self.terminated or tests.started > started or attempts >= self.item_attempts:
+                self.report_lost(process, item[1] or item[0])
+            else:
+                self.scheduler.requeue(process, item)
+
+        if not self.terminated and not self.mp_result.shouldStop and len(self.scheduler):
+            self.start_worker()
+
+    def release(self, process):
+        super(WorkerPool, self).release(process)
+        self.items.pop(process, None)
+
+    def join(self):
+        """
+        Receive events from workers while they are working
+        """
+        while self.stack:
+            if not self.try_release(timeout=self.release_timeout):
+                raise TimeoutException(
+                    'There were no events from worker processes for "{}" sec.'.format(
+                        self.release_timeout,
+                    ),
+                )
+
+    def run(self):
+        """
+        Run suites
+        """
+        self.scheduler = WorkScheduler(
+            self.suites,
+            split_suites=self.split_suites,
+            timing=self.timing,
+        )
+
+        if self.warm_template:
+            self.start_template([self.index])
+
+        for _ in range(min(self.processes, len(self.scheduler))):
+            self.start_worker()
+
+        self.join()
 
 
 class MPRunPerformer(RunPerformer):
 
+    in_process = False
+
     def __call__(self, suites, result):
         max_size = self.runner.config.options.async_suites
         timeout = self.runner.config.options.multiprocessing_timeout
@@ -252,8 +1540,33 @@ class MPRunPerformer(RunPerformer):
             result,
             max_processes=max_size,
             release_timeout=timeout,
+            warm_template=self.runner.config.options.warm_template,
         )
-        process.add_suites(suites)
+        process.add_suites(self.longest_first(suites))
 
         with terminate_processes(process):
                 process.run()
+
+
+class MPPoolRunPerformer(RunPerformer):
+
+    in_process = False
+
+    def __call__(self, suites, result):
+        processes = self.runner.config.options.async_suites
+
+        # XXX: See MPRunPerformer
+        self.runner.config.plugins.prepareTestResult(result)
+
+        pool = WorkerPool(
+            result,
+            processes=processes,
+            split_suites=self.runner.config.options.split_suites,
+            timing=self.runner.timing,
+            release_timeout=self.runner.config.options.multiprocessing_timeout,
+            warm_template=self.runner.config.options.warm_template,
+        )
+        pool.add_suites(self.longest_first(suites))
+
+        with terminate_processes(pool):
+            pool.run()
@@ -3,26 +3,50 @@
 from __future__ import absolute_import
 
 from multiprocessing import cpu_count
-from multiprocessing.pool import ThreadPool
 
+from noseapp.core.executor import BoundedExecutor
 from noseapp.core.runner.base import RunPerformer
 
 
+def get_max_threads(options):
+    """
+    Get total number of threads for suites and tests
+    """
+    if options.max_threads > 0:
+        return options.max_threads
+
+    suites = options.async_suites if options.async_suites > 0 else cpu_count()
+
+    return suites * max(options.async_tests, 1)
+
+
 class ThreadingRunPerformer(RunPerformer):
     """
-    Run tests with multiprocessing.pool.ThreadPool
+    Run suites and tests with noseapp.core.executor.BoundedExecutor
     """
 
     def __call__(self, suites, result):
-        size = self.runner.config.options.async_suites
+        options = self.runner.config.options
+        size = options.async_suites
 
         if size <= 0:
             size = cpu_count()
 
-        pool = ThreadPool(size)
+        executor = BoundedExecutor(
+            get_max_threads(options),
+            queue_size=options.threads_queue_size,
+        )
+        tasks = []
+
+        try:
+            for suite in self.longest_first(suites):
+                tasks = [t for t in tasks if not t.done()]
+
+                if len(tasks) >= size:
+                    executor.wait(tasks, count=len(tasks) - size + 1)
 
-        for suite in suites:
-            pool.apply_async(suite, args=(result,))
+                tasks.append(executor.submit(suite, result, executor=executor))
 
-        pool.close()
-        pool.join()
+            executor.wait(tasks)
+        finally:
+            executor.shutdown()
@@ -3,6 +3,10 @@
 import sys
 
 from nose.suite import ContextSuite
+from nose.case import Test as NoseTestWrapper
+
+from noseapp.utils import pyv
+from noseapp.core import extensions
 
 
 def get_suite_master_id(suite):
@@ -12,6 +16,180 @@ def get_suite_master_id(suite):
     return suite._BaseSuite__master_id
 
 
+def get_test_position(test):
+    """
+    Get position of test in lazy tests of suite.
+    Returns tuple of master id of suite and number of test
+    starting with 1 or None if test was not created by LazyTests.
+    """
+    return getattr(test, '__position__', None)
+
+
+def make_address(suite_name, case_name=None, method_name=None):
+    """
+    Make address of suite, test case or test.
+    Address has the same format as -t option: suite:Case.method
+    """
+    address = suite_name
+
+    if case_name:
+        address = '{}:{}'.format(address, case_name)
+
+        if method_name:
+            address = '{}.{}'.format(address, method_name)
+
+    return address
+
+
+def parse_address(address):
+    """
+    Parse address of suite, test case or test
+
+    :return: (suite name, case name or None, method name or None)
+    :rtype: tuple
+    """
+    suite_name, _, case_info = address.partition(':')
+    case_name, _, method_name = case_info.partition('.')
+
+    return suite_name, case_name or None, method_name or None
+
+
+def get_address(obj):
+    """
+    Get address of built suite or test.
+    It does not depend on process, so workers of
+    other hosts find their work items by address.
+
+    :param obj: BaseSuite, test case or nose.case.Test instance
+    """
+    if isinstance(obj, BaseSuite):
+        return obj.name
+
+    test = getattr(obj, 'test', obj)
+
+    return make_address(test.of_suite, test.__class__.__name__, test._testMethodName)
+
+
+class AddressIndex(object):
+    """
+    Built suites and tests by address.
+    Tests of lazy suites are created on search.
+
+    Usage:
+
+        >>> index = AddressIndex(suites)
+        >>> index.find('myproject.suites.api:StatusCase.test_ok').run(result)
+    """
+
+    def __init__(self, suites=()):
+        # Address -> suite or test which is not lazy
+        self.__items = {}
+
+        for suite in suites:
+            self.add(suite)
+
+    def __contains__(self, address):
+        try:
+            self.find(address)
+        except KeyError:
+            return False
+
+        return True
+
+    def add(self, suite):
+        """
+        Add suite and its nested suites to index
+
+        :type suite: BaseSuite
+        """
+        self.__items[get_address(suite)] = suite
+
+        if suite.lazy_tests is not None:
+            return
+
+        for test in suite.tests:
+            if isinstance(test, BaseSuite):
+                self.add(test)
+            else:
+                self.__items[get_address(test)] = test
+
+    def find(self, address):
+        """
+        Find suite or test by address
+
+        :raises: KeyError
+        """
+        if address in self.__items:
+            return self.__items[address]
+
+        suite_name, case_name, method_name = parse_address(address)
+        suite = self.__items[make_address(suite_name, case_name)]
+
+        try:
+            position = suite.lazy_tests.test_names.index(method_name)
+        except (AttributeError, ValueError):
+            raise KeyError(address)
+
+        return NoseTestWrapper(
+            suite.lazy_tests.make(position),
+            config=suite.config,
+            resultProxy=suite.resultProxy,
+        )
+
+
+class LazyTests(object):
+    """
+    Tests of test case class which are created at iteration.
+    Instances are not stored and will be released after run.
+
+    Usage:
+
+        >>> tests = LazyTests(MyTestCase, ['test_one', 'test_two'])
+        >>> len(tests)
+        2
+        >>> for test in tests:
+        ...     test.run(result)
+    """
+
+    def __init__(self, test_case_class, test_names):
+        """
+        :param test_case_class: test case class
+        :param test_names: names of test methods
+        :type test_names: list
+        """
+        self.__test_case_class = test_case_class
+        self.__test_names = list(test_names)
+
+        # Master id of suite which tests belong to
+        self.owner_id = None
+
+    def __len__(self):
+        return len(self.__test_names)
+
+    def __iter__(self):
+        for index in range(len(self.__test_names)):
+            yield self.make(index)
+
+    @property
+    def test_case_class(self):
+        return self.__test_case_class
+
+    @property
+    def test_names(self):
+        return self.__test_names
+
+    def make(self, index):
+        """
+        Create test instance by index
+
+        :type index: int
+        """
+        test = self.__test_case_class(self.__test_names[index])
+        test.__position__ = (self.owner_id, index + 1)
+
+        return test
+
+
 class SuitePerformer(object):
     """
     Perform run suite
@@ -66,11 +244,56 @@ class BaseSuite(ContextSuite):
 
     def __init__(self, *args, **kwargs):
         self.__master_id = id(self)
+        self.__name = kwargs.pop('name', None)
         self.__pre_run_handlers = kwargs.pop('pre_run_handlers', [])
         self.__post_run_handlers = kwargs.pop('post_run_handlers', [])
 
         super(BaseSuite, self).__init__(*args, **kwargs)
 
+    def __nonzero__(self):
+        if self.__lazy_tests is not None:
+            return len(self.__lazy_tests) > 0
+
+        parent = super(BaseSuite, self)
+
+        # nose is converted by 2to3 for python 3
+        if pyv.IS_PYTHON_3:
+            return parent.__bool__()
+
+        return parent.__nonzero__()
+
+    __bool__ = __nonzero__
+
+    def _set_tests(self, tests):
+        if isinstance(tests, LazyTests):
+            tests.owner_id = self.__master_id
+
+            self._precache = []
+            self.test_generator = None
+            self.__lazy_tests = tests
+        else:
+            self.__lazy_tests = None
+            super(BaseSuite, self)._set_tests(tests)
+
+    def _get_tests(self):
+        if self.__lazy_tests is None:
+            return super(BaseSuite, self)._get_tests()
+
+        return iter(self.__lazy_tests)
+
+    _tests = property(ContextSuite._get_wrapped_tests, _set_tests)
+
+    @property
+    def name(self):
+        return self.__name
+
+    @property
+    def lazy_tests(self):
+        """
+        LazyTests instance if suite was created from it else None
+        """
+        return self.__lazy_tests
+
     @property
     def tests(self):
         return self._tests
@@ -83,6 +306,19 @@ class BaseSuite(ContextSuite):
     def post_run_handlers(self):
         return self.__post_run_handlers
 
+    def tearDown(self):
+        try:
+            super(BaseSuite, self).tearDown()
+        finally:
+            self.release_extensions()
+
+    def release_extensions(self):
+        """
+        Release instances of extensions which are scoped by suite or test case
+        """
+        if self.__name:
+            extensions.release_scope(self.__name)
+
     def run(self, result, **kwargs):
         if self.resultProxy:
             result, orig = self.resultProxy(result, self), result
@@ -96,6 +332,7 @@ class BaseSuite(ContextSuite):
         except:
             self.error_context = 'setup'
             result.addError(self, self._exc_info())
+            self.release_extensions()
             return
 
         try:
@@ -0,0 +1,407 @@
+# -*- coding: utf8 -*-
+
+from __future__ import absolute_import
+
+import sys
+import asyncio
+import warnings
+from collections import deque
+from unittest.case import SkipTest
+
+from nose.case import Test as NoseTestWrapper
+
+from noseapp.utils import pyv
+from noseapp.core.suite.base import BaseSuite
+from noseapp.core.suite.base import SuitePerformer
+
+
+# Number of async tests within suite if option is not set
+DEFAULT_ASYNC_TESTS = 100
+
+
+class Limiter(object):
+    """
+    Limit of concurrent tests.
+    Callbacks are waiting for free place in queue.
+    """
+
+    def __init__(self, loop, size):
+        self.loop = loop
+        self.size = size
+
+        self.__used = 0
+        self.__waiting = deque()
+
+    def acquire(self, callback):
+        """
+        Call callback at once if limit is not reached
+        else callback will be called after release
+        """
+        if self.__used < self.size:
+            self.__used += 1
+            self.loop.call_soon(callback)
+        else:
+            self.__waiting.append(callback)
+
+    def release(self):
+        if self.__waiting:
+            self.loop.call_soon(self.__waiting.popleft())
+        else:
+            self.__used -= 1
+
+
+class AsyncTestRun(object):
+    """
+    Run test with coroutine test method on event loop.
+    It does the same as unittest.TestCase.run and
+    nose.case.Test.run, but test method is awaited.
+    """
+
+    def __init__(self, test, result, loop):
+        """
+        :param test: nose.case.Test instance
+        :param result: test result
+        :param loop: running event loop
+        """
+        self.test = test
+        self.case = test.test
+        self.loop = loop
+        self.future = loop.create_future()
+
+        if test.resultProxy:
+            self.result = test.resultProxy(result, test)
+        else:
+            self.result = result
+
+        self.method = getattr(self.case, self.case._testMethodName)
+        self.expecting_failure = getattr(self.method, '__unittest_expecting_failure__', False)
+
+    def start(self):
+        """
+        Setup test and start test method.
+        Returns future which will be done after test.
+        """
+        self.test.beforeTest(self.result)
+        self.result.startTest(self.case)
+
+        skip_why = self.get_skip_reason()
+
+        if skip_why is not None:
+            self.result.addSkip(self.case, skip_why)
+            self.finish()
+            return self.future
+
+        try:
+            self.case.setUp()
+        except SkipTest as e:
+            self.result.addSkip(self.case, str(e))
+            self.finish()
+            return self.future
+        except KeyboardInterrupt:
+            raise
+        except:
+            self.result.addError(self.case, sys.exc_info())
+            self.finish()
+            return self.future
+
+        try:
+            task = asyncio.ensure_future(self.method(), loop=self.loop)
+        except KeyboardInterrupt:
+            raise
+        except:
+            self.result.addError(self.case, sys.exc_info())
+            self.tear_down(False)
+        else:
+            task.add_done_callback(self.on_method_done)
+
+        return self.future
+
+    def get_skip_reason(self):
+        for obj in (self.case.__class__, self.method):
+            if getattr(obj, '__unittest_skip__', False):
+                return getattr(obj, '__unittest_skip_why__', '')
+
+        return None
+
+    def on_method_done(self, task):
+        success = False
+
+        try:
+            task.result()
+        except SkipTest as e:
+            self.result.addSkip(self.case, str(e))
+        except KeyboardInterrupt:
+            raise
+        except:
+            if self.expecting_failure:
+                self.add_expected_failure(sys.exc_info())
+            elif isinstance(sys.exc_info()[1], self.case.failureException):
+                self.result.addFailure(self.case, sys.exc_info())
+            else:
+                self.result.addError(self.case, sys.exc_info())
+        else:
+            success = True
+
+        self.tear_down(success)
+
+    def tear_down(self, success):
+        try:
+            self.case.tearDown()
+        except KeyboardInterrupt:
+            raise
+        except:
+            self.result.addError(self.case, sys.exc_info())
+            success = False
+
+        while self.case._cleanups:
+            func, args, kwargs = self.case._cleanups.pop()
+
+            try:
+                func(*args, **kwargs)
+            except KeyboardInterrupt:
+                raise
+            except:
+                self.result.addError(self.case, sys.exc_info())
+                success = False
+
+        if success:
+            if self.expecting_failure:
+                self.add_unexpected_success()
+            else:
+                self.result.addSuccess(self.case)
+
+        self.finish()
+
+    def add_expected_failure(self, exc_info):
+        """
+        Result proxy of nose has not method for expected failure,
+        it's reported as success like by unittest.TestCase.run
+        """
+        add_expected_failure = getattr(self.result, 'addExpectedFailure', None)
+
+        if add_expected_failure is not None:
+            add_expected_failure(self.case, exc_info)
+        else:
+            warnings.warn('TestResult has no addExpectedFailure method, reporting as passes', RuntimeWarning)
+            self.result.addSuccess(self.case)
+
+    def add_unexpected_success(self):
+        """
+        Unexpected success is reported as failure
+        if result has not method for it
+        """
+        add_unexpected_success = getattr(self.result, 'addUnexpectedSuccess', None)
+
+        if add_unexpected_success is not None:
+            add_unexpected_success(self.case)
+            return
+
+        warnings.warn('TestResult has no addUnexpectedSuccess method, reporting as failure', RuntimeWarning)
+
+        try:
+            raise self.case.failureException('Unexpected success')
+        except self.case.failureException:
+            self.result.addFailure(self.case, sys.exc_info())
+
+    def finish(self):
+        try:
+            self.result.stopTest(self.case)
+        finally:
+            self.test.afterTest(self.result)
+            self.future.set_result(None)
+
+
+def is_async_test(test):
+    """
+    Has test coroutine test method?
+
+    :param test: nose.case.Test instance
+    """
+    if not isinstance(test, NoseTestWrapper):
+        return False
+
+    case = test.test
+    method = getattr(case, getattr(case, '_testMethodName', ''), None)
+
+    return pyv.is_async(method)
+
+
+def run_suite(suite, result, loop, limiter=None):
+    """
+    Run suite on event loop. Setup and teardown of suite are called
+    by the same way as noseapp.core.suite.base.BaseSuite.run.
+
+    :type suite: noseapp.core.suite.base.BaseSuite
+    :param loop: running event loop
+    :param limiter: limit of tests of top level suite
+
+    :return: future which will be done after teardown of suite
+    """
+    future = loop.create_future()
+
+    if suite.resultProxy:
+        result, orig = suite.resultProxy(result, suite), result
+    else:
+        result, orig = result, result
+
+    try:
+        suite.setUp()
+    except KeyboardInterrupt:
+        raise
+    except:
+        suite.error_context = 'setup'
+        result.addError(suite, suite._exc_info())
+        suite.release_extensions()
+        future.set_result(None)
+        return future
+
+    def tear_down(tests_future):
+        suite.has_run = True
+
+        try:
+            suite.tearDown()
+        except KeyboardInterrupt:
+            raise
+        except:
+            suite.error_context = 'teardown'
+            result.addError(suite, suite._exc_info())
+
+        exc = tests_future.exception()
+
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(None)
+
+    performer = AsyncioSuitePerformer(suite, result, orig)
+    performer.perform(loop, limiter=limiter).add_done_callback(tear_down)
+
+    return future
+
+
+class AsyncioSuitePerformer(SuitePerformer):
+    """
+    Run tests with coroutine test methods on asyncio event loop.
+    Sync tests are run in thread of event loop one by one.
+    """
+
+    def __call__(self, loop=None, limiter=None):
+        if loop is not None:
+            raise RuntimeError('Suite must be run by run_suite on running loop')
+
+        loop = asyncio.new_event_loop()
+
+        try:
+            loop.run_until_complete(self.perform(loop))
+        finally:
+            loop.close()
+
+    def get_limiter(self, loop):
+        size = self.suite.config.options.async_tests
+
+        if size <= 0:
+            size = DEFAULT_ASYNC_TESTS
+
+        return Limiter(loop, size)
+
+    def run_one_test_async(self, test, loop):
+        """
+        Run one test of suite.
+
+        :return: future which will be done after test
+        """
+        for callback in self.suite.pre_run_handlers:
+            try:
+                callback(test.test)
+            except KeyboardInterrupt:
+                raise
+            except:
+                self.orig.addError(test, sys.exc_info())
+                future = loop.create_future()
+                future.set_result(None)
+                return future
+
+        if is_async_test(test):
+            future = AsyncTestRun(test, self.orig, loop).start()
+        else:
+            test(self.orig)
+            future = loop.create_future()
+            future.set_result(None)
+
+        def post_run(_):
+            for callback in self.suite.post_run_handlers:
+                try:
+                    callback(test.test)
+                except KeyboardInterrupt:
+                    raise
+                except:
+                    self.orig.addError(test, sys.exc_info())
+
+        future.add_done_callback(post_run)
+
+        return future
+
+    def perform(self, loop, limiter=None):
+        """
+        Start tests and nested suites on loop.
+        Number of running tests is limited by limiter
+        which is shared with nested suites.
+
+        :return: future which will be done after all tests
+        """
+        future = loop.create_future()
+        limiter = limiter or self.get_limiter(loop)
+        tests = iter(self.suite.tests)
+        # [number of not finished items, is iteration finished]
+        state = [0, False]
+
+        def check_done():
+            if state[1] and not state[0] and not future.done():
+                future.set_result(None)
+
+        def on_done(f, release=False):
+            state[0] -= 1
+
+            if release:
+                limiter.release()
+
+            if f.exception() is not None and not future.done():
+                future.set_exception(f.exception())
+                return
+
+            check_done()
+
+        def start_test(test):
+            try:
+                f = self.run_one_test_async(test, loop)
+            except BaseException as e:
+                f = loop.create_future()
+                f.set_exception(e)
+
+            f.add_done_callback(lambda f: on_done(f, release=True))
+            loop.call_soon(advance)
+
+        def advance():
+            if future.done():
+                return
+
+            while True:
+                test = None if self.result.shouldStop else next(tests, None)
+
+                if test is None:
+                    state[1] = True
+                    check_done()
+                    return
+
+                state[0] += 1
+
+                if isinstance(test, BaseSuite):
+                    run_suite(test, self.result, loop, limiter=limiter).add_done_callback(on_done)
+                    continue
+
+                limiter.acquire(lambda test=test: start_test(test))
+                return
+
+        loop.call_soon(advance)
+
+        return future
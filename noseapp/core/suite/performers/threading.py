@@ -3,36 +3,51 @@
 from __future__ import absolute_import
 
 from multiprocessing import cpu_count
-from multiprocessing.pool import ThreadPool
 
 from noseapp.core.suite.base import BaseSuite
+from noseapp.core.executor import BoundedExecutor
 from noseapp.core.suite.base import SuitePerformer
 
 
 class ThreadSuitePerformer(SuitePerformer):
     """
-    Run tests with multiprocessing.pool.ThreadPool
+    Run tests with noseapp.core.executor.BoundedExecutor.
+    Executor of runner is used if it was given.
     """
 
-    def __call__(self, pool=None):
-        self_pool = not bool(pool)
-        size = self.suite.config.options.async_tests
+    def __call__(self, executor=None):
+        options = self.suite.config.options
+        self_executor = executor is None
+        size = options.async_tests
 
         if size <= 0:
-            size = cpu_count() / 2
+            size = executor.max_workers if executor is not None else cpu_count() / 2
 
-        pool = pool or ThreadPool(int(round(size)) or 2)
+        size = int(round(size)) or 2
 
-        for test in self.suite.tests:
-            if self.result.shouldStop:
-                break
+        if self_executor:
+            executor = BoundedExecutor(size, queue_size=options.threads_queue_size)
 
-            if isinstance(test, BaseSuite):
-                test.run(self.result, pool=pool)
-                continue
+        # Tests and nested suites of suite which can be not finished.
+        # Their number is limited, so suite does not take all threads.
+        tasks = []
 
-            pool.apply_async(self.run_one_test, args=(test, ))
+        try:
+            for test in self.suite.tests:
+                if self.result.shouldStop:
+                    break
 
-        if self_pool:
-            pool.close()
-            pool.join()
+                tasks = [t for t in tasks if not t.done()]
+
+                if len(tasks) >= size:
+                    executor.wait(tasks, count=len(tasks) - size + 1)
+
+                if isinstance(test, BaseSuite):
+                    tasks.append(executor.submit(test.run, self.result, executor=executor))
+                else:
+                    tasks.append(executor.submit(self.run_one_test, test))
+
+            executor.wait(tasks)
+        finally:
+            if self_executor:
+                executor.shutdown()
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+"""
+Durations of suites and test cases from previous runs
+"""
+
+import os
+import json
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+def make_case_name(suite_name, class_name, method_name):
+    """
+    Make name of test case instance without instance.
+    It's the same as str of mounted test case.
+    """
+    return '{} ({}:{})'.format(method_name, suite_name, class_name)
+
+
+def parse_case_name(name):
+    """
+    Get suite name and class name from result of make_case_name.
+    Returns None if test case was not mounted to suite.
+    """
+    if not name.endswith(')'):
+        return None
+
+    _, _, info = name[:-1].partition(' (')
+    suite_name, _, class_name = info.rpartition(':')
+
+    if not suite_name or not class_name:
+        return None
+
+    return suite_name, class_name
+
+
+def get_case_name(test):
+    """
+    Get name of test case instance for timing storage
+
+    :param test: test case or nose.case.Test instance
+    """
+    return str(getattr(test, 'test', test))
+
+
+class TimingDatabase(object):
+    """
+    Local storage of durations.
+    Suite durations are keyed by suite name,
+    test case durations are keyed by str of test case instance.
+    Suite durations are sums of stored durations of its test cases,
+    so run of part of suite does not change duration of other part.
+
+    Usage:
+
+        >>> timing = TimingDatabase('/path/to/durations.json')
+        >>> timing.add_case(test, 1.5)
+        >>> timing.save()
+        >>> timing.longest_first(suites)
+    """
+
+    def __init__(self, path=None, read_only=False):
+        """
+        :param path: path to json file. if None, durations will not be saved.
+        :type path: str
+        :param read_only: durations are loaded from file but will not be saved
+        """
+        self.__path = path
+        self.__read_only = read_only
+
+        self.__suites = {}
+        self.__cases = {}
+
+        if path and os.path.isfile(path):
+            self.load()
+
+    @property
+    def path(self):
+        return self.__path
+
+    @property
+    def suites(self):
+        """
+        Suite name -> duration
+
+        :rtype: dict
+        """
+        return self.__suites
+
+    @property
+    def cases(self):
+        """
+        Test case name -> duration
+
+        :rtype: dict
+        """
+        return self.__cases
+
+    def load(self):
+        """
+        Load durations from file
+        """
+        try:
+            with open(self.__path) as fp:
+                data = json.load(fp)
+        except (IOError, ValueError) as e:
+            logger.warning('Durations file "%s" can not be loaded: %s', self.__path, e)
+            return
+
+        self.__suites.update(data.get('suites', {}))
+        self.__cases.update(data.get('cases', {}))
+
+    def save(self):
+        """
+        Save durations to file
+        """
+        if not self.__path or self.__read_only:
+            return
+
+        self.__suites.update(self.get_suite_totals())
+
+        tmp_path = '{}.tmp'.format(self.__path)
+
+        with open(tmp_path, 'w') as fp:
+            json.dump({'suites': self.__suites, 'cases': self.__cases}, fp)
+
+        os.rename(tmp_path, self.__path)
+
+    def add_case(self, test, duration):
+        """
+        Save duration of test case
+
+        :param test: test case or nose.case.Test instance
+        :param duration: number of seconds
+        """
+        self.__cases[get_case_name(test)] = duration
+
+    def get_suite_totals(self):
+        """
+        Sum durations of stored test cases by suites and case suites
+
+        :rtype: dict
+        """
+        totals = {}
+
+        for case_name, duration in self.__cases.items():
+            names = parse_case_name(case_name)
+
+            if names is None:
+                continue
+
+            suite_name, class_name = names
+
+            for name in (suite_name, '{}:{}'.format(suite_name, class_name)):
+                totals[name] = totals.get(name, 0) + duration
+
+        return totals
+
+    def estimate(self, suite):
+        """
+        Get expected duration of suite or test case.
+        Return None if history is not found.
+
+        :param suite: noseapp.core.suite.base.BaseSuite or nose.case.Test instance
+        """
+        from noseapp.core.suite.base import BaseSuite
+
+        if not isinstance(suite, BaseSuite):
+            return self.__cases.get(get_case_name(suite))
+
+        if suite.name in self.__suites:
+            return self.__suites[suite.name]
+
+        # Tests of lazy suite should not be created before run
+        if suite.lazy_tests is not None:
+            return None
+
+        durations = [d for d in map(self.estimate, suite.tests) if d is not None]
+
+        return sum(durations) if durations else None
+
+    def longest_first(self, suites):
+        """
+        Sort suites or test cases by expected duration, longest is first.
+        Duration of item without history is average duration.
+
+        :param suites: iterable of suites or test cases
+
+        :rtype: list
+        """
+        suites = list(suites)
+
+        if not self.__suites and not self.__cases:
+            return suites
+
+        durations = [self.estimate(s) for s in suites]
+        known = [d for d in durations if d is not None]
+
+        if not known:
+            return suites
+
+        average = float(sum(known)) / len(known)
+        order = sorted(
+            range(len(suites)),
+            key=lambda i: average if durations[i] is None else durations[i],
+            reverse=True,
+        )
+
+        return [suites[i] for i in order]
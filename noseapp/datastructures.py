@@ -1,5 +1,19 @@
 # coding: utf-8
 
+from mmap import mmap
+from copy import deepcopy
+
+from noseapp.utils import pyv
+
+if pyv.IS_PYTHON_2:
+    from collections import Mapping
+    from collections import Sequence
+    from collections import MutableMapping
+else:
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+    from collections.abc import MutableMapping
+
 
 class ModifyDict(dict):
     """
@@ -47,3 +61,256 @@ class Context(ModifyDict):
         >>> None
     """
     pass
+
+
+class FrozenDict(Mapping):
+    """
+    Read-only view of mapping. Data is not copied,
+    values are frozen at first access and cached.
+
+    Usage:
+
+        >>> data = FrozenDict({'a': [1, 2]})
+        >>> data['a']
+        >>> FrozenList([1, 2])
+        >>> data['b'] = 1
+        >>> TypeError
+        >>> data = data.copy_on_write()
+        >>> data['b'] = 1
+    """
+
+    def __init__(self, data):
+        self.__data = data
+        # Key -> frozen value
+        self.__frozen = {}
+
+    def __getitem__(self, key):
+        if key not in self.__frozen:
+            self.__frozen[key] = freeze(self.__data[key])
+
+        return self.__frozen[key]
+
+    def __iter__(self):
+        return iter(self.__data)
+
+    def __len__(self):
+        return len(self.__data)
+
+    def __contains__(self, key):
+        return key in self.__data
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.__data)
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def copy_on_write(self):
+        """
+        Get mutable mapping which shares data with view
+        until keys are changed.
+
+        :rtype: CopyOnWriteDict
+        """
+        return CopyOnWriteDict(self)
+
+    def thaw(self):
+        """
+        Get mutable deep copy of data
+        """
+        return deepcopy(self.__data)
+
+
+class FrozenList(Sequence):
+    """
+    Read-only view of list. Data is not copied,
+    items are frozen at first access and cached.
+    """
+
+    def __init__(self, data):
+        self.__data = data
+        # Index -> frozen item
+        self.__frozen = {}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FrozenList(self.__data[index])
+
+        if index < 0:
+            index += len(self.__data)
+
+        if index not in self.__frozen:
+            if not 0 <= index < len(self.__data):
+                raise IndexError('list index out of range')
+
+            self.__frozen[index] = freeze(self.__data[index])
+
+        return self.__frozen[index]
+
+    def __len__(self):
+        return len(self.__data)
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenList):
+            other = other.__data
+
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+
+        return list(self.__data) == list(other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.__data)
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def thaw(self):
+        """
+        Get mutable deep copy of data
+        """
+        return deepcopy(list(self.__data))
+
+
+class CopyOnWriteDict(MutableMapping):
+    """
+    Mutable mapping over frozen mapping.
+    Changed keys are kept by instance, other keys are read from base.
+    Values of base are frozen, replace value for change it.
+
+    Usage:
+
+        >>> base = FrozenDict({'a': {'b': 1}})
+        >>> data = CopyOnWriteDict(base)
+        >>> data['a'] = data['a'].thaw()
+        >>> data['a']['b'] = 2
+    """
+
+    def __init__(self, base):
+        self.__base = base
+        self.__changed = {}
+        self.__deleted = set()
+
+    def __getitem__(self, key):
+        if key in self.__changed:
+            return self.__changed[key]
+
+        if key in self.__deleted:
+            raise KeyError(key)
+
+        return self.__base[key]
+
+    def __setitem__(self, key, value):
+        self.__deleted.discard(key)
+        self.__changed[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+
+        self.__changed.pop(key, None)
+
+        if key in self.__base:
+            self.__deleted.add(key)
+
+    def __iter__(self):
+        for key in self.__base:
+            if key not in self.__deleted and key not in self.__changed:
+                yield key
+
+        for key in self.__changed:
+            yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        if key in self.__changed:
+            return True
+
+        return key not in self.__deleted and key in self.__base
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, dict(self))
+
+
+def freeze(obj):
+    """
+    Get read-only view of object without copy.
+    Mappings and lists are wrapped to views, sets are frozen to frozenset,
+    items of tuples are frozen to new tuple of the same type,
+    bytearray and mmap objects are wrapped to read-only buffers.
+    Views cache frozen values, so each value is frozen once.
+    Other objects are returned as is, they must not be changed by consumers.
+
+    :param obj: any object
+    :raises: TypeError
+    """
+    if isinstance(obj, (FrozenDict, FrozenList, CopyOnWriteDict)):
+        return obj
+
+    if isinstance(obj, Mapping):
+        return FrozenDict(obj)
+
+    if isinstance(obj, list):
+        return FrozenList(obj)
+
+    if isinstance(obj, tuple):
+        return freeze_tuple(obj)
+
+    if isinstance(obj, set):
+        return frozenset(obj)
+
+    if isinstance(obj, (bytearray, mmap)):
+        return readonly_buffer(obj)
+
+    return obj
+
+
+def freeze_tuple(obj):
+    """
+    Get tuple with frozen items. Tuple of immutable items
+    is returned as is, namedtuple is rebuilt by its class.
+    """
+    items = [freeze(item) for item in obj]
+
+    if all(frozen is item for frozen, item in zip(items, obj)):
+        return obj
+
+    if hasattr(obj, '_make'):
+        return type(obj)._make(items)
+
+    return tuple(items)
+
+
+def readonly_buffer(obj):
+    """
+    Get read-only buffer of bytes-like object without copy.
+    Python 3 before 3.8 can't make read-only view of writable
+    object, so bytearray and mmap which was not opened
+    with ACCESS_READ can't be frozen there.
+
+    :raises: TypeError
+    """
+    if pyv.IS_PYTHON_2:
+        return buffer(obj)  # noqa
+
+    view = memoryview(obj)
+
+    if view.readonly:
+        return view
+
+    if hasattr(view, 'toreadonly'):  # python 3.8 and greater
+        return view.toreadonly()
+
+    view.release()
+
+    raise TypeError(
+        'Writable buffer can not be frozen without copy, '
+        'use bytes or mmap opened with ACCESS_READ',
+    )
@@ -10,6 +10,7 @@ from noseapp.manage import commands
 # Add commands here. Order is important.
 funcs.register_command('help', commands.help)
 funcs.register_command('run', commands.run_app)
+funcs.register_command('worker', commands.run_worker)
 
 
 def run():
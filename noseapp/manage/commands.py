@@ -67,3 +67,27 @@ def run_app(app_path, **kwargs):
 
     app = funcs.get_create_app_func(app_path)(**kwargs)
     app.run()
+
+
+def run_worker(app_path, **kwargs):
+    """
+    Command for run worker of distributed strategy.
+    Worker builds suites of application and performs
+    work items from coordinator.
+
+    :usage:
+        noseapp-manage worker import.path.to:get_app_function --coordinator host:port
+
+    :app_path: path for importing application
+    :kwargs: kwargs of create application function
+    """
+    from noseapp.core.constants import RunStrategy
+
+    app = funcs.get_create_app_func(app_path)(**kwargs)
+
+    if not app.options.coordinator:
+        # Output was captured by test program
+        sys.stdout = sys.__stdout__
+        funcs.error('--coordinator option is required for worker')
+
+    app.run(run_strategy=RunStrategy.DISTRIBUTED_WORKER)
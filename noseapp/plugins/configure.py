@@ -6,6 +6,7 @@ from optparse import OptionGroup
 from noseapp.plugins.base import AppPlugin
 from noseapp.app.context import app_callback
 from noseapp.core.constants import RunStrategy
+from noseapp.core.constants import WorkerMode
 
 
 class AppConfigurePlugin(AppPlugin):
@@ -38,12 +39,124 @@ class AppConfigurePlugin(AppPlugin):
             type=int,
             help='Number of tests to async run. Limit to tests within suite.',
         )
+        group.add_option(
+            '--max-threads',
+            dest='max_threads',
+            default=0,
+            type=int,
+            help='Total number of threads for suites and tests. '
+                 'To threading strategy only.',
+        )
+        group.add_option(
+            '--threads-queue-size',
+            dest='threads_queue_size',
+            default=0,
+            type=int,
+            help='Max number of suites and tests in queue of threads. '
+                 'Twice number of threads by default.',
+        )
+        group.add_option(
+            '--worker-concurrency',
+            dest='worker_concurrency',
+            default=0,
+            type=int,
+            help='Number of concurrent tests in each process. '
+                 'To hybrid strategy only. Same as --async-tests by default.',
+        )
+        group.add_option(
+            '--worker-mode',
+            dest='worker_mode',
+            default=WorkerMode.THREADS,
+            type=str,
+            help='How tests are run in each process. Can be in ({}). '
+                 'To hybrid strategy only.'.format(', '.join(WorkerMode.ALL)),
+        )
+        group.add_option(
+            '--worker-metrics',
+            dest='worker_metrics',
+            action='store_true',
+            default=False,
+            help='Show queue depth of each process after run. To hybrid strategy only.',
+        )
+        group.add_option(
+            '--pool-metrics',
+            dest='pool_metrics',
+            action='store_true',
+            default=False,
+            help='Show wait time and utilisation of pooled extensions after run.',
+        )
         group.add_option(
             '--multiprocessing-timeout',
             dest='multiprocessing_timeout',
             default=1800,
             type=int,
-            help='Process timeout. To multiprocessing strategy only.',
+            help='Max number of seconds without events from processes. '
+                 'To multiprocessing, multiprocessing-pool, hybrid and distributed strategies only.',
+        )
+        group.add_option(
+            '--warm-template',
+            dest='warm_template',
+            action='store_true',
+            default=False,
+            help='Fork processes from template process which is started after build of suites. '
+                 'To multiprocessing, multiprocessing-pool and hybrid strategies only.',
+        )
+        group.add_option(
+            '--coordinator',
+            dest='coordinator',
+            default=None,
+            type=str,
+            help='Address of coordinator: host:port, [ipv6]:port '
+                 'or unix:/path/to/socket. IPv6 address must be in brackets. '
+                 'Coordinator listens on it with distributed strategy '
+                 'and workers connect to it with distributed-worker strategy.',
+        )
+        group.add_option(
+            '--local-workers',
+            dest='local_workers',
+            default=0,
+            type=int,
+            help='Number of workers on current host. To distributed strategy only.',
+        )
+        group.add_option(
+            '--split-suites',
+            dest='split_suites',
+            action='store_true',
+            default=False,
+            help='Give cases of one suite to different processes. '
+                 'Suite context will be set up once in each process. '
+                 'To multiprocessing-pool, hybrid and distributed strategies only.',
+        )
+        group.add_option(
+            '--release-tests',
+            dest='release_tests',
+            action='store_true',
+            default=False,
+            help='Keep only description and traceback of finished tests in result. '
+                 'Test instances will be released after run.',
+        )
+        group.add_option(
+            '--durations-file',
+            dest='durations_file',
+            default=None,
+            type=str,
+            help='Path to file for saving durations of suites and test cases. '
+                 'Suites with longest durations will be run first.',
+        )
+        group.add_option(
+            '--discovery-cache',
+            dest='discovery_cache',
+            default=None,
+            type=str,
+            help='Path to file of suites discovery cache. '
+                 'Modules without suite from -t option will not be imported.',
+        )
+        group.add_option(
+            '--discovery-workers',
+            dest='discovery_workers',
+            default=None,
+            type=int,
+            help='Number of threads for import of suite modules.',
         )
         group.add_option(
             '--ls',
@@ -64,7 +177,23 @@ class AppConfigurePlugin(AppPlugin):
             dest='run_test',
             default='',
             type=str,
-            help='Run test case or suite by name.',
+            help='Run suites, test cases or tests by comma-separated names, glob patterns or re:regex.',
+        )
+        group.add_option(
+            '--shard-index',
+            dest='shard_index',
+            default=0,
+            type=int,
+            help='Index of shard to run, starting with 0. To --shard-count option only.',
+        )
+        group.add_option(
+            '--shard-count',
+            dest='shard_count',
+            default=0,
+            type=int,
+            help='Number of shards. Test methods are partitioned by durations '
+                 'from --durations-file or by number of tests. '
+                 'Durations file is not saved by sharded run, -t can not be used.',
         )
         group.add_option(
             '--random',
@@ -303,6 +303,7 @@ class Suite(object):
         """
         Get extension by name.
         Extensions will be available after build suite.
+        Instance is created at first call.
 
         Example::
 
@@ -328,7 +329,7 @@ class Suite(object):
         if name not in self.__context.require:
             raise extensions.ExtensionNotRequired(name)
 
-        return self.__context.extensions.get(name)
+        return extensions.resolve(self.__context.extensions.get(name))
 
     def register(self, cls=None, **kwargs):
         """
@@ -396,6 +397,9 @@ class Suite(object):
             if require:
                 setattr(_class, 'REQUIRE', require)
 
+            # Build method table once after all changes of class
+            loader.get_method_table(_class)
+
             self.__context.add_test_case(_class)
 
             logger.debug(
@@ -438,10 +442,7 @@ class Suite(object):
                 'cls': case,
                 'tests': dict(
                     (atr, getattr(case, atr))
-                    for atr in dir(case)
-                    if atr.startswith(loader.TEST_NAME_PREFIX)
-                    or
-                    atr == loader.DEFAULT_TEST_NAME,
+                    for atr in loader.get_method_table(case).test_names()
                 ),
             }
 
@@ -451,10 +452,12 @@ class Suite(object):
                  program_data,
                  shuffle=None,
                  case_name=None,
-                 method_name=None):
+                 method_name=None,
+                 methods=None):
         """
         Build suite. After call suite instance will be
-        created instance of nose.suite.ContextSuite
+        created instance of nose.suite.ContextSuite.
+        Instances of test cases will be created when suite is running.
 
         :param program_data: instance of ProgramData
         :type program_data: noseapp.core.program.ProgramData
@@ -462,6 +465,9 @@ class Suite(object):
         :param shuffle: callable object for randomize test case list
         :param case_name: test name for build
         :param method_name: test case method name for build
+        :param methods: test case name -> list of method names for build.
+        Other test cases will not be built. All methods if list is None.
+        :type methods: dict
 
         :raises: RuntimeError
         :rtype: noseapp.core.suite.base.BaseSuite
@@ -472,53 +478,45 @@ class Suite(object):
         self.__is_build = True
 
         for ext_name in self.context.require:
-            ext = extensions.get(ext_name)
+            ext = extensions.get(ext_name, suite_name=self.name)
             self.context.add_extension(ext_name, ext)
 
         if callable(shuffle):
             shuffle(self.__context.test_cases)
 
-        def make_suites():
-            suites = []
+        def make_suite(case, method_names=None):
+            tests = loader.load_lazy_tests_from_test_case(
+                case.mount_to_suite(self),
+                method_name=method_name,
+                method_names=method_names,
+            )
+
+            return program_data.suite_class(
+                tests,
+                name='{}:{}'.format(self.name, case.__name__),
+                context=case,
+                config=program_data.config,
+                pre_run_handlers=self.__context.pre_run,
+                post_run_handlers=self.__context.post_run,
+                resultProxy=program_data.result_proxy_factory,
+            )
 
+        def make_suites():
             if case_name:
-                case = loader.load_case_from_suite(case_name, self)
-                tests = loader.load_tests_from_test_case(
-                    case.mount_to_suite(self),
-                    method_name=method_name,
-                )
+                return [make_suite(loader.load_case_from_suite(case_name, self))]
 
-                suites.append(
-                    program_data.suite_class(
-                        tests,
-                        context=case,
-                        config=program_data.config,
-                        pre_run_handlers=self.__context.pre_run,
-                        post_run_handlers=self.__context.post_run,
-                        resultProxy=program_data.result_proxy_factory,
-                    ),
-                )
-            else:
-                for case in self.__context.test_cases:
-                    tests = loader.load_tests_from_test_case(
-                        case.mount_to_suite(self),
-                    )
-
-                    suites.append(
-                        program_data.suite_class(
-                            tests,
-                            context=case,
-                            config=program_data.config,
-                            pre_run_handlers=self.__context.pre_run,
-                            post_run_handlers=self.__context.post_run,
-                            resultProxy=program_data.result_proxy_factory,
-                        ),
-                    )
-
-            return suites
+            if methods is not None:
+                return [
+                    make_suite(case, method_names=methods[case.__name__])
+                    for case in self.__context.test_cases
+                    if case.__name__ in methods
+                ]
+
+            return [make_suite(case) for case in self.__context.test_cases]
 
         return program_data.suite_class(
             make_suites(),
+            name=self.name,
             context=self.__context,
             config=program_data.config,
         )
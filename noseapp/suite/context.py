@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from warnings import warn
+
 
 class SuiteContext(object):
     """
@@ -26,6 +28,8 @@ class SuiteContext(object):
         self.__post_run = []
 
         self.__test_cases = []
+        # Class name -> test case class
+        self.__test_case_index = {}
         self.__extensions = {}
 
     @property
@@ -64,6 +68,16 @@ class SuiteContext(object):
         """
         return self.__test_cases
 
+    @property
+    def test_case_index(self):
+        """
+        Index of test cases by class name.
+        If class name is duplicated then first test case will be here.
+
+        :rtype: dict
+        """
+        return self.__test_case_index
+
     @property
     def extensions(self):
         """
@@ -80,8 +94,27 @@ class SuiteContext(object):
         :param case: test case class
         :type case: noseapp.case.base.ToNoseAppTestCase
         """
+        if case.__name__ in self.__test_case_index:
+            warn(
+                'Duplicate test case name "{}"! Please rename your test case!'.format(
+                    case.__name__,
+                ),
+            )
+        else:
+            self.__test_case_index[case.__name__] = case
+
         self.__test_cases.append(case)
 
+    def get_test_case(self, name):
+        """
+        Get test case class by class name
+
+        :param name: class name
+
+        :rtype: noseapp.case.base.ToNoseAppTestCase or None
+        """
+        return self.__test_case_index.get(name)
+
     def add_extension(self, name, ext):
         """
         Add prepared extension to storage.
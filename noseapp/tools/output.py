@@ -1,7 +1,6 @@
 # -*- coding: utf8 -*-
 
 import sys
-from warnings import warn
 
 
 def _print_line(string, spaces=0):
@@ -50,21 +49,12 @@ def tree(suites, show_docs=True, doc_lines=1, exit=True):
     case_counter = 0
     suite_counter = 0
     method_counter = 0
-    suite_names = set()
 
     # Suites
     for suite in suites:
         suite_counter += 1
         suite_name = suite.name
 
-        if suite_name in suite_names:
-            warn(
-                'Duplicate suite name "{}"! Please rename your suite!'.format(
-                    suite_name,
-                ),
-            )
-        suite_names.add(suite_name)
-
         _print_line('* {}'.format(suite_name))
 
         mp = suite.get_map()
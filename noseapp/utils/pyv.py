@@ -39,3 +39,66 @@ if IS_PYTHON_3:
     unicode = str
 elif IS_PYTHON_2:
     unicode = unicode
+
+
+# Function returns awaitable object but it's not coroutine function
+ASYNC_ATTRIBUTE_NAME = '__ASYNC__'
+
+
+def is_async(func):
+    """
+    Is function coroutine function or marked by mark_async?
+    Coroutines are supported with python 3.5 and greater only.
+    """
+    if getattr(func, ASYNC_ATTRIBUTE_NAME, False):
+        return True
+
+    if IS_PYTHON_2:
+        return False
+
+    from inspect import iscoroutinefunction
+
+    return iscoroutinefunction(func)
+
+
+def mark_async(func):
+    """
+    Mark function which returns awaitable object
+    """
+    setattr(func, ASYNC_ATTRIBUTE_NAME, True)
+    return func
+
+
+class AwaitableGenerator(object):
+    """
+    Awaitable object for generator which yields futures
+    like coroutine. It's replacement of async def for
+    code which must be compiled by python 2.
+    """
+
+    def __init__(self, generator):
+        self.generator = generator
+
+    def __await__(self):
+        return self.generator
+
+
+def get_running_loop():
+    """
+    Get asyncio event loop which is running in current thread or None
+    """
+    import asyncio
+
+    try:
+        return asyncio.get_running_loop()
+    except AttributeError:  # python < 3.7
+        pass
+    except RuntimeError:
+        return None
+
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:  # thread without event loop
+        return None
+
+    return loop if loop.is_running() else None
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+
+from noseapp import Suite
+from noseapp import TestCase
+
+
+suite = Suite(__name__)
+
+
+@suite.register(require=['settings'])
+class CaseWithRequire(TestCase):
+
+    def test(self):
+        self.assertFalse(self.ext('settings').debug)
@@ -28,3 +28,446 @@ class TestAppName(TestCase):
 
         app = NoseApp('hello')
         self.assertEqual(app.name, 'hello')
+
+
+class TestClassFactoryOptions(TestCase):
+    """
+    Run strategy and worker mode are validated
+    """
+
+    def runTest(self):
+        from optparse import Values
+        from noseapp.core.factory import ClassFactory
+
+        ClassFactory(Values({'run_strategy': 'hybrid', 'worker_mode': 'asyncio'}))
+
+        self.assertRaises(
+            ValueError, ClassFactory, Values({'run_strategy': 'hybird', 'worker_mode': 'threads'}),
+        )
+        self.assertRaises(
+            ValueError, ClassFactory, Values({'run_strategy': 'hybrid', 'worker_mode': 'asynco'}),
+        )
+
+        factory = ClassFactory(Values({'run_strategy': 'simple', 'worker_mode': 'threads'}))
+        factory.set_run_strategy('distributed-worker')
+
+        self.assertEqual(factory.options.run_strategy, 'distributed-worker')
+        self.assertRaises(ValueError, factory.set_run_strategy, 'distributed-wroker')
+
+
+class TestFrozenSharedData(TestCase):
+    """
+    Frozen shared data is not copied for consumers
+    """
+
+    def tearDown(self):
+        from noseapp.core import extensions
+
+        extensions.clear()
+
+    def runTest(self):
+        from noseapp import NoseApp
+        from noseapp.core import extensions
+        from noseapp.datastructures import FrozenDict
+
+        from collections import namedtuple
+
+        Point = namedtuple('Point', 'x y')
+        point = Point(1, 2)
+        data = {
+            'catalogue': {'item': [1, 2], 'tags': set(['a'])},
+            'blob': b'data',
+            'point': point,
+            'pairs': ({'key': 'value'}, Point([1], 2)),
+        }
+
+        NoseApp.shared_data('copied', data)
+        NoseApp.shared_data('frozen', data, frozen=True)
+
+        self.assertIsNot(extensions.resolve(extensions.get('copied')), data)
+        self.assertEqual(extensions.resolve(extensions.get('copied')), data)
+
+        frozen = extensions.get('frozen')
+
+        self.assertIs(frozen, extensions.get('frozen'))
+        self.assertIsInstance(frozen['catalogue'], FrozenDict)
+        self.assertEqual(frozen['catalogue']['item'], [1, 2])
+        self.assertEqual(bytes(frozen['blob']), b'data')
+
+        # Values are frozen once
+        self.assertIs(frozen['blob'], frozen['blob'])
+        self.assertIs(frozen['catalogue'], frozen['catalogue'])
+        self.assertIs(frozen['catalogue']['tags'], frozen['catalogue']['tags'])
+        self.assertEqual(frozen['catalogue']['tags'], frozenset(['a']))
+        self.assertIs(frozen['point'], point)
+        self.assertIs(frozen['pairs'], frozen['pairs'])
+
+        # Items of tuples are frozen, namedtuple keeps its class
+        pair, named = frozen['pairs']
+
+        self.assertIsInstance(pair, FrozenDict)
+        self.assertIsInstance(named, Point)
+        self.assertEqual(named.x, [1])
+
+        with self.assertRaises(TypeError):
+            pair['key'] = 'other'
+
+        with self.assertRaises(AttributeError):
+            named.x.append(2)
+
+        self.assertEqual(data['pairs'][0], {'key': 'value'})
+        self.assertEqual(frozen['catalogue']['item'][-1], 2)
+        self.assertRaises(IndexError, lambda: frozen['catalogue']['item'][-3])
+
+        with self.assertRaises(TypeError):
+            frozen['key'] = 1
+
+        changed = frozen.copy_on_write()
+        changed['catalogue'] = changed['catalogue'].thaw()
+        changed['catalogue']['item'].append(3)
+        del changed['blob']
+
+        self.assertEqual(sorted(changed), ['catalogue', 'pairs', 'point'])
+        self.assertEqual(data['catalogue']['item'], [1, 2])
+        self.assertIn('blob', frozen)
+
+
+class TestFrozenBuffer(TestCase):
+    """
+    Buffers are frozen to read-only views without copy
+    """
+
+    def runTest(self):
+        import mmap
+        import tempfile
+
+        from noseapp.utils import pyv
+        from noseapp.datastructures import freeze
+
+        with tempfile.TemporaryFile() as fp:
+            fp.write(b'data')
+            fp.flush()
+
+            mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            self.addCleanup(mapped.close)
+
+            view = freeze(mapped)
+
+            self.assertEqual(bytes(view[:4]), b'data')
+
+        blob = bytearray(b'data')
+
+        if pyv.IS_PYTHON_2 or hasattr(memoryview, 'toreadonly'):
+            view = freeze(blob)
+            blob[0:1] = b'D'
+
+            # View shares memory with buffer
+            self.assertEqual(bytes(view[:4]), b'Data')
+
+            if pyv.IS_PYTHON_3:
+                self.assertTrue(view.readonly)
+                view.release()
+        else:
+            self.assertRaises(TypeError, freeze, blob)
+
+
+class TestExtensionScope(TestCase):
+    """
+    Instances of scoped extension are shared by consumers of scope
+    and released at end of scope
+    """
+
+    def tearDown(self):
+        from noseapp.core import extensions
+
+        extensions.clear()
+
+    def runTest(self):
+        from noseapp import NoseApp
+        from noseapp.core import extensions
+
+        released = []
+
+        for scope in ('session', 'process', 'suite', 'case'):
+            NoseApp.shared_extension(
+                name=scope, cls=object, scope=scope, teardown=released.append,
+            )
+
+        def get(name, suite_name, case_name=None):
+            return extensions.resolve(extensions.get(name, suite_name=suite_name, case_name=case_name))
+
+        self.assertIs(get('session', 'a'), get('session', 'b', 'Case'))
+        self.assertIs(get('process', 'a'), get('process', 'b'))
+        self.assertIs(get('suite', 'a'), get('suite', 'a', 'Case'))
+        self.assertIsNot(get('suite', 'a'), get('suite', 'b'))
+        self.assertIs(get('case', 'a', 'Case'), get('case', 'a', 'Case'))
+        self.assertIsNot(get('case', 'a', 'Case'), get('case', 'a', 'Other'))
+
+        case_instance = get('case', 'a', 'Case')
+        extensions.release_scope('a:Case')
+        self.assertEqual(released, [case_instance])
+        self.assertIsNot(get('case', 'a', 'Case'), case_instance)
+
+        extensions.release_scope('a')
+        self.assertEqual(len(released), 2)
+
+        session = get('session', 'a')
+        extensions.release_process_scope()
+        self.assertEqual(len(released), 4)
+        self.assertIn(session, released)
+
+        self.assertRaises(ValueError, NoseApp.shared_extension, name='x', cls=object, scope='test')
+
+
+class TestConcurrentScopes(TestCase):
+    """
+    Instances of different scopes are created concurrently,
+    one instance is created for scope
+    """
+
+    def tearDown(self):
+        from noseapp.core import extensions
+
+        extensions.clear()
+
+    def runTest(self):
+        import threading
+
+        from noseapp import NoseApp
+        from noseapp.core import extensions
+
+        lock = threading.Lock()
+        both_started = threading.Event()
+        started = []
+        concurrent = []
+
+        def create():
+            with lock:
+                started.append(threading.current_thread().name)
+
+                if len(started) == 2:
+                    both_started.set()
+
+            # Second scope is not created while first is creating if they are serialized
+            concurrent.append(both_started.wait(5))
+
+            return object()
+
+        NoseApp.shared_extension(name='browser', cls=create, scope='suite')
+
+        instances = {}
+
+        def get(suite_name, thread_name):
+            ref = extensions.get('browser', suite_name=suite_name)
+            instances[thread_name] = extensions.resolve(ref)
+
+        threads = [
+            threading.Thread(target=get, args=(suite_name, thread_name), name=thread_name)
+            for suite_name, thread_name in (('a', 'first'), ('b', 'second'), ('a', 'third'))
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(concurrent, [True, True])
+        self.assertEqual(len(started), 2)
+        self.assertIs(instances['first'], instances['third'])
+        self.assertIsNot(instances['first'], instances['second'])
+
+        extensions.release_scope('a')
+        extensions.release_scope('b')
+
+
+class TestPooledExtension(TestCase):
+    """
+    Instance of pooled extension is checked out by test
+    and returned to pool by cleanup of test
+    """
+
+    def tearDown(self):
+        from noseapp.core import extensions
+
+        extensions.clear()
+
+    def runTest(self):
+        import threading
+        from unittest import TestCase as _TestCase
+
+        from noseapp import NoseApp
+        from noseapp.core import extensions
+
+        released = []
+        NoseApp.shared_extension(name='pooled', cls=object, pool_size=1, teardown=released.append)
+
+        ref = extensions.get('pooled', suite_name='pool.suite')
+        pool = ref.extension
+
+        class Case(_TestCase):
+
+            def runTest(self):
+                pass
+
+        first, second = Case(), Case()
+        instance = extensions.resolve(ref, case=first)
+
+        self.assertIs(extensions.resolve(ref, case=first), instance)
+
+        got = []
+        waiting = threading.Thread(target=lambda: got.append(extensions.resolve(ref, case=second)))
+        waiting.start()
+        waiting.join(0.1)
+
+        self.assertFalse(got)
+
+        first.doCleanups()
+        waiting.join()
+
+        self.assertEqual(got, [instance])
+        self.assertEqual(pool.checkouts, 2)
+        self.assertEqual(pool.waits, 1)
+        self.assertGreater(pool.max_wait, 0)
+        self.assertGreater(pool.utilisation(), 0)
+
+        second.doCleanups()
+        self.assertIs(extensions.resolve(ref), instance)
+
+        extensions.release_scope('pool.suite')
+        extensions.release_process_scope()
+
+        self.assertEqual(released, [instance])
+        self.assertRaises(ValueError, NoseApp.shared_extension, name='x', cls=object, pool_size=0)
+
+
+class TestLazyExtension(TestCase):
+    """
+    Instance of extension is created at first access only
+    """
+
+    def tearDown(self):
+        from noseapp.core import extensions
+
+        extensions.clear()
+
+    def runTest(self):
+        from noseapp import NoseApp
+        from noseapp.core import extensions
+
+        created = []
+        NoseApp.shared_extension(name='lazy', cls=lambda: created.append(object()) or created[-1])
+
+        first, second = extensions.get('lazy'), extensions.get('lazy')
+
+        self.assertEqual(created, [])
+        self.assertIs(extensions.resolve(first), extensions.resolve(first))
+        self.assertEqual(len(created), 1)
+        self.assertIsNot(extensions.resolve(second), extensions.resolve(first))
+        self.assertEqual(len(created), 2)
+
+
+class TestWarmExtension(TestCase):
+    """
+    Instance of warm extension is created on background thread
+    and consumer waits for it
+    """
+
+    def tearDown(self):
+        from noseapp.core import extensions
+
+        extensions.clear()
+
+    def runTest(self):
+        import threading
+
+        from noseapp import NoseApp
+        from noseapp.core import extensions
+
+        started, ready = threading.Event(), threading.Event()
+        created = []
+
+        def create():
+            started.set()
+            ready.wait()
+            created.append(object())
+            return created[-1]
+
+        NoseApp.shared_extension(name='warm', cls=create, scope='session', warm=True)
+        NoseApp.shared_extension(name='warm_pool', cls=object, pool_size=2, warm=True)
+
+        started.wait(5)
+        self.assertEqual(created, [])
+
+        ready.set()
+        instance = extensions.resolve(extensions.get('warm', suite_name='warm.suite'))
+
+        self.assertEqual(created, [instance])
+
+        extensions.wait_warm_up()
+        extensions.release_process_scope()
+
+        self.assertRaises(
+            ValueError, NoseApp.shared_extension, name='x', cls=object, scope='suite', warm=True,
+        )
+        self.assertRaises(ValueError, NoseApp.shared_extension, name='x', cls=object, warm=True)
+
+
+class TestWarmProcessScope(TestCase):
+    """
+    Instance of warm process scope is created by process which runs tests
+    """
+
+    def tearDown(self):
+        from noseapp.core import extensions
+
+        extensions.clear()
+
+    def runTest(self):
+        import os
+        from multiprocessing import Pipe
+
+        from noseapp import NoseApp
+        from noseapp.core import extensions
+        from noseapp.core.runner.performers.multiprocessing import run_process
+        from noseapp.core.runner.performers.multiprocessing import get_fork_process_class
+
+        self.addCleanup(setattr, extensions, 'WAS_INSTALLATION', extensions.WAS_INSTALLATION)
+        extensions.WAS_INSTALLATION = False
+
+        created = []
+
+        def create():
+            created.append(os.getpid())
+            return created[-1]
+
+        with extensions.installation():
+            NoseApp.shared_extension(name='warm', cls=create, scope='process', warm=True)
+            ref = extensions.get('warm')
+
+        extensions.wait_warm_up()
+        self.assertEqual(created, [])
+
+        def target(connection):
+            extensions.wait_warm_up()
+            connection.send(list(created))
+            connection.send(extensions.resolve(ref))
+
+        reader, writer = Pipe(duplex=False)
+        process = get_fork_process_class()(target=run_process, args=(target, writer))
+        process.start()
+        writer.close()
+
+        self.assertEqual(reader.recv(), [process.pid])
+        self.assertEqual(reader.recv(), process.pid)
+        process.join()
+
+        self.assertEqual(created, [])
+
+        extensions.warm_up_process_scope()
+        extensions.wait_warm_up()
+
+        self.assertEqual(created, [os.getpid()])
+        self.assertEqual(extensions.resolve(ref), os.getpid())
+
+        extensions.release_process_scope()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+
+class TestPartition(TestCase):
+    """
+    Test methods are partitioned to shards with close sums of durations
+    """
+
+    def runTest(self):
+        from noseapp.core.collector import partition
+
+        weights = [('a', 5), ('b', 4), ('c', 3), ('d', 3), ('e', 1)]
+        shards = partition(weights, 2)
+
+        self.assertEqual(shards, [['a', 'd'], ['b', 'c', 'e']])
+        self.assertEqual(shards, partition(list(reversed(weights)), 2))
+        self.assertEqual(partition([('a', 1)], 3), [['a'], [], []])
+
+
+class CollectorTestCase(TestCase):
+    """
+    Build suites of test application
+    """
+
+    def setUp(self):
+        from noseapp.core import extensions
+
+        self.addCleanup(setattr, extensions, 'WAS_INSTALLATION', extensions.WAS_INSTALLATION)
+
+    def get_program_data(self, argv):
+        from noseapp.core import extensions
+        from testapp.app import create_app
+
+        # Extensions is installed by previous test program
+        extensions.WAS_INSTALLATION = False
+
+        app = create_app(exit=False, argv=argv)
+
+        return app._NoseApp__test_program.data
+
+
+class TestShardStrategy(CollectorTestCase):
+    """
+    Each test method is collected by one shard only
+    """
+
+    def get_tests(self, shard_index):
+        program_data = self.get_program_data(
+            ['--shard-index', str(shard_index), '--shard-count', '2'],
+        )
+
+        return [
+            str(test.test)
+            for suite in program_data.build_suite()
+            for case_suite in suite
+            for test in case_suite
+        ]
+
+    def runTest(self):
+        first, second = self.get_tests(0), self.get_tests(1)
+
+        self.assertTrue(first)
+        self.assertTrue(second)
+        self.assertFalse(set(first) & set(second))
+        self.assertLessEqual(abs(len(first) - len(second)), 1)
+
+        program_data = self.get_program_data(
+            ['--shard-index', '0', '--shard-count', '2', '-t', 'master.basic'],
+        )
+        self.assertRaises(ValueError, program_data.build_suite)
+
+
+class TestSelectStrategy(CollectorTestCase):
+    """
+    Several targets, glob patterns and regular expressions are collected
+    """
+
+    def get_suites(self, command):
+        program_data = self.get_program_data(['-t', command])
+
+        return dict(
+            (
+                suite.name,
+                sorted(test.test._testMethodName for case_suite in suite for test in case_suite),
+            )
+            for suite in program_data.build_suite()
+        )
+
+    def runTest(self):
+        from noseapp.core import collector
+        from noseapp.core.loader import LoaderError
+
+        self.assertEqual(collector.get_strategy('a,b'), collector.SELECT_COLLECT_STRATEGY)
+        self.assertEqual(collector.get_strategy('a.*:Case'), collector.SELECT_COLLECT_STRATEGY)
+        self.assertEqual(collector.get_strategy('re:Case'), collector.SELECT_COLLECT_STRATEGY)
+        self.assertEqual(collector.get_strategy('a:Case'), collector.CASE_COLLECT_STRATEGY)
+
+        suites = self.get_suites(
+            'master.skip:TestCaseClassToSkip.test_skip_if,master.bas*',
+        )
+        self.assertEqual(sorted(suites), ['master.basic', 'master.skip'])
+        self.assertEqual(suites['master.skip'], ['test_skip_if'])
+        self.assertTrue(suites['master.basic'])
+
+        suites = self.get_suites('re:skip_unless$')
+        self.assertEqual(suites, {'master.skip': ['test_skip_unless']})
+
+        self.assertRaises(LoaderError, self.get_suites, 'master.unknown,master.skip')
+        self.assertRaises(LoaderError, self.get_suites, 'master.skip:Unknown,master.basic')
+        self.assertRaises(LoaderError, self.get_suites, 'master.unknown*,master.basic')
+        self.assertRaises(LoaderError, self.get_suites, 're:^unknown$,master.basic')
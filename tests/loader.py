@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import shutil
+import tempfile
+from unittest import skipIf
+from unittest import TestCase
+
+from noseapp.utils import pyv
+
+
+SUITE_MODULE = """
+from noseapp import Suite
+
+suite = Suite('{name}')
+"""
+
+
+class TestDiscoveryCache(TestCase):
+    """
+    Modules without required suite are not imported
+    if suite names are saved to cache
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.tmp_dir, 'discovery.json')
+        self.suites_dir = os.path.join(self.tmp_dir, 'discovery_suites')
+
+        os.mkdir(self.suites_dir)
+
+        for name in ('discovery_first', 'discovery_second'):
+            with open(os.path.join(self.suites_dir, '{}.py'.format(name)), 'w') as fp:
+                fp.write(SUITE_MODULE.format(name=name))
+
+        sys.path.append(self.suites_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+        sys.path.remove(self.suites_dir)
+
+        for name in ('discovery_first', 'discovery_second'):
+            sys.modules.pop(name, None)
+
+    def runTest(self):
+        from noseapp.core import loader
+
+        cache = loader.DiscoveryCache(self.cache_path)
+        suites = loader.load_suites_from_dir(self.suites_dir, cache=cache)
+        cache.save()
+
+        self.assertEqual(sorted(s.name for s in suites), ['discovery_first', 'discovery_second'])
+
+        for name in ('discovery_first', 'discovery_second'):
+            sys.modules.pop(name, None)
+
+        cache = loader.DiscoveryCache(self.cache_path)
+        suites = loader.load_suites_from_dir(
+            self.suites_dir, cache=cache, suite_filter=lambda name: name == 'discovery_second',
+        )
+
+        self.assertEqual([s.name for s in suites], ['discovery_second'])
+        self.assertNotIn('discovery_first', sys.modules)
+
+
+class TestParallelImport(TestCase):
+    """
+    Modules are imported on thread pool and renamed in sys.modules
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.names = ['parallel_{}'.format(i) for i in range(5)]
+
+        for name in self.names:
+            with open(os.path.join(self.tmp_dir, '{}.py'.format(name)), 'w') as fp:
+                fp.write(SUITE_MODULE.format(name=name))
+
+        sys.path.append(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+        sys.path.remove(self.tmp_dir)
+
+    def runTest(self):
+        from noseapp.core import loader
+
+        suites = loader.load_suites_from_dir(self.tmp_dir, workers=3)
+
+        self.assertEqual([s.name for s in suites], self.names)
+
+        for name in self.names:
+            self.assertNotIn(name, sys.modules)
+
+
+@skipIf(pyv.IS_PYTHON_2, 'order of imports on threads depends on global import lock')
+class TestParallelImportOfImportedModule(TestCase):
+    """
+    Module which was imported by other module raises
+    LoaderError on thread pool as in sequential import
+    """
+
+    modules = {
+        'imported_a': 'import imported_c',
+        'imported_b': 'import time\ntime.sleep(0.5)',
+        'imported_c': '',
+    }
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        for name, source in self.modules.items():
+            with open(os.path.join(self.tmp_dir, '{}.py'.format(name)), 'w') as fp:
+                fp.write(source)
+
+        sys.path.append(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+        sys.path.remove(self.tmp_dir)
+
+        for name in self.modules:
+            sys.modules.pop(name, None)
+
+    def runTest(self):
+        from noseapp.core import loader
+
+        with self.assertRaises(loader.LoaderError):
+            loader.load_suites_from_dir(self.tmp_dir, workers=2)
+
+
+class TestLazyTests(TestCase):
+    """
+    Instances of test case are created at iteration only
+    """
+
+    def runTest(self):
+        from noseapp import Suite
+        from noseapp import TestCase as NoseAppTestCase
+        from noseapp.core import loader
+
+        created = []
+
+        class Case(NoseAppTestCase):
+
+            def __init__(self, *args, **kwargs):
+                super(Case, self).__init__(*args, **kwargs)
+                created.append(self)
+
+            def test_one(self):
+                pass
+
+            def test_two(self):
+                pass
+
+        Case.mount_to_suite(Suite('lazy'))
+        tests = loader.load_lazy_tests_from_test_case(Case)
+
+        self.assertEqual(len(tests), 2)
+        self.assertEqual(created, [])
+
+        self.assertEqual([t._testMethodName for t in tests], ['test_one', 'test_two'])
+        self.assertEqual([t._testMethodName for t in tests], ['test_one', 'test_two'])
+        self.assertEqual(len(created), 4)
+
+
+class TestAddressIndex(TestCase):
+    """
+    Suites and tests are found by address which does not depend on process
+    """
+
+    def runTest(self):
+        from noseapp import Suite
+        from noseapp import TestCase as NoseAppTestCase
+        from noseapp.core import loader
+        from noseapp.core.suite.base import BaseSuite
+        from noseapp.core.suite.base import AddressIndex
+        from noseapp.core.suite.base import get_address
+        from noseapp.core.suite.base import parse_address
+
+        class Case(NoseAppTestCase):
+
+            def test_one(self):
+                pass
+
+            def test_two(self):
+                pass
+
+        Case.mount_to_suite(Suite('address.suite'))
+
+        case_suite = BaseSuite(
+            loader.load_lazy_tests_from_test_case(Case),
+            name='address.suite:Case',
+        )
+        suite = BaseSuite([case_suite], name='address.suite')
+        index = AddressIndex([suite])
+
+        self.assertIs(index.find('address.suite'), suite)
+        self.assertIs(index.find('address.suite:Case'), case_suite)
+
+        test = index.find('address.suite:Case.test_two')
+
+        self.assertEqual(test.test._testMethodName, 'test_two')
+        self.assertEqual(get_address(test), 'address.suite:Case.test_two')
+        self.assertEqual(parse_address(get_address(test)), ('address.suite', 'Case', 'test_two'))
+        self.assertEqual(parse_address('address.suite'), ('address.suite', None, None))
+
+        self.assertNotIn('address.suite:Case.test_three', index)
+        self.assertNotIn('address.other', index)
+
+
+class TestNameIndex(TestCase):
+    """
+    Suites and test cases are found by name in index of context.
+    Duplicate names are detected at registration.
+    """
+
+    def runTest(self):
+        import warnings
+
+        from noseapp import Suite
+        from noseapp.core import loader
+        from noseapp.app.context import AppContext
+
+        context = AppContext()
+        first, second = Suite('index.first'), Suite('index.second')
+
+        @first.register
+        class Case(first.TestCase):
+
+            def test(self):
+                pass
+
+        context.add_suite(first)
+        context.add_suite(second)
+
+        self.assertIs(loader.load_suite_by_name('index.second', context), second)
+        self.assertIs(loader.load_case_from_suite('Case', first), Case)
+        self.assertRaises(loader.LoaderError, loader.load_suite_by_name, 'index.third', context)
+
+        # List of suites is supported as before index
+        self.assertIs(loader.load_suite_by_name('index.second', [first, second]), second)
+        self.assertRaises(loader.LoaderError, loader.load_suite_by_name, 'index.third', [first])
+        self.assertRaises(loader.LoaderError, loader.load_case_from_suite, 'Other', first)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            context.add_suite(Suite('index.first'))
+            first.register(type('Case', (first.TestCase, ), {'runTest': lambda self: None}))
+
+        self.assertEqual(len(caught), 2)
+        self.assertIs(context.get_suite('index.first'), first)
+        self.assertIs(first.context.get_test_case('Case'), Case)
+        self.assertEqual(len(context.suites), 3)
+
+
+class TestMethodTable(TestCase):
+    """
+    Method table is built once for test case class
+    and dropped when public attribute is added or deleted
+    """
+
+    def runTest(self):
+        from noseapp import Suite
+        from noseapp.core import loader
+
+        suite = Suite('method.table')
+
+        @suite.register
+        class Case(suite.TestCase):
+
+            def test_one(self):
+                pass
+
+        class SubCase(Case):
+            pass
+
+        table = loader.get_method_table(Case)
+
+        self.assertIs(loader.get_method_table(Case), table)
+        self.assertEqual(loader.load_test_names_from_test_case(Case), ['test_one'])
+
+        Case.test_one = lambda self: None
+        Case._private = None
+        self.assertIs(loader.get_method_table(Case), table)
+
+        loader.get_method_table(SubCase)
+        Case.test_two = lambda self: None
+
+        self.assertEqual(loader.load_test_names_from_test_case(Case), ['test_one', 'test_two'])
+        self.assertEqual(loader.load_test_names_from_test_case(SubCase), ['test_one', 'test_two'])
+
+        del Case.test_one
+
+        self.assertEqual(loader.load_test_names_from_test_case(SubCase), ['test_two'])
+        self.assertEqual(list(suite.get_map()['Case']['tests']), ['test_two'])
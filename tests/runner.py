@@ -0,0 +1,514 @@
+# -*- coding: utf-8 -*-
+
+import os
+from unittest import skipIf
+from unittest import TestCase
+
+from noseapp.utils import pyv
+
+
+class RunStrategyTestCase(TestCase):
+    """
+    Run test application with given run strategy
+    """
+
+    argv = []
+
+    def setUp(self):
+        from noseapp.core import extensions
+        from testapp.app import create_app
+
+        # Extensions is installed by previous test program
+        extensions.WAS_INSTALLATION = False
+
+        self.app = create_app(exit=False, argv=list(self.argv))
+
+
+class TestMultiprocessingPoolStrategy(RunStrategyTestCase):
+
+    argv = ['--run-strategy', 'multiprocessing-pool', '--async-suites', '2']
+
+    def runTest(self):
+        self.assertTrue(self.app.run())
+
+
+class TestMultiprocessingStrategy(RunStrategyTestCase):
+
+    argv = ['--run-strategy', 'multiprocessing', '--async-suites', '1']
+
+    def runTest(self):
+        self.assertTrue(self.app.run())
+
+
+class TestWarmTemplate(RunStrategyTestCase):
+
+    argv = ['--run-strategy', 'multiprocessing', '--async-suites', '2', '--warm-template']
+
+    def runTest(self):
+        self.assertTrue(self.app.run())
+
+
+class TestWarmTemplatePool(RunStrategyTestCase):
+
+    argv = [
+        '--run-strategy', 'multiprocessing-pool', '--async-suites', '2',
+        '--split-suites', '--warm-template',
+    ]
+
+    def runTest(self):
+        self.assertTrue(self.app.run())
+
+
+class TestResultRecord(TestCase):
+
+    def runTest(self):
+        from noseapp.core.runner.performers import multiprocessing as mp
+
+        record = mp.pack_record(
+            mp.FAILURE, (2 ** 40, 3), 'exceptions:AssertionError', 'message', 'traceback',
+        )
+
+        self.assertEqual(
+            mp.unpack_record(record),
+            (mp.FAILURE, (2 ** 40, 3), 'exceptions:AssertionError', 'message', 'traceback'),
+        )
+
+
+class TestMultiprocessingPoolSplitSuites(RunStrategyTestCase):
+
+    argv = ['--run-strategy', 'multiprocessing-pool', '--async-suites', '3', '--split-suites']
+
+    def runTest(self):
+        self.assertTrue(self.app.run())
+
+
+class TestReleaseTests(TestCase):
+    """
+    Finished tests are replaced with records in result
+    """
+
+    def runTest(self):
+        import unittest
+
+        from nose.config import Config
+        from noseapp.core.runner.base import TestRecord
+        from noseapp.core.runner.base import TextTestResult
+
+        class Case(unittest.TestCase):
+
+            def test_fail(self):
+                self.fail('message')
+
+        stream = unittest.runner._WritelnDecorator(open(os.devnull, 'w'))
+        result = TextTestResult(stream, True, 1, Config(), release_tests=True)
+        test = Case('test_fail')
+
+        test(result)
+
+        self.assertEqual(len(result.failures), 1)
+        self.assertIsInstance(result.failures[0][0], TestRecord)
+        self.assertEqual(str(result.failures[0][0]), str(test))
+        self.assertIn('message', result.failures[0][1])
+
+
+class TestBoundedExecutor(TestCase):
+    """
+    Nested tasks are done on one thread with small queue
+    """
+
+    def runTest(self):
+        from noseapp.core.executor import BoundedExecutor
+
+        executor = BoundedExecutor(1, queue_size=1)
+        done = []
+
+        def suite(name):
+            tasks = [executor.submit(done.append, (name, i)) for i in range(3)]
+            executor.wait(tasks)
+
+        try:
+            tasks = [executor.submit(suite, name) for name in ('one', 'two')]
+            executor.wait(tasks)
+        finally:
+            executor.shutdown()
+
+        self.assertEqual(len(done), 6)
+
+
+class TestExecutorWaitsForOwnTasks(TestCase):
+    """
+    Thread which waits for its tasks does not run tasks of other suites
+    """
+
+    def runTest(self):
+        import threading
+
+        from noseapp.core.executor import BoundedExecutor
+
+        executor = BoundedExecutor(1, queue_size=4)
+        other_submitted = threading.Event()
+        calls = []
+
+        def suite():
+            other_submitted.wait()
+            executor.wait([executor.submit(calls.append, 'test')])
+            calls.append('teardown')
+
+        try:
+            tasks = [executor.submit(suite)]
+            tasks.append(executor.submit(calls.append, 'other suite'))
+            other_submitted.set()
+
+            executor.wait(tasks)
+        finally:
+            executor.shutdown()
+
+        self.assertEqual(calls, ['test', 'teardown', 'other suite'])
+
+
+class TestThreadingStrategy(RunStrategyTestCase):
+
+    argv = ['--run-strategy', 'threading', '--async-suites', '2', '--async-tests', '2']
+
+    def runTest(self):
+        self.assertTrue(self.app.run())
+
+
+@skipIf(pyv.IS_PYTHON_2, 'asyncio is not supported with python 2')
+class TestAsyncioStrategy(RunStrategyTestCase):
+
+    argv = ['--run-strategy', 'asyncio', '--async-suites', '2', '--async-tests', '2']
+
+    def runTest(self):
+        self.assertTrue(self.app.run())
+
+
+@skipIf(pyv.IS_PYTHON_2, 'asyncio is not supported with python 2')
+class TestAsyncSteps(TestCase):
+    """
+    Async steps of screen play case are awaited
+    """
+
+    def runTest(self):
+        import asyncio
+
+        from noseapp import Suite
+        from noseapp.case.screenplay import step
+        from noseapp.case.screenplay import ScreenPlayCase
+
+        calls = []
+
+        class Case(ScreenPlayCase):
+
+            @step(1, 'async step')
+            @pyv.mark_async
+            def step_1(self):
+                calls.append(1)
+                return asyncio.sleep(0)
+
+            @step(2, 'sync step')
+            def step_2(self):
+                calls.append(2)
+
+        Case.mount_to_suite(Suite('async_steps'))
+
+        self.assertTrue(pyv.is_async(Case.runTest))
+
+        # Steps are run on new event loop if loop is not running
+        Case('runTest').runTest()
+
+        self.assertEqual(calls, [1, 2])
+
+
+@skipIf(pyv.IS_PYTHON_2, 'asyncio is not supported with python 2')
+class TestAsyncTests(TestCase):
+    """
+    Coroutine test methods are awaited concurrently,
+    number of running tests of suite is limited by --async-tests
+    """
+
+    def setUp(self):
+        from noseapp.core import extensions
+
+        self.addCleanup(setattr, extensions, 'WAS_INSTALLATION', extensions.WAS_INSTALLATION)
+
+        # Extensions is installed by previous test program
+        extensions.WAS_INSTALLATION = False
+
+    def runTest(self):
+        import unittest
+        import warnings
+
+        from noseapp import Suite
+        from noseapp import NoseApp
+        from noseapp import TestCase as NoseAppTestCase
+
+        # Suite name -> [number of running tests, max number of running tests]
+        running = {}
+        total = [0, 0]
+
+        def run_async(suite_name, exc=None):
+            counters = running.setdefault(suite_name, [0, 0])
+
+            def steps():
+                for counter in (counters, total):
+                    counter[0] += 1
+                    counter[1] = max(counter[1], counter[0])
+
+                try:
+                    # Other tests are started while test is waiting
+                    for _ in range(5):
+                        yield
+                finally:
+                    for counter in (counters, total):
+                        counter[0] -= 1
+
+                if exc is not None:
+                    raise exc
+
+            return pyv.AwaitableGenerator(steps())
+
+        outcomes, concurrent = Suite('outcomes'), Suite('concurrent')
+
+        @outcomes.register
+        class Outcomes(NoseAppTestCase):
+
+            @pyv.mark_async
+            def test_pass(self):
+                return run_async('outcomes')
+
+            @pyv.mark_async
+            def test_failure(self):
+                return run_async('outcomes', AssertionError('failure'))
+
+            @pyv.mark_async
+            def test_error(self):
+                return run_async('outcomes', ValueError('error'))
+
+            @pyv.mark_async
+            def test_skip(self):
+                return run_async('outcomes', unittest.SkipTest('skip'))
+
+            @unittest.expectedFailure
+            @pyv.mark_async
+            def test_expected_failure(self):
+                return run_async('outcomes', AssertionError('expected failure'))
+
+            @unittest.expectedFailure
+            @pyv.mark_async
+            def test_unexpected_success(self):
+                return run_async('outcomes')
+
+        @concurrent.register
+        class Concurrent(NoseAppTestCase):
+
+            @pyv.mark_async
+            def test_one(self):
+                return run_async('concurrent')
+
+            @pyv.mark_async
+            def test_two(self):
+                return run_async('concurrent')
+
+            @pyv.mark_async
+            def test_three(self):
+                return run_async('concurrent')
+
+        app = NoseApp(
+            'async_tests', exit=False, argv=['--run-strategy', 'asyncio', '--async-tests', '2'],
+        )
+        app.register_suites([outcomes, concurrent])
+
+        program_data = app._NoseApp__test_program.data
+        runner = program_data.runner_class(
+            stream=open(os.devnull, 'w'), verbosity=1, config=program_data.config,
+        )
+        result = runner._makeResult()
+
+        with warnings.catch_warnings():
+            # Result proxy of nose has not methods for expected failures
+            warnings.simplefilter('ignore', RuntimeWarning)
+
+            runner._makePerformer()(list(program_data.build_suite()), result)
+
+        self.assertEqual(result.testsRun, 9)
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(len(result.skipped), 1)
+        self.assertIn('test_error', str(result.errors[0][0]))
+
+        # Expected failure is success, unexpected success is failure as for sync tests
+        self.assertEqual(
+            sorted(str(test).split()[0] for test, _ in result.failures),
+            ['test_failure', 'test_unexpected_success'],
+        )
+
+        # Limit is applied to each suite, suites are run concurrently
+        self.assertEqual(running['outcomes'][1], 2)
+        self.assertEqual(running['concurrent'][1], 2)
+        self.assertEqual(total[1], 4)
+
+
+class TestHybridStrategy(RunStrategyTestCase):
+
+    argv = [
+        '--run-strategy', 'hybrid', '--async-suites', '2',
+        '--worker-concurrency', '3', '--split-suites',
+    ]
+
+    def runTest(self):
+        self.assertTrue(self.app.run())
+
+
+class TestDistributedStrategy(RunStrategyTestCase):
+
+    argv = [
+        '--run-strategy', 'distributed', '--local-workers', '2', '--split-suites',
+    ]
+
+    def runTest(self):
+        self.assertTrue(self.app.run())
+
+
+class TestParseEndpoint(TestCase):
+    """
+    Address of coordinator can be IPv4, IPv6 in brackets or unix socket
+    """
+
+    def runTest(self):
+        import socket
+
+        from noseapp.core.runner.performers.distributed import parse_endpoint
+        from noseapp.core.runner.performers.distributed import format_endpoint
+
+        self.assertEqual(parse_endpoint('unix:/tmp/coordinator'), (socket.AF_UNIX, '/tmp/coordinator'))
+        self.assertEqual(parse_endpoint('127.0.0.1:7000'), (socket.AF_INET, ('127.0.0.1', 7000)))
+        self.assertEqual(parse_endpoint(':7000'), (socket.AF_INET, ('127.0.0.1', 7000)))
+
+        if socket.has_ipv6:
+            family, address = parse_endpoint('[::1]:7000')
+
+            self.assertEqual(family, socket.AF_INET6)
+            self.assertEqual(address[:2], ('::1', 7000))
+            self.assertEqual(format_endpoint(family, address), '[::1]:7000')
+
+        self.assertRaises(ValueError, parse_endpoint, '::1:7000')
+        self.assertRaises(ValueError, parse_endpoint, '127.0.0.1:port')
+
+
+class TestRequeueWorkItem(TestCase):
+    """
+    Item of lost worker is given to another worker
+    """
+
+    def runTest(self):
+        from collections import deque
+        from noseapp.core.runner.performers.multiprocessing import WorkScheduler
+
+        scheduler = WorkScheduler([])
+        scheduler.pending['suite'] = deque(['suite:First', 'suite:Second'])
+
+        item, _ = scheduler.next_item('lost')
+        self.assertEqual(item, ('suite', 'suite:First'))
+
+        scheduler.requeue('lost', item)
+
+        self.assertEqual(scheduler.next_item('other')[0], ('suite', 'suite:First'))
+        self.assertEqual(scheduler.next_item('other')[0], ('suite', 'suite:Second'))
+        self.assertIsNone(scheduler.next_item('other'))
+
+
+class TestRemoteRecordDuration(TestCase):
+    """
+    Stop record of remote worker has duration of test
+    """
+
+    def runTest(self):
+        import time
+
+        from noseapp.core.runner.performers import distributed
+        from noseapp.core.runner.performers import multiprocessing as mp
+
+        sent = []
+
+        class Connection(object):
+
+            def send_bytes(self, data):
+                sent.append(distributed.unpack_remote_record(data))
+
+        class Case(TestCase):
+
+            # Name of suite for address of test
+            of_suite = 'remote'
+
+            def runTest(self):
+                pass
+
+        channel = distributed.RemoteResultChannel(None, Connection())
+        test = Case()
+
+        channel.startTest(test)
+        time.sleep(0.05)
+        channel.stopTest(test)
+
+        self.assertEqual([r[0] for r in sent], [mp.START_TEST, mp.STOP_TEST])
+        self.assertIsNone(sent[0][5])
+        self.assertGreaterEqual(sent[1][5], 0.05)
+
+
+class TestLostWorker(TestCase):
+    """
+    Test of lost worker is reported as error,
+    suites which were not started are run by new worker
+    """
+
+    def setUp(self):
+        from noseapp.core import extensions
+
+        self.addCleanup(setattr, extensions, 'WAS_INSTALLATION', extensions.WAS_INSTALLATION)
+
+        # Extensions is installed by previous test program
+        extensions.WAS_INSTALLATION = False
+
+    def runTest(self):
+        import unittest
+
+        from nose.config import Config
+        from noseapp import Suite
+        from noseapp import NoseApp
+        from noseapp import TestCase as NoseAppTestCase
+        from noseapp.core.runner.base import TextTestResult
+        from noseapp.core.runner.performers import multiprocessing as mp
+
+        crash, ok = Suite('a_crash'), Suite('b_ok')
+
+        @crash.register
+        class Crash(NoseAppTestCase):
+
+            def test(self):
+                os._exit(3)
+
+        @ok.register
+        class Ok(NoseAppTestCase):
+
+            def test(self):
+                pass
+
+        app = NoseApp('lost_worker', exit=False, argv=[])
+        app.register_suites([crash, ok])
+
+        stream = unittest.runner._WritelnDecorator(open(os.devnull, 'w'))
+        result = TextTestResult(stream, True, 1, Config())
+
+        pool = mp.WorkerPool(result, processes=1, release_timeout=60)
+        pool.add_suites(app._NoseApp__test_program.data.build_suite())
+
+        with mp.terminate_processes(pool):
+            pool.run()
+
+        self.assertEqual(result.testsRun, 2)
+        self.assertEqual(len(result.failures), 0)
+        self.assertEqual(len(result.errors), 2)
+
+        self.assertIn('a_crash:Crash', str(result.errors[0][0]))
+        self.assertIn('exited with code 3 while test was running', result.errors[0][1])
+        self.assertIn('before "lost_worker.a_crash" was completed', result.errors[1][1])
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+
+class TestTimingDatabase(TestCase):
+    """
+    Durations are saved to file and suites are sorted longest first
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'durations.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def runTest(self):
+        from noseapp.core.timing import TimingDatabase
+
+        timing = TimingDatabase(self.path)
+        timing.add_case('fast', 0.1)
+        timing.add_case('slow', 2.0)
+        timing.save()
+
+        timing = TimingDatabase(self.path)
+
+        self.assertEqual(timing.cases, {'fast': 0.1, 'slow': 2.0})
+        self.assertEqual(
+            timing.longest_first(['fast', 'unknown', 'slow']),
+            ['slow', 'unknown', 'fast'],
+        )
+
+
+class TestSuiteTotals(TestCase):
+    """
+    Duration of suite is sum of stored durations of its test cases,
+    run of part of suite does not shrink it
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'durations.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def runTest(self):
+        from noseapp.core.timing import TimingDatabase
+        from noseapp.core.timing import make_case_name
+        from noseapp.core.timing import parse_case_name
+
+        first = make_case_name('app.suite', 'Case', 'test_one')
+        second = make_case_name('app.suite', 'Case', 'test_two')
+
+        self.assertEqual(parse_case_name(first), ('app.suite', 'Case'))
+        self.assertIsNone(parse_case_name('fast'))
+
+        timing = TimingDatabase(self.path)
+        timing.add_case(first, 1.0)
+        timing.add_case(second, 2.0)
+        timing.save()
+
+        # Only one test of suite is run
+        timing = TimingDatabase(self.path)
+        timing.add_case(first, 1.5)
+        timing.save()
+
+        timing = TimingDatabase(self.path)
+
+        self.assertEqual(timing.suites, {'app.suite': 3.5, 'app.suite:Case': 3.5})
+
+
+class TestReadOnlyTiming(TestCase):
+    """
+    Durations are loaded but not saved by read only database
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'durations.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def runTest(self):
+        from noseapp.core.timing import TimingDatabase
+
+        timing = TimingDatabase(self.path)
+        timing.add_case('fast', 0.1)
+        timing.save()
+
+        timing = TimingDatabase(self.path, read_only=True)
+        timing.add_case('fast', 5.0)
+        timing.save()
+
+        self.assertEqual(TimingDatabase(self.path).cases, {'fast': 0.1})